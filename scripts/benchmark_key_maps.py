@@ -0,0 +1,120 @@
+# Imports from third party packages.
+from argparse import ArgumentParser
+from tabulate import tabulate
+from timeit import repeat
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable, List
+import gc
+import logging
+
+# Imports from the local package.
+from symboard.actions import Action
+from symboard.keylayouts.iso_dvorak_keylayout import IsoDvorakKeylayout
+from symboard.keylayouts.iso_jdvorak_keylayout import IsoJDvorakKeylayout
+from symboard.keylayouts.iso_keylayout import IsoKeylayout
+from symboard.keylayouts.key_maps import ArrayKeyMap
+
+
+def get_arg_parser() -> ArgumentParser:
+    """
+    Returns:
+        ArgumentParser: An ArgumentParser instance which will parse the
+            arguments provided to the script when executed from the command
+            line.
+    """
+    parser = ArgumentParser(
+        description='Compare the memory used by, and the time taken to ' \
+        'iterate over, the key map of each keylayout when it is held as ' \
+        'nested dicts and as an ArrayKeyMap.'
+    )
+
+    parser.add_argument(
+        '--number', type=int, default=1000,
+        help='the number of times to iterate over each key map per timing',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='the number of times to time each key map (the best is shown)',
+    )
+
+    return parser
+
+
+def as_dicts(key_map) -> dict:
+    """
+    Returns:
+        dict: A copy of <key_map> as nested dicts, as keylayouts define them.
+    """
+    return {index: dict(outputs) for index, outputs in key_map.items()}
+
+
+def held_memory(build: Callable[[], object]) -> int:
+    """
+    Returns:
+        int: The number of bytes held by the object returned by <build>,
+            excluding the outputs it shares with the keylayout.
+    """
+    gc.collect()
+    start()
+    built = build()
+    current, _ = get_traced_memory()
+    stop()
+    del built
+    return current
+
+
+def iterate(key_map) -> None:
+    """ Walks every output of <key_map>, and builds its set of actions, as the
+    writer and keylayouts do.
+    """
+    for outputs in key_map.values():
+        for code, output in outputs.items():
+            pass
+    [
+        output
+        for outputs in key_map.values()
+        for output in outputs.values()
+        if isinstance(output, Action)
+    ]
+
+
+def main() -> None:
+    """ The main method (entry point) for the script. This function parses the
+    input arguments, and manages the core code logic using these arguments.
+    """
+    logging.info(f'Parsing command line arguments.')
+
+    arg_parser: ArgumentParser = get_arg_parser()
+    args = arg_parser.parse_args()
+
+    headers: List[str] = [
+        'Keylayout', 'Layout', 'Held (bytes)', 'Iteration (µs)',
+    ]
+    data: List[list] = []
+
+    for keylayout_class in [
+        IsoKeylayout, IsoDvorakKeylayout, IsoJDvorakKeylayout
+    ]:
+        dicts = as_dicts(keylayout_class.key_map)
+
+        for name, build in [
+            ('dict', lambda: as_dicts(dicts)),
+            ('array', lambda: ArrayKeyMap(dicts)),
+        ]:
+            key_map = build()
+            seconds = min(repeat(
+                lambda: iterate(key_map), number=args.number,
+                repeat=args.repeat,
+            ))
+            data.append([
+                keylayout_class.__name__,
+                name,
+                held_memory(build),
+                f'{seconds / args.number * 1e6:.1f}',
+            ])
+
+    print(tabulate(data, headers=headers, tablefmt='orgtbl'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+# Imports from third party packages.
+from argparse import ArgumentParser
+from tabulate import tabulate
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable, Dict, List
+import gc
+import logging
+
+# Imports from the local package.
+from symboard.actions import State
+from symboard.state_index import state_file_paths
+from symboard.states import iter_states
+from settings import STATES_DIR
+
+
+def get_arg_parser() -> ArgumentParser:
+    """
+    Returns:
+        ArgumentParser: An ArgumentParser instance which will parse the
+            arguments provided to the script when executed from the command
+            line.
+    """
+    parser = ArgumentParser(
+        description='Measure the memory used by the states of many tenants, ' \
+        'each of which holds its own copy of the states directory, as ' \
+        'states are held now and as they were held before they used ' \
+        '__slots__ and interned their bindings.'
+    )
+
+    parser.add_argument(
+        '--tenants', type=int, default=100,
+        help='the number of copies of the states directory to hold',
+    )
+
+    return parser
+
+
+def _copy(string: str) -> str:
+    # A new string object with the same value, as parsing a file gives.
+    return string.encode('utf-8').decode('utf-8') if string else string
+
+
+class BaselineState:
+    """ A state as it was held before states used __slots__ and interned
+    their bindings: an object with a __dict__, holding its own copy of every
+    string it was parsed with.
+    """
+    def __init__(self, state: State) -> None:
+        self.name = _copy(state.name)
+        self.terminator = _copy(state.terminator)
+        self.action_to_output_map = {
+            _copy(action): _copy(output)
+            for action, output in state.action_to_output_map.items()
+        }
+        self.action_to_next_map = {
+            _copy(action): _copy(next_state)
+            for action, next_state in state.action_to_next_map.items()
+        }
+
+
+def load_tenants(
+    n_tenants: int, hold: Callable[[State], object] = None
+) -> List[Dict[str, object]]:
+    """
+    Args:
+        n_tenants (int): The number of copies of the states directory to load.
+        hold (Callable[[State], object], optional): A function which converts
+            each built state into the representation to hold. States are held
+            as they are built if not given.
+
+    Returns:
+        List[Dict[str, object]]: <n_tenants> separately built copies of every
+            state in the states directory.
+    """
+    file_paths = state_file_paths(STATES_DIR)
+
+    return [
+        {
+            state.name: state if hold is None else hold(state)
+            for file_path in file_paths
+            for state in iter_states(file_path)
+        }
+        for _ in range(n_tenants)
+    ]
+
+
+def measure(n_tenants: int, hold: Callable[[State], object] = None) -> list:
+    """
+    Returns:
+        list: The number of states and bindings held by <n_tenants> tenants,
+            and the memory they hold and peaked at, in bytes.
+    """
+    # Load once before measuring, so that imports and caches are not counted.
+    load_tenants(1, hold)
+    gc.collect()
+
+    start()
+    tenants = load_tenants(n_tenants, hold)
+    gc.collect()
+    current, peak = get_traced_memory()
+    stop()
+
+    n_states = sum(len(states) for states in tenants)
+    n_bindings = sum(
+        len(state.action_to_output_map)
+        for states in tenants
+        for state in states.values()
+    )
+
+    return [n_states, n_bindings, current, peak]
+
+
+def main() -> None:
+    """ The main method (entry point) for the script. This function parses the
+    input arguments, and manages the core code logic using these arguments.
+    """
+    logging.info(f'Parsing command line arguments.')
+
+    arg_parser: ArgumentParser = get_arg_parser()
+    args = arg_parser.parse_args()
+
+    headers: List[str] = [
+        'Representation', 'Tenants', 'States', 'Bindings', 'Held (KiB)',
+        'Peak (KiB)', 'Bytes per binding', 'Held vs baseline',
+    ]
+    data: List[list] = []
+    baseline_held = None
+
+    for name, hold in [('baseline', BaselineState), ('current', None)]:
+        n_states, n_bindings, held, peak = measure(args.tenants, hold)
+        if baseline_held is None:
+            baseline_held = held
+
+        data.append([
+            name,
+            args.tenants,
+            n_states,
+            n_bindings,
+            held // 1024,
+            peak // 1024,
+            f'{held / max(n_bindings, 1):.1f}',
+            f'{(held - baseline_held) / baseline_held:+.1%}',
+        ])
+
+    print(tabulate(data, headers=headers, tablefmt='orgtbl'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+# Imports from third party packages.
+from argparse import ArgumentParser
+from json import dump as json_dump
+from os.path import join
+from tabulate import tabulate
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from typing import Callable, Dict, List
+from yaml import SafeLoader as PureSafeLoader, load as yaml_load, safe_dump
+import logging
+
+# Imports from the local package.
+from symboard.parsers import (
+    JsonFileParser,
+    MsgpackFileParser,
+    SafeLoader,
+    YamlFileParser,
+    msgpack,
+)
+from symboard.state_index import state_file_paths
+from settings import STATES_DIR
+
+
+def get_arg_parser() -> ArgumentParser:
+    """
+    Returns:
+        ArgumentParser: An ArgumentParser instance which will parse the
+            arguments provided to the script when executed from the command
+            line.
+    """
+    parser = ArgumentParser(
+        description='Compare the time taken by each parser backend to parse ' \
+        'the states directory, and a synthetic library of states.'
+    )
+
+    parser.add_argument(
+        '--states', type=int, default=5000,
+        help='the number of states in the synthetic library',
+    )
+    parser.add_argument(
+        '--states-per-file', type=int, default=100,
+        help='the number of states in each file of the synthetic library',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='the number of times to time each backend (the best is shown)',
+    )
+
+    return parser
+
+
+def _pure_yaml_parse(file_path: str) -> dict:
+    with open(file_path, 'r') as stream:
+        return yaml_load(stream, Loader=PureSafeLoader)
+
+
+def _write_yaml(contents: dict, file_path: str) -> None:
+    with open(file_path, 'w') as file_:
+        safe_dump(contents, file_, allow_unicode=True)
+
+
+def _write_json(contents: dict, file_path: str) -> None:
+    with open(file_path, 'w') as file_:
+        json_dump(contents, file_, ensure_ascii=False)
+
+
+def _write_msgpack(contents: dict, file_path: str) -> None:
+    with open(file_path, 'wb') as file_:
+        msgpack.pack(contents, file_, use_bin_type=True)
+
+
+def get_backends() -> List[tuple]:
+    """
+    Returns:
+        List[tuple]: The name, file extension, writer and parse function of
+            every parser backend available in this environment. The first
+            backend is the baseline which the others are compared to.
+    """
+    backends = [
+        ('yaml (pure python)', '.yaml', _write_yaml, _pure_yaml_parse),
+    ]
+
+    if SafeLoader is not PureSafeLoader:
+        backends.append(
+            ('yaml (libyaml)', '.yaml', _write_yaml, YamlFileParser.parse)
+        )
+    else:
+        logging.warning('libyaml is not installed; skipping its benchmark.')
+
+    backends.append(('json', '.json', _write_json, JsonFileParser.parse))
+
+    if msgpack is not None:
+        backends.append(
+            ('msgpack', '.msgpack', _write_msgpack, MsgpackFileParser.parse)
+        )
+    else:
+        logging.warning('msgpack is not installed; skipping its benchmark.')
+
+    return backends
+
+
+def shipped_library() -> List[dict]:
+    """
+    Returns:
+        List[dict]: The contents of every file in the states directory.
+    """
+    return [
+        YamlFileParser.parse(file_path)
+        for file_path in state_file_paths(STATES_DIR)
+    ]
+
+
+def synthetic_library(n_states: int, states_per_file: int) -> List[dict]:
+    """
+    Returns:
+        List[dict]: The contents of files describing <n_states> states, each
+            with a lower and upper case alphabet and a small map.
+    """
+    lower = ','.join(chr(ord('a') + i) + '́' for i in range(26))
+    upper = lower.upper()
+
+    states = {
+        f'synthetic_{i}': {
+            'terminator': '´',
+            'lower': lower,
+            'upper': upper,
+            'map': {'left': '←', 'right': '→', "'": 'ʼ'},
+        }
+        for i in range(n_states)
+    }
+    names = list(states)
+
+    return [
+        {name: states[name] for name in names[i:i + states_per_file]}
+        for i in range(0, n_states, states_per_file)
+    ]
+
+
+def time_backend(
+    library: List[dict],
+    directory: str,
+    extension: str,
+    write: Callable[[dict, str], None],
+    parse: Callable[[str], dict],
+    n_repeats: int,
+) -> float:
+    """
+    Returns:
+        float: The shortest time, in seconds, taken by <parse> to parse every
+            file of <library> after it has been written with <write>.
+    """
+    file_paths = []
+    for i, contents in enumerate(library):
+        file_path = join(directory, f'{i}{extension}')
+        write(contents, file_path)
+        file_paths.append(file_path)
+
+    def parse_all():
+        for file_path in file_paths:
+            parse(file_path)
+
+    return min(repeat(parse_all, number=1, repeat=n_repeats))
+
+
+def main() -> None:
+    """ The main method (entry point) for the script. This function parses the
+    input arguments, and manages the core code logic using these arguments.
+    """
+    logging.info(f'Parsing command line arguments.')
+
+    arg_parser: ArgumentParser = get_arg_parser()
+    args = arg_parser.parse_args()
+
+    libraries: Dict[str, List[dict]] = {
+        'shipped states': shipped_library(),
+        f'synthetic ({args.states} states)': synthetic_library(
+            args.states, args.states_per_file
+        ),
+    }
+
+    backends: List[tuple] = get_backends()
+
+    headers: List[str] = ['Library', 'Backend', 'Seconds', 'Speedup']
+    data: List[list] = []
+
+    for library_name, library in libraries.items():
+        baseline = None
+
+        for name, extension, write, parse in backends:
+            logging.info(f'Timing backend {name} on {library_name}.')
+
+            with TemporaryDirectory() as directory:
+                seconds = time_backend(
+                    library, directory, extension, write, parse, args.repeat
+                )
+
+            baseline = baseline if baseline is not None else seconds
+            data.append([
+                library_name,
+                name,
+                f'{seconds:.4f}',
+                f'{baseline / seconds:.1f}x',
+            ])
+
+    print(tabulate(data, headers=headers, tablefmt='orgtbl'))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,8 @@ from typing import List
 import logging
 
 # Imports from the local package.
-from symboard.states import load_yaml
+from symboard.states import load_states_parallel
+from symboard.symbol_index import SymbolIndex
 
 
 def get_arg_parser() -> ArgumentParser:
@@ -19,9 +20,28 @@ def get_arg_parser() -> ArgumentParser:
         'states directory, and some info about each of these states.'
     )
 
+    parser.add_argument(
+        '--search', metavar='OUTPUT',
+        help='only show the states and keys which produce OUTPUT, such as ǘ',
+    )
+
     return parser
 
 
+def show_search(output: str) -> None:
+    """ Prints every state, and the action within it, which produces <output>.
+    """
+    logging.info(f'Searching the symbol index for «{output}».')
+
+    headers: List[str] = ['Name', 'Terminator', 'Action']
+    data: List[list] = [
+        [entry.state, entry.terminator, entry.action]
+        for entry in SymbolIndex().search(output)
+    ]
+
+    print(tabulate(data, headers=headers, tablefmt='orgtbl'))
+
+
 def format_outputs(state):
     """
     Returns:
@@ -40,9 +60,13 @@ def main() -> None:
     arg_parser: ArgumentParser = get_arg_parser()
     args = arg_parser.parse_args()
 
+    if args.search is not None:
+        show_search(args.search)
+        return
+
     logging.info(f'Collecting states from states directory.')
 
-    states: dict = load_yaml()
+    states: dict = load_states_parallel()
 
     headers: List[str] = ['Name', 'Terminator', 'Outputs']
     data: List[list] = [
@@ -7,6 +7,9 @@
 
 """
 # Imports from the standard library
+from hashlib import sha256
+from os import environ
+from os.path import abspath, expanduser, join
 from typing import List, Dict
 
 
@@ -33,6 +36,20 @@ OVERWRITE_OUTPUT: bool = False
 when trying to do this.
 """
 
+MINIMIZE_KEY_MAP_SELECT: bool = False
+""" Iff set to true, the modifier expressions of each keyMapSelect are
+rewritten as few expressions as possible when a keylayout is compiled, such
+that every combination of modifier keys selects the same key map index. This
+makes the modifier map of the written keylayout smaller, but it no longer lists
+the expressions exactly as the keylayout defines them. Keylayouts which are
+written without being compiled are never minimized.
+"""
+
+PARSE_CACHE_MAX_ENTRIES: int = 256
+""" The default number of parsed files kept by a parse cache, once enabled with
+«symboard.parsers.enable_parse_cache».
+"""
+
 # States settings {
 
 STATES_DIR = 'symboard/states'
@@ -40,6 +57,32 @@ STATES_DIR = 'symboard/states'
 states can be pre-defined by the Symboard project, or added by users.
 """
 
+CACHE_DIR: str = join(
+    environ.get('XDG_CACHE_HOME') or join(expanduser('~'), '.cache'),
+    PACKAGE_NAME,
+    sha256(abspath(STATES_DIR).encode('utf-8')).hexdigest()[:16],
+)
+""" The directory in which Symboard keeps files that can be rebuilt from the
+states directory at any time, such as the state index. It is inside the user's
+cache directory (<XDG_CACHE_HOME>, or «~/.cache»), as cached states are
+pickled, and has one subdirectory for each states directory. It is safe to
+delete this directory.
+"""
+
+STATE_INDEX_PATH: str = join(CACHE_DIR, 'state_index.json')
+""" The path at which the index of state names to state files is persisted.
+"""
+
+STATE_CACHE_DIR: str = join(CACHE_DIR, 'states')
+""" The directory in which states built from each state file are cached, so
+that unchanged state files do not need to be parsed again.
+"""
+
+SYMBOL_INDEX_PATH: str = join(CACHE_DIR, 'symbol_index.json')
+""" The path at which the index of outputs to the states which produce them is
+persisted, next to the state cache.
+"""
+
 OUTPUT_DELIMITER: str = ','
 """ The delimiter used by state files between key outputs. So, «abc» would
 become the output of a single key, while «a,bc» would be the output of 2. Used
@@ -51,6 +94,11 @@ DEFAULT_STATE_TERMINATOR: str = ' '
 terminator will be set to this value.
 """
 
+STATE_LOADER_PROCESSES: int = None
+""" The number of worker processes used to load the states directory in
+parallel. If set to None, one process is used per CPU.
+"""
+
 STATE_ATTRIBUTE_PRECEDENCE: List[str] = [
     'lower',
     'upper',
@@ -64,24 +112,26 @@ precedence, and will override the settings of attributes earlier in the list.
 ACTION_TO_UNICODE_MAP: Dict[str, str] = {
     # Arrows {
 
-    'left': '&#x001C;',
-    'right': '&#x001D;',
-    'up': '&#x001E;',
-    'down': '&#x001F;',
+    'left': '\u001C',
+    'right': '\u001D',
+    'up': '\u001E',
+    'down': '\u001F',
 
     # } Arrows
 
     # Punctuation {
 
-    '\'': '&#x0027;',
-    '\"': '&#x0022;',
+    '\'': '\u0027',
+    '\"': '\u0022',
 
     # { Punctuation
 }
 """ A map between the textual representation of a key (used in yaml files
-describing states) to the unicode representation required by keylayout files.
-Only characters which need to be represented using numerical unicode
-representations are included in this map (EG «\'», but not «a»).
+describing states) to the character it produces. Only keys whose textual
+representation differs from their character, or whose character is written to
+keylayout files as a numerical unicode reference, are included in this map (EG
+«\'», but not «a»). Characters are held as they are, and only escaped when a
+keylayout file is written.
 """
 
 
@@ -10,17 +10,78 @@
 # Imports from third party packages.
 from dataclasses import dataclass
 import logging
-from typing import List, Callable, Dict
+from sys import intern
+from functools import partial
+from weakref import WeakValueDictionary
+from typing import (
+    Any, List, Callable, ClassVar, Dict, Iterable, Iterator, Mapping, Tuple
+)
 
 # Imports from the local package.
-from symboard.errors import AlphabetLengthException
+from symboard.errors import AlphabetLengthException, ScriptNotFoundException
 from settings import (
     OUTPUT_DELIMITER,
     DEFAULT_STATE_TERMINATOR,
     ACTION_TO_UNICODE_MAP,
+    STATE_ATTRIBUTE_PRECEDENCE,
 )
 
 
+def _intern(obj: object) -> object:
+    """ Returns the interned copy of <obj> if it is a string, so that equal
+    strings (such as the many empty outputs of a state) are only stored once.
+    Returns <obj> unchanged otherwise.
+    """
+    return intern(obj) if isinstance(obj, str) else obj
+
+
+_CASES: Tuple[str, ...] = ('lower', 'upper')
+""" The names of the state attributes which map outputs onto a script.
+"""
+
+_ATTRIB_NAME_TO_BUILDER_NAME: Dict[str, str] = {
+    'upper': 'with_upper',
+    'lower': 'with_lower',
+    'map': 'with_map',
+}
+""" A map between the name of each state attribute and the name of the State
+method which builds it.
+"""
+
+
+def _script_for(
+    outputs: List[str], script: str = None, state_name: str = None
+):
+    """
+    Args:
+        outputs (List[str]): The outputs of each key of the script.
+        script (str, optional): The name of the script which the outputs are
+            for. If not given, the default script for the number of outputs is
+            used.
+        state_name (str, optional): The name of the state, for logging.
+
+    Returns:
+        Script: The script called <script>, or the default script for the
+            length of <outputs>.
+
+    Raises:
+        ScriptNotFoundException: If there is no script called <script>.
+        AlphabetLengthException: If no script is given, and there is no default
+            script for the length of <outputs>.
+    """
+    if script is not None:
+        return get_script(script)
+
+    # Logged lazily, as this is called for every case of every state.
+    logging.info(
+        'Length of output is %d for state %s.', len(outputs), state_name
+    )
+    try:
+        return _DEFAULT_SCRIPT_FOR_LENGTH[len(outputs)]
+    except KeyError:
+        raise AlphabetLengthException(outputs)
+
+
 @dataclass(init=False, eq=True, repr=True)
 class State:
     """ A data class which stores information about a keyboard state.
@@ -36,17 +97,38 @@ class State:
             overrides the output to be «á» («a» with acute accent), then we will
             have typed only «á».
         action_to_output_map (dict): A map which defines the output for when a
-            specific action occurs while in this state.
+            specific action occurs while in this state. Actions and outputs
+            added by the builder methods are interned.
+        action_to_next_map (dict): A map which defines the state to enter when
+            a specific action occurs while in this state, so that dead keys can
+            be chained (such as acute, then dot, then a letter). An action
+            which leads to another state has no output in this state.
+        extends (str): The name of the state which this state is based on, or
+            None. A state which extends another inherits its terminator (if it
+            has none of its own) and all of its bindings.
+        includes (Tuple[str, ...]): The names of the states whose bindings are
+            all added to this state, in order.
     """
-    name: str = None
-    terminator: str = None
-    action_to_output_map: dict = None
+    __slots__ = (
+        'name', 'terminator', 'action_to_output_map', 'action_to_next_map',
+        'extends', 'includes',
+    )
+
+    name: str
+    terminator: str
+    action_to_output_map: dict
+    action_to_next_map: dict
+    extends: str
+    includes: Tuple[str, ...]
 
     def __init__(
         self,
         name: str,
         terminator: str = None,
-        action_to_output_map: dict = None
+        action_to_output_map: dict = None,
+        extends: str = None,
+        includes: Iterable[str] = None,
+        action_to_next_map: dict = None,
     ) -> None:
         """ Initializes an object. If an action_to_output_map is provided, then
         the object's action_to_output_map attribute will be set to it.
@@ -54,31 +136,177 @@ class State:
 
         Args:
             name (str): The name of the state.
-            terminator (str): The terminator of the state.
+            terminator (str): The terminator of the state. If the state extends
+                another, and has no terminator, it is left as None until the
+                state is composed.
             action_to_output_map (dict, optional): A map which defines the
                 output for when a specific action occurs while in this state.
+            extends (str, optional): The name of the state which this state is
+                based on.
+            includes (Iterable[str], optional): The names of the states whose
+                bindings are added to this state.
+            action_to_next_map (dict, optional): A map which defines the name
+                of the state to enter when a specific action occurs while in
+                this state.
         """
         self.name = name
-        self.terminator = terminator if terminator else DEFAULT_STATE_TERMINATOR
-        self.action_to_output_map = action_to_output_map if action_to_output_map else {}
-
-    def _get_actions(self, output: str):
-        length_to_actions_map = {
-            26: latin_26,
-            27: latin_27,
-            28: latin_28,
-            36: alphalatin,
-        }
-
-        logging.info(
-            f'Length of output is {len(output)} for state {repr(self)}.'
+        self.extends = _intern(extends)
+        self.includes = tuple(map(_intern, includes)) if includes else ()
+
+        if terminator is None and extends is not None:
+            self.terminator = None
+        else:
+            self.terminator = _intern(
+                terminator if terminator else DEFAULT_STATE_TERMINATOR
+            )
+
+        self.action_to_output_map = \
+            action_to_output_map if action_to_output_map else {}
+        self.action_to_next_map = \
+            action_to_next_map if action_to_next_map else {}
+
+    @classmethod
+    def from_attributes(cls, name: str, attributes: Mapping[str, Any]):
+        """ Builds a state from all of its attributes at once, such as those
+        given to it in a state file. This is equivalent to calling the builder
+        method of each attribute in the order given by
+        <STATE_ATTRIBUTE_PRECEDENCE>, but builds the state's
+        action_to_output_map in a single pass.
+
+        Example:
+            my_state = State.from_attributes('acute', {
+                'terminator': '´',
+                'lower': 'á,b́,ć,d́,é,f́,ǵ,h́,í,ȷ́,ḱ,ĺ,ḿ,ń,ó,ṕ,q́,ŕ,ś,t́,ú,v́,ẃ,x́,ý,ź',
+                'map': {"'": '´'},
+            })
+
+        Args:
+            name (str): The name of the state.
+            attributes (Mapping[str, Any]): The attributes of the state. As well
+                as the attributes in <STATE_ATTRIBUTE_PRECEDENCE>, these can
+                include a «terminator», the name of the «script» which «lower»
+                and «upper» are for, the name of the state which this state
+                «extends», the name (or list of names) of the states which it
+                «include»s, and a map of the state to enter «next» for each
+                action which leads to another state.
+
+        Returns:
+            State: The state described by <attributes>. If it extends or
+                includes other states, it is not composed with them.
+        """
+        script = attributes.get('script')
+        includes = attributes.get('include')
+        action_to_output_map: dict = {}
+
+        for attrib_name in STATE_ATTRIBUTE_PRECEDENCE:
+            value = attributes.get(attrib_name)
+            if value:
+                action_to_output_map.update(
+                    cls._bindings(attrib_name, value, script, name)
+                )
+
+        return cls(
+            name=name,
+            terminator=attributes.get('terminator'),
+            action_to_output_map=action_to_output_map,
+            extends=attributes.get('extends'),
+            includes=[includes] if isinstance(includes, str) else includes,
+            action_to_next_map=dict(
+                cls._bindings('map', attributes.get('next') or {})
+            ),
         )
-        try:
-            return length_to_actions_map[len(output)]
-        except KeyError:
-            raise AlphabetLengthException(output)
 
-    def _with_case(self, output_list: str, case: str):
+    @property
+    def is_composed(self) -> bool:
+        """
+        Returns:
+            bool: True if the state extends or includes other states, and so
+                must be composed with them before it can be used.
+        """
+        return self.extends is not None or bool(self.includes)
+
+    def compose(
+        self, included: Iterable['State'] = (), extended: 'State' = None
+    ) -> 'State':
+        """ Composes a state from this state and the states it is based on.
+
+        The bindings of each state in <included> are added in order, followed
+        by those of <extended>, and finally those of this state, so that later
+        bindings override earlier ones. An empty output never overrides an
+        output which is not empty, so the gaps in a state's «lower» and «upper»
+        (such as «,,c̭,ḓ») keep the outputs of the states it is based on.
+
+        Args:
+            included (Iterable[State]): The composed states named by
+                <includes>.
+            extended (State, optional): The composed state named by <extends>.
+
+        Returns:
+            State: A new state, which has the same name as this state, and
+                neither extends nor includes any others.
+        """
+        action_to_output_map: dict = {}
+        action_to_next_map: dict = {}
+
+        for base in (*included, extended, self):
+            if base is None:
+                continue
+            for action, output in base.action_to_output_map.items():
+                if output or not action_to_output_map.get(action):
+                    action_to_output_map[action] = output
+            action_to_next_map.update(base.action_to_next_map)
+
+        terminator = self.terminator
+        if terminator is None and extended is not None:
+            terminator = extended.terminator
+
+        return State(
+            name=self.name,
+            terminator=terminator,
+            action_to_output_map=action_to_output_map,
+            action_to_next_map=action_to_next_map,
+        )
+
+    @staticmethod
+    def _bindings(
+        attrib_name: str,
+        value: Any,
+        script: str = None,
+        state_name: str = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Args:
+            attrib_name (str): The name of the attribute to get the bindings of;
+                one of «lower», «upper» or «map».
+            value (Any): The value of the attribute. This is a delimited list of
+                outputs for «lower» and «upper», and a dict for «map».
+            script (str, optional): The name of the script which «lower» and
+                «upper» are for.
+            state_name (str, optional): The name of the state, for logging.
+
+        Returns:
+            Iterator[Tuple[str, str]]: The interned (action, output) pairs
+                described by the attribute.
+
+        Raises:
+            KeyError: If <attrib_name> is not the name of a builder attribute.
+        """
+        if attrib_name == 'map':
+            return (
+                (_intern(ACTION_TO_UNICODE_MAP.get(action, action)),
+                    _intern(output))
+                for action, output in value.items()
+            )
+
+        if attrib_name not in _CASES:
+            raise KeyError(attrib_name)
+
+        outputs: List[str] = value.split(OUTPUT_DELIMITER)
+        actions = _script_for(outputs, script, state_name).actions(attrib_name)
+
+        return zip(actions, map(_intern, outputs))
+
+    def _with_case(self, output_list: str, case: str, script: str = None):
         """ A generic method for building outputs of a certain case.
 
         Builds the object's action_to_output_map for all (lower|upper)case
@@ -96,29 +324,21 @@ class State:
         Args:
             output_list (str): The output which is expected for each key, in
                 alphabetical order, and separated by commas.
+            case (str): The case of the script to map, «lower» or «upper».
+            script (str, optional): The name of the script whose keys are being
+                mapped. If not given, it is chosen by the number of outputs.
         """
-        outputs: List[str] = output_list.split(OUTPUT_DELIMITER)
-
-        actions = self._get_actions(outputs)
-
-        for action, output in zip(getattr(actions, case), outputs):
-            logging.info(f'Mapping action {action} to output {output}.')
-
-            self.action_to_output_map[self._to_unicode(action)] = output
+        self.action_to_output_map.update(
+            self._bindings(case, output_list, script, self.name)
+        )
 
         return self
 
-    def with_upper(self, output_list: str):
-        return self._with_case(output_list, 'upper')
-
-    def with_lower(self, output_list: str):
-        return self._with_case(output_list, 'lower')
+    def with_upper(self, output_list: str, script: str = None):
+        return self._with_case(output_list, 'upper', script)
 
-    def _to_unicode(self, string: str) -> str:
-        try:
-            return ACTION_TO_UNICODE_MAP[string]
-        except KeyError:
-            return string
+    def with_lower(self, output_list: str, script: str = None):
+        return self._with_case(output_list, 'lower', script)
 
     def with_map(self, action_to_output_map: dict):
         """ A method for overriding individual outputs for individual actions
@@ -129,41 +349,93 @@ class State:
             output} pairs to add / override inside the class's
             action_to_output_map.
         """
-        action_to_output_map = {
-            self._to_unicode(action): output
-            for action, output in action_to_output_map.items()
-        }
-
-        for action, output in action_to_output_map.items():
-            self.action_to_output_map[action] = output
+        self.action_to_output_map.update(
+            self._bindings('map', action_to_output_map)
+        )
         return self
 
-    def builder_method_from_attrib_name(self, attrib_name: str) -> Callable:
-        atttrib_name_to_method_map: Dict[str, Callable] = {
-            'upper': self.with_upper,
-            'lower': self.with_lower,
-            'map': self.with_map,
-        }
-        return atttrib_name_to_method_map[attrib_name]
+    def builder_method_from_attrib_name(
+        self, attrib_name: str, script: str = None
+    ) -> Callable:
+        if attrib_name in _CASES:
+            return partial(self._with_case, case=attrib_name, script=script)
+        return getattr(self, _ATTRIB_NAME_TO_BUILDER_NAME[attrib_name])
 
 
-@dataclass(init=False, eq=True, repr=True, order=True)
+@dataclass(init=False, eq=False, repr=True)
 class Action:
     """ A data class which stores information about a keylayout action.
 
+    Actions are flyweights: creating an Action with the same id and next state
+    as an existing one returns the existing object. Equal actions are
+    therefore the same object, and can be compared and hashed by identity.
+    Each action's sort key and hash are computed once, when it is first
+    created, so sorting actions never compares their fields. As they are
+    shared, actions cannot be changed once created. Only weak references are
+    kept to the actions, so those which are no longer used are freed.
+
     Properties:
         id_ (str): The identifier string (name) for the action.
-        next_ (State, optional): The state which the keylayout should be in once
-            the action occurs. This is used to enter, change, and remain in
-            states.
+        next_ (str, optional): The name of the state which the keylayout should
+            be in once the action occurs. This is used to enter, change, and
+            remain in states. Only the name is held, so defining an action
+            never loads a state; the state is resolved when the keylayout using
+            the action is compiled or written.
+        sort_key (Tuple[str, str]): The key which actions are ordered by; the
+            id of the action, then the name of its next state.
     """
-    id_: str = None
-    next_: State = None
+    __slots__ = ('id_', 'next_', 'sort_key', '_hash', '__weakref__')
+
+    id_: str
+    next_: str
+
+    _instances: ClassVar[
+        'WeakValueDictionary[Tuple[str, str], Action]'
+    ] = WeakValueDictionary()
+
+    def __new__(cls, id_, next_=None):
+        # A State may be given for the next state, but only its name is kept.
+        next_ = getattr(next_, 'name', next_)
+        key = (id_, next_)
+
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+
+        action = super().__new__(cls)
+        set_attribute = super(Action, action).__setattr__
+        set_attribute('id_', _intern(id_))
+        set_attribute('next_', _intern(next_))
+        set_attribute('sort_key', (action.id_, next_ or ''))
+        set_attribute('_hash', hash(action.sort_key))
+
+        # Another thread may have interned the same action in the meantime.
+        return cls._instances.setdefault(key, action)
 
     def __init__(self, id_, next_=None):
-        self.id_ = id_
-        if next_ is not None:
-            self.next_ = next_
+        # All of the work is done (once) by __new__.
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('Actions cannot be changed, as they are shared.')
+
+    def __reduce__(self):
+        # Unpickled actions are interned again.
+        return (Action, (self.id_, self.next_))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Action):
+            return self is other
+        return NotImplemented
+
+    def __lt__(self, other: 'Action') -> bool:
+        if isinstance(other, Action):
+            return self.sort_key < other.sort_key
+        return NotImplemented
 
 
 @dataclass(init=False, eq=True, repr=True, order=True)
@@ -173,6 +445,8 @@ class Script:
     definition is subject to change.
 
     Properties:
+        name (str): The name of the script, which states can use to refer to
+            it.
         length (int): The length of the script. For a Script «script»:
             script.length == len(script.lower) == len(script.upper)
         lower (int): The «lower case» (default) output of the script.
@@ -181,12 +455,24 @@ class Script:
             systems (which have 2 sets of interchangeable letters). Examples of
             such scripts include latin; cyrillic; and greek (upper and lower
             case), and kana (hiragana and katakana).
+        lower_actions (Tuple[str]): The action of each key of <lower>, as used
+            in a state's action_to_output_map.
+        upper_actions (Tuple[str]): The action of each key of <upper>.
     """
-    length: int = None
-    upper: str = None
-    lower: str = None
+    __slots__ = (
+        'name', 'length', 'upper', 'lower', 'lower_actions', 'upper_actions',
+    )
+
+    name: str
+    length: int
+    upper: str
+    lower: str
+    lower_actions: Tuple[str, ...]
+    upper_actions: Tuple[str, ...]
 
-    def __init__(self, lower: str, upper: str = None) -> None:
+    def __init__(
+        self, lower: str, upper: str = None, name: str = None
+    ) -> None:
         """ An initializer for a script.
 
         Args:
@@ -195,12 +481,78 @@ class Script:
             is accessed through pressing shift. Useful for writing systems which
             has 2 sets of interchangeable letters, EG latin; cyrillic; greek;
             kana.
+            name (str, optional): The name of the script.
         """
+        self.name = name
         self.lower = lower
         self.length = len(lower)
-        if upper is not None:
-            self.upper = upper
+        self.upper = upper
+        self.lower_actions = self._to_actions(lower)
+        self.upper_actions = self._to_actions(upper)
+
+    @staticmethod
+    def _to_actions(keys: str) -> Tuple[str, ...]:
+        if keys is None:
+            return ()
+        return tuple(
+            _intern(ACTION_TO_UNICODE_MAP.get(key, key)) for key in keys
+        )
 
+    def actions(self, case: str) -> Tuple[str, ...]:
+        """
+        Args:
+            case (str): The case to get the actions of, «lower» or «upper».
+
+        Returns:
+            Tuple[str, ...]: The action of each key of the script in <case>.
+        """
+        return self.upper_actions if case == 'upper' else self.lower_actions
+
+
+SCRIPTS: Dict[str, Script] = {}
+""" A registry of every script which states can refer to by name.
+"""
+
+_DEFAULT_SCRIPT_FOR_LENGTH: Dict[int, Script] = {}
+""" The script used by states which do not name one, by the number of outputs
+they give.
+"""
+
+
+def register_script(
+    script: Script, default_for_length: bool = False
+) -> Script:
+    """ Adds a script to the registry of scripts, so that states can use it.
+
+    Args:
+        script (Script): The script to register. It must have a name.
+        default_for_length (bool): Whether states which do not name a script,
+            but give as many outputs as <script> has keys, should use it.
+
+    Returns:
+        Script: <script>.
+    """
+    SCRIPTS[script.name] = script
+    if default_for_length:
+        _DEFAULT_SCRIPT_FOR_LENGTH[script.length] = script
+    return script
+
+
+def get_script(name: str) -> Script:
+    """
+    Args:
+        name (str): The name of the script to get.
+
+    Returns:
+        Script: The registered script called <name>.
+
+    Raises:
+        ScriptNotFoundException: If no script called <name> is registered.
+    """
+    try:
+        return SCRIPTS[name]
+    except KeyError:
+        raise ScriptNotFoundException(name)
 
 
 latin_26_upper = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
@@ -220,34 +572,38 @@ by the symbols &@#$%^<>() (the symbols of the JDvorak keylayout
 """
 
 
-latin_26 = Script(
+latin_26 = register_script(Script(
+    name='latin_26',
     upper=latin_26_upper,
     lower=latin_26_lower,
-)
+), default_for_length=True)
 """ An implementation of the ISO basic latin script.
 """
 
 
-latin_27 = Script(
+latin_27 = register_script(Script(
+    name='latin_27',
     upper=latin_26_upper,
     lower=latin_26_lower + '\'',
-)
+), default_for_length=True)
 """ An implementation of the ISO basic latin script, with «\'» included in the
 lower case.
 """
 
-latin_28 = Script(
+latin_28 = register_script(Script(
+    name='latin_28',
     upper=latin_26_upper,
     lower=latin_26_lower + '\'' + '\"',
-)
+), default_for_length=True)
 """ An implementation of the ISO basic latin script, with «\'» and «\"» included
 in the lower case.
 """
 
-alphalatin = Script(
+alphalatin = register_script(Script(
+    name='alphalatin',
     lower=alphalatin_lower,
     upper=alphalatin_upper,
-)
+), default_for_length=True)
 """ An implementation of the latin script including letters 1-9 and symbols
 &@#$%^<>() (the symbols of the JDvorak keylayout).
 """
@@ -71,6 +71,40 @@ class AlphabetLengthException(BaseSymboardException):
         super().__init__(msg=f'Alphabet {alphabet} of length {len(alphabet)} is'
         'not a valid alphabet length.')
 
+class DuplicateStateException(BaseSymboardException):
+    """ Indicates that more than one state file defines a state with the same
+    name.
+    """
+    def __init__(self, duplicates):
+        super().__init__(
+            msg='States are defined more than once: ' + '; '.join(
+                f'«{name}» in {", ".join(paths)}'
+                for name, paths in duplicates.items()
+            )
+        )
+        self.duplicates = duplicates
+
+class ScriptNotFoundException(BaseSymboardException):
+    """ Indicates that a state refers to a script which has not been
+    registered.
+    """
+    def __init__(self, name):
+        super().__init__(msg=f'No script called «{name}» is registered.')
+
+class StateCompositionException(BaseSymboardException):
+    """ Indicates that a state extends or includes a state which does not
+    exist, or that states extend or include each other in a cycle.
+    """
+
+class ModifierExpressionException(BaseSymboardException):
+    """ Indicates that a modifier expression, such as those in a key map
+    select, refers to a modifier key which does not exist.
+    """
+    def __init__(self, expression, key):
+        super().__init__(
+            msg=f'Unknown modifier key «{key}» in expression «{expression}».'
+        )
+
 class CouldNotGetOutputException(BaseSymboardException):
     """ Indicates that the object does not have a well defined output that can
     be used when a key is pressed.
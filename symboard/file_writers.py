@@ -12,13 +12,15 @@
 
 # Imports from third party packages.
 from os.path import exists, splitext
-from re import search, sub
+from re import search
 from lxml.etree import (
     Element,
     SubElement as sub_element,
     tostring,
 )
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict
 import logging
 
 # Package internal imports.
@@ -26,9 +28,51 @@ from symboard.errors import (
     WriteException, FileExistsException, KeylayoutNoneException
 )
 from symboard.keylayouts.keylayouts import Keylayout, Action
+from symboard.state_matrix import StateMatrix
 from settings import VERSION, DEFAULT_OUTPUT_PATH, OVERWRITE_OUTPUT
 
 
+_REFERENCE_START: str = '\uE000'
+""" A private use character which stands in for the «&» of each numeric
+character reference made by «escape», until the tree has been serialized.
+lxml would escape an «&» itself, but writes this character as it is.
+"""
+
+_ESCAPED_CODE_POINTS: Dict[int, str] = {
+    code_point: _REFERENCE_START + '#x{:04X};'.format(code_point)
+    for code_point in [
+        *range(0x00, 0x20), *range(0x7F, 0xA0),
+        ord('"'), ord('&'), ord("'"), ord('<'), ord('>'),
+        ord(_REFERENCE_START),
+    ]
+}
+""" The replacement of each character which is written to keylayout files as a
+numeric character reference. These are the control characters, which XML does
+not allow to be written as they are, the characters with a meaning in XML, and
+<_REFERENCE_START>. Every other character is written as it is.
+"""
+
+
+# A keylayout repeats the same outputs many times, so each is only escaped
+# once. The cache is bounded, as a long running process can write any number
+# of keylayouts.
+@lru_cache(maxsize=4096)
+def escape(output: str) -> str:
+    """
+    Args:
+        output (str): An output (or action id), as the characters it is made
+            of.
+
+    Returns:
+        str: <output>, with each control character and character with a
+            meaning in XML replaced by a numeric character reference, such as
+            «&#x001C;» for «\u001C». This is how keylayout files expect them.
+            The «&» of each reference is <_REFERENCE_START>, which is replaced
+            once the tree has been serialized.
+    """
+    return output.translate(_ESCAPED_CODE_POINTS)
+
+
 class FileWriter:
     """ The base class for functions which write to the local file system.
 
@@ -78,7 +122,9 @@ class KeylayoutFileWriter(FileWriter):
         which should be implemented by the children of this class.
 
         Args:
-            keylayout (Keylayout): The keylayout we want to get the contents of.
+            keylayout (Keylayout): The keylayout we want to get the contents of,
+                or a CompiledKeylayout of it. As a CompiledKeylayout cannot
+                change, its contents can be got in any thread.
 
         Returns:
             str: ''
@@ -93,7 +139,8 @@ class KeylayoutFileWriter(FileWriter):
         the contents of <keylayout>.
 
         Args:
-            keylayout (Keylayout): The keylayout we want to write data from.
+            keylayout (Keylayout): The keylayout we want to write data from,
+                or a CompiledKeylayout of it.
             output_path (str): The path of the file we want to write to.
                 Defaults to DEFAULT_OUTPUT_PATH.
 
@@ -165,21 +212,15 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
         if len(keylayout.used_states) > 0:
             self._terminators(keylayout, keyboard_elem)
 
-        ''' Right. So the authors of the «XML» package assumed, wrongly, that we
-        would always want to escape «&» by default. In fact, we pretty much
-        exclusively want &# to *not* be escaped (unless it's on its own).
-
-        I've looked around, and there are no low-effort solutions to this
-        problem that aren't total hacks.
-
-        So let's just regex replace all unicode strings.
+        ''' Outputs are held as the characters they are made of, and are only
+        escaped (as «&#x001C;» and so on) as they are added to the tree, as
+        lxml does not accept control characters. Each of those references
+        starts with <_REFERENCE_START> rather than «&», which lxml would escape
+        again, and is given its «&» in one pass over the serialized tree.
         '''
-        stupidly_escaped_contents = '\n'.join([
-            prepend,
-            tostring(keyboard_elem, encoding='unicode', pretty_print=True),
-        ])
+        contents = tostring(keyboard_elem, encoding='unicode', pretty_print=True)
 
-        return sub(r'&amp;#x', '&#x', stupidly_escaped_contents)
+        return '\n'.join([prepend, contents.replace(_REFERENCE_START, '&')])
 
     def _get_tag(self, object_: object):
         """ Returns "output" if <object_ > is a string, and "action" if it is an
@@ -218,9 +259,9 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
             be resolved (IE <object_> is not a string or an Action).
         """
         if isinstance(object_, str):
-            return object_
+            return escape(object_)
         elif isinstance(object_, Action):
-            return object_.id_
+            return escape(object_.id_)
         else:
             raise CouldNotGetOutputException(object_)
 
@@ -310,7 +351,8 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
             containing the tag «modiferMap». It has children with the tag
             «keyMapSelect», which themselves have children with the tag
             «modifier». Each of these elements contains attributes as specified
-            by the dictionary in <keylayout.key_map_select>.
+            by the dictionary in <keylayout.key_map_select>, which is already
+            minimized if <keylayout> was compiled with «minimize» set.
         """
         logging.info(f'Creating a modifierMap element and its subchildren.')
 
@@ -386,8 +428,12 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
             keyboard, 'actions'
         )
 
+        # Compiled once, so that the states binding each action can be found
+        # without searching every state.
+        state_matrix = StateMatrix.from_states(keylayout.used_states)
+
         for action in sorted(keylayout.actions):
-            self._action(keylayout, actions_elem, action)
+            self._action(keylayout, actions_elem, action, state_matrix)
 
         return actions_elem
 
@@ -399,12 +445,16 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
             'when',
             {
                 'state': state,
-                output_type: output,
+                output_type: escape(output),
             }
         )
 
     def _action(
-        self, keylayout: Keylayout, keyboard: Element, action: Action
+        self,
+        keylayout: Keylayout,
+        keyboard: Element,
+        action: Action,
+        state_matrix: StateMatrix = None,
     ) -> Element:
         """
         Args:
@@ -413,6 +463,8 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
             keyboard (Element): The XML Element which is to be the parent of the
                 newly craeted «action» element.
             action_id (str): The unique id (name) to give to the action.
+            state_matrix (StateMatrix, optional): The table of the outputs of
+                <keylayout>'s used states. It is built if not provided.
 
         Returns:
             Element: An element which has been added as a child to <keyboard>,
@@ -427,25 +479,25 @@ class KeylayoutXMLFileWriter(KeylayoutFileWriter):
         next_state = action.next_
 
         action_elem: Element = sub_element(
-            keyboard, 'action', {'id': action_id}
+            keyboard, 'action', {'id': escape(action_id)}
         )
 
         if next_state is not None:
             # Add a dead key (the "next" output will be the state the user
             # enters next.
-            next_state_name = next_state.name
-            self._when_elem(action_elem, 'none', 'next', next_state_name)
+            self._when_elem(action_elem, 'none', 'next', next_state)
         else:
             output = action_id
             self._when_elem(action_elem, 'none', 'output', output)
 
-        for state in keylayout.used_states:
-            # Add an output for the "none" state, including possible dead keys.
-            if action_id in state.action_to_output_map.keys():
-                self._when_elem(
-                    action_elem, state.name, 'output',
-                    state.action_to_output_map[action_id],
-                )
+        if state_matrix is None:
+            state_matrix = StateMatrix.from_states(keylayout.used_states)
+
+        # Add an output, or the next state of a chain of dead keys, for each
+        # state which binds the action.
+        for state_name, output_type, output in \
+                state_matrix.transitions_for_action(action_id):
+            self._when_elem(action_elem, state_name, output_type, output)
 
         return action_elem
 
@@ -13,13 +13,13 @@ from typing import Dict, List, Union
 # Imports from this package.
 from symboard.keylayouts.iso_dvorak_keylayout import IsoDvorakKeylayout
 from symboard.keylayouts.keylayouts import Action
-from symboard.states import states
 
 
 class IsoJDvorakKeylayout(IsoDvorakKeylayout):
     """ An implementation of the dvorak keyboard layout (keylayout) which
     is able to produce an installable dvorak keyboard that works on iso
-    keyboards.
+    keyboards. Only the keys which differ from the iso dvorak keylayout are
+    defined.
     """
 
     _DEFAULT_NAME: str = 'JDvorak keyboard (iso)'
@@ -113,118 +113,25 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
         ]
     }
 
-    key_map = {
+    key_map_overrides: Dict[int, Dict[int, str]] = {
         0: {
-            0: 'a',
-            1: 'o',
-            2: 'e',
-            3: 'u',
-            4: 'd',
-            5: 'i',
-            6: '&#x0027;',
-            7: 'q',
-            8: 'j',
-            9: 'k',
+            6: '\u0027',
             10: '§',
-            11: 'x',
             12: ';',
-            13: ',',
-            14: '.',
-            15: 'p',
-            16: 'f',
-            17: 'y',
-            18: '1',
-            19: '2',
-            20: '3',
-            21: '4',
-            22: '6',
-            23: '5',
-            24: ']',
-            25: '9',
-            26: '7',
-            27: '[',
-            28: '8',
-            29: '0',
-            30: '=',
-            31: 'r',
-            32: 'g',
-            33: '/',
-            34: 'c',
-            35: 'l',
-            36: '&#x000D;',
-            37: 'n',
-            38: 'h',
-            39: '-',
-            40: 't',
-            41: 's',
-            42: '\\',
-            43: 'w',
-            44: 'z',
-            45: 'b',
-            46: 'm',
-            47: 'v',
-            48: '&#x0009;',
-            49: ' ',
-            50: '`',
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            52: '\u0003',
+            57: None,
             65: ',',
-            66: '&#x001D;',
-            67: '*',
-            69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
-            75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
-            78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            81: '=',
-            82: '0',
             83: '7',
             84: '8',
             85: '9',
-            86: '4',
-            87: '5',
-            88: '6',
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
         1: {
             0: Action("A"),
@@ -233,7 +140,7 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             3: Action("U"),
             4: Action("D"),
             5: Action("I"),
-            6: Action("&#x0022;"),
+            6: Action("\u0022"),
             7: Action("Q"),
             8: Action("J"),
             9: Action("K"),
@@ -245,25 +152,15 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             15: Action("P"),
             16: Action("F"),
             17: Action("Y"),
-            18: '&#x0026;',
-            19: '@',
-            20: '#',
-            21: '$',
+            18: '\u0026',
             22: Action("^"),
-            23: '%',
-            24: '}',
-            25: '(',
-            26: '&#x003C;',
-            27: '{',
-            28: '&#x003E;',
-            29: ')',
-            30: '+',
+            26: '\u003C',
+            28: '\u003E',
             31: Action("R"),
             32: Action("G"),
             33: '*',
             34: Action("C"),
             35: Action("L"),
-            36: '&#x000D;',
             37: Action("N"),
             38: Action("H"),
             39: '-',
@@ -275,138 +172,80 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             45: Action("B"),
             46: Action("M"),
             47: Action("V"),
-            48: '&#x0009;',
-            49: ' ',
-            50: '~',
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            52: '\u0003',
             65: ',',
             66: '*',
-            67: '*',
-            69: '+',
             70: '+',
-            71: '&#x001B;',
             72: '=',
-            75: '/',
-            76: '&#x0003;',
             77: '/',
-            78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            81: '=',
-            82: '0',
             83: '7',
             84: '8',
             85: '9',
-            86: '4',
-            87: '5',
-            88: '6',
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
         2: {
             0: 'alt+a',
-            1: Action("alt+o", next_=states['latin_ring_above']),
-            2: Action("alt+e", next_=states['latin_e']),
-            3: Action("alt+u", next_=states['latin_breve']),
+            1: Action("alt+o", next_='latin_ring_above'),
+            2: Action("alt+e", next_='latin_e'),
+            3: Action("alt+u", next_='latin_breve'),
             4: Action("alt+d"),
             5: Action("alt+i"),
             6: Action("acute"),
             7: Action("×"),
-            8: Action("alt+j", next_=states['latin_hook_palatal']),
+            8: Action("alt+j", next_='latin_hook_palatal'),
             9: Action("√"),
             10: '□',
-            11: Action("alt+x", next_=states['latin_extensions']),
-            12: Action("alt+;", next_=states['latin_umlaut']),
-            13: Action("alt+,", next_=states['latin_horn']),
-            14: Action("alt+.", next_=states['latin_dot_above']),
+            11: Action("alt+x", next_='latin_extensions'),
+            12: Action("alt+;", next_='latin_umlaut'),
+            13: Action("alt+,", next_='latin_horn'),
+            14: Action("alt+.", next_='latin_dot_above'),
             15: Action("dot"),
             16: Action("action 2"),
             17: Action("action 1"),
-            18: Action('alt+1', next_=states['arrows_basic_dvorak']),
+            18: Action('alt+1', next_='arrows_basic_dvorak'),
             19: '',
             20: '',
             21: '',
-            22: Action('alt+6', next_=states['latin_circumflex_above']),
+            22: Action('alt+6', next_='latin_circumflex_above'),
             23: '',
             24: '»',
-            25: '&#x000D;',
-            26: Action('alt+7', next_=states['latin_hook_above']),
+            25: '\u000D',
+            26: Action('alt+7', next_='latin_hook_above'),
             27: '«',
             28: '',
             29: '',
             30: '',
-            31: Action("alt+r", next_=states['latin_rotated_lower']),
+            31: Action("alt+r", next_='latin_rotated_lower'),
             32: Action("alt+g"),
-            33: Action("alt+/", next_=states['latin_acute']),
-            34: Action("alt+c", next_=states['latin_ogonek']),
+            33: Action("alt+/", next_='latin_acute'),
+            34: Action("alt+c", next_='latin_ogonek'),
             35: Action("!"),
-            36: '&#x000D;',
             37: Action("alt+?1"),
             38: Action("alt+h"),
-            39: Action("alt+_", next_=states['latin_macron_above']),
-            40: Action("alt+t", next_=states['latin_bar']),
+            39: Action("alt+_", next_='latin_macron_above'),
+            40: Action("alt+t", next_='latin_bar'),
             41: Action("alt+s"),
-            42: Action("alt+\\", next_=states['latin_grave']),
+            42: Action("alt+\\", next_='latin_grave'),
             43: Action("∴"),
-            44: Action("alt+z", next_=states['latin_cedilla']),
+            44: Action("alt+z", next_='latin_cedilla'),
             45: Action("∫"),
             46: Action("∮"),
-            47: Action('alt+v', next_=states['latin_hacek']),
-            48: '&#x0009;',
+            47: Action('alt+v', next_='latin_hacek'),
             49: ' ',
-            50: Action("alt+`", next_=states['latin_tilde_above']),
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            50: Action("alt+`", next_='latin_tilde_above'),
+            52: '\u0003',
             65: ',',
-            66: '&#x001D;',
             67: '*',
             69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
             75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
             81: '=',
             82: '0',
             83: '7',
@@ -418,54 +257,28 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
         3: {
-            0: Action("alt+A", next_=states['perso_arabic_basic']),
-            1: Action("alt+O", next_=states['latin_ring_below']),
+            0: Action("alt+A", next_='perso_arabic_basic'),
+            1: Action("alt+O", next_='latin_ring_below'),
             2: Action("action 5"),
-            3: Action("alt+U", next_=states['latin_breve_inverted']),
+            3: Action("alt+U", next_='latin_breve_inverted'),
             4: Action("Ґ"),
             5: Action("action 7"),
             6: Action("action"),
             7: Action("action 8"),
-            8: Action("alt+J", next_=states['latin_hook_retroflex']),
+            8: Action("alt+J", next_='latin_hook_retroflex'),
             9: Action("action 9"),
             10: '',
             11: Action("action 10"),
             12: Action("± 1"),
-            13: Action("alt+!", next_=states['latin_comma_below']),
-            14: Action("alt+?", next_=states['latin_dot_below']),
+            13: Action("alt+!", next_='latin_comma_below'),
+            14: Action("alt+?", next_='latin_dot_below'),
             15: Action("®"),
             16: '',
             17: Action("Ћ"),
@@ -473,7 +286,7 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             19: '',
             20: '',
             21: '',
-            22: Action('alt+^', next_=states['latin_circumflex_below']),
+            22: Action('alt+^', next_='latin_circumflex_below'),
             23: '',
             24: '',
             25: '',
@@ -482,43 +295,34 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             28: '≥',
             29: '∞',
             30: '≠',
-            31: Action("alt+R", next_=states['latin_rotated_upper']),
-            32: Action("alt+G", next_=states['greek']),
-            33: Action("alt+*", next_=states['latin_acute_double']),
-            34: Action("alt+C", next_=states['cyrillic']),
+            31: Action("alt+R", next_='latin_rotated_upper'),
+            32: Action("alt+G", next_='greek'),
+            33: Action("alt+*", next_='latin_acute_double'),
+            34: Action("alt+C", next_='cyrillic'),
             35: Action("’ 1"),
-            36: '&#x000D;',
             37: Action("Љ"),
             38: Action("Ј"),
-            39: Action("alt+-", next_=states['latin_macron_below']),
-            40: Action("alt+T", next_=states['latin_slash']),
+            39: Action("alt+-", next_='latin_macron_below'),
+            40: Action("alt+T", next_='latin_slash'),
             41: Action("’"),
-            42: Action("alt+|", next_=states['latin_grave_double']),
+            42: Action("alt+|", next_='latin_grave_double'),
             43: Action("∵"),
             44: Action("action 13"),
             45: Action("β"),
             46: Action("action 11"),
             47: Action("action 12"),
-            48: '&#x0009;',
             49: Action(" "),
-            50: Action("alt+~", next_=states['latin_tilde_below']),
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            50: Action("alt+~", next_='latin_tilde_below'),
+            52: '\u0003',
             65: ',',
             66: '*',
             67: '*',
             69: '+',
             70: '+',
-            71: '&#x001B;',
             72: '=',
             75: '/',
-            76: '&#x0003;',
             77: '/',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
             81: '=',
             82: '0',
             83: '7',
@@ -530,37 +334,11 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
         4: {
             0: Action("a"),
@@ -569,7 +347,7 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             3: Action("u"),
             4: Action("d"),
             5: Action("i"),
-            6: Action("&#x0027;"),
+            6: Action("\u0027"),
             7: Action("q"),
             8: Action("j"),
             9: Action("k"),
@@ -587,92 +365,38 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             21: Action('4'),
             22: Action("6"),
             23: Action('5'),
-            24: ']',
             25: Action('9'),
             26: Action('7'),
-            27: '[',
             28: Action('8'),
             29: Action('0'),
-            30: '=',
             31: Action("r"),
             32: Action("g"),
-            33: '/',
             34: Action("c"),
             35: Action("l"),
-            36: '&#x000D;',
             37: Action("n"),
             38: Action("h"),
             39: Action("_"),
             40: Action("t"),
             41: Action("s"),
-            42: '\\',
             43: Action("w"),
             44: Action("z"),
             45: Action("b"),
             46: Action("m"),
             47: Action("v"),
-            48: '&#x0009;',
             49: Action(" "),
-            50: '`',
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            52: '\u0003',
             65: ',',
-            66: '&#x001D;',
-            67: '*',
-            69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
-            75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
-            78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            81: '=',
-            82: '0',
             83: '7',
             84: '8',
             85: '9',
-            86: '4',
-            87: '5',
-            88: '6',
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
         5: {
             0: 'a',
@@ -681,130 +405,62 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             3: 'u',
             4: 'd',
             5: 'i',
-            6: '&#x0027;',
+            6: '\u0027',
             7: 'q',
             8: 'j',
             9: 'k',
             10: '',
             11: 'x',
             12: ';',
-            13: ',',
-            14: '.',
             15: 'p',
             16: 'f',
             17: 'y',
-            18: '1',
-            19: '2',
-            20: '3',
-            21: '4',
-            22: '6',
-            23: '5',
-            24: ']',
-            25: '9',
-            26: '7',
-            27: '[',
-            28: '8',
-            29: '0',
-            30: '=',
             31: 'r',
             32: 'g',
-            33: '/',
             34: 'c',
             35: 'l',
-            36: '&#x000D;',
             37: 'n',
             38: 'h',
-            39: '-',
             40: 't',
             41: 's',
-            42: '\\',
             43: 'w',
             44: 'z',
             45: 'b',
             46: 'm',
             47: 'v',
-            48: '&#x0009;',
-            49: ' ',
-            50: '`',
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            52: '\u0003',
             65: ',',
-            66: '&#x001D;',
-            67: '*',
-            69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
-            75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
-            78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            81: '=',
-            82: '0',
             83: '7',
             84: '8',
             85: '9',
-            86: '4',
-            87: '5',
-            88: '6',
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
         6: {
-            0: '&#x0001;',
-            1: '&#x0013;',
-            2: '&#x0009;',
-            3: '&#x0006;',
+            0: '\u0001',
+            1: '\u0013',
+            2: '\u0009',
+            3: '\u0006',
             4: '',
-            5: '&#x0007;',
-            6: '&#x001A;',
-            7: '&#x0018;',
+            5: '\u0007',
+            6: '\u001A',
+            7: '\u0018',
             8: '',
-            9: '&#x000B;',
+            9: '\u000B',
             10: '',
             11: '',
-            12: '&#x0011;',
-            13: '&#x0017;',
+            12: '\u0011',
+            13: '\u0017',
             14: '',
-            15: '&#x001E;',
-            16: '&#x001D;',
-            17: '&#x0014;',
+            15: '\u001E',
+            16: '\u001D',
+            17: '\u0014',
             18: '',
             19: '',
             20: '3',
@@ -814,47 +470,34 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             24: '+',
             25: '9',
             26: '7',
-            27: '&#x001F;',
+            27: '\u001F',
             28: '8',
             29: '0',
             30: '',
-            31: '&#x000F;',
-            32: '&#x0015;',
+            31: '\u000F',
+            32: '\u0015',
             33: '',
-            34: '&#x0003;',
-            35: '&#x000C;',
-            36: '&#x000D;',
-            37: '&#x001F;',
-            38: '&#x0008;',
+            34: '\u0003',
+            35: '\u000C',
+            37: '\u001F',
+            38: '\u0008',
             39: '',
             40: '',
             41: '',
             42: '',
             43: ',',
             44: '/',
-            45: '&#x001C;',
-            46: '&#x000D;',
+            45: '\u001C',
+            46: '\u000D',
             47: '.',
-            48: '&#x0009;',
             49: ' ',
             50: '',
-            51: '&#x0008;',
-            52: '&#x0003;',
-            53: '&#x001B;',
-            64: '&#x0010;',
+            52: '\u0003',
             65: ',',
-            66: '&#x001D;',
             67: '*',
             69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
             75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
             81: '=',
             82: '0',
             83: '7',
@@ -866,37 +509,11 @@ class IsoJDvorakKeylayout(IsoDvorakKeylayout):
             89: '1',
             91: '2',
             92: '3',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            102: '&#x0010;',
-            103: '&#x0010;',
-            104: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            108: '&#x0010;',
-            109: '&#x0010;',
-            110: '&#x0010;',
-            111: '&#x0010;',
-            112: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            102: '\u0010',
+            104: '\u0010',
+            108: '\u0010',
+            110: '\u0010',
+            112: '\u0010',
         },
     }
 
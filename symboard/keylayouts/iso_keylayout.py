@@ -98,10 +98,10 @@ class IsoKeylayout(Keylayout):
             33: '[',
             34: 'i',
             35: 'p',
-            36: '&#x000D;',
+            36: '\u000D',
             37: 'l',
             38: 'j',
-            39: '&#x0027;',
+            39: '\u0027',
             40: 'k',
             41: ';',
             42: '\\',
@@ -110,26 +110,26 @@ class IsoKeylayout(Keylayout):
             45: 'n',
             46: 'm',
             47: '.',
-            48: '&#x0009;',
+            48: '\u0009',
             49: ' ',
             50: '`',
-            51: '&#x0008;',
-            53: '&#x001B;',
+            51: '\u0008',
+            53: '\u001B',
             57: '',
-            64: '&#x0010;',
+            64: '\u0010',
             65: '',
-            66: '&#x001D;',
+            66: '\u001D',
             67: '*',
             69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
             75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
+            76: '\u0003',
+            77: '\u001E',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
+            79: '\u0010',
+            80: '\u0010',
             81: '=',
             82: '0',
             83: '1',
@@ -141,32 +141,32 @@ class IsoKeylayout(Keylayout):
             89: '7',
             91: '8',
             92: '9',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
         1: {
             0: 'A',
@@ -194,7 +194,7 @@ class IsoKeylayout(Keylayout):
             23: '%',
             24: '+',
             25: '(',
-            26: '&#x0026;',
+            26: '\u0026',
             27: '_',
             28: '*',
             29: ')',
@@ -204,36 +204,36 @@ class IsoKeylayout(Keylayout):
             33: '{',
             34: 'I',
             35: 'P',
-            36: '&#x000D;',
+            36: '\u000D',
             37: 'L',
             38: 'J',
-            39: '&#x0022;',
+            39: '\u0022',
             40: 'K',
             41: ':',
             42: '|',
-            43: '&#x003C;',
+            43: '\u003C',
             44: '?',
             45: 'N',
             46: 'M',
-            47: '&#x003E;',
-            48: '&#x0009;',
+            47: '\u003E',
+            48: '\u0009',
             49: ' ',
             50: '~',
-            51: '&#x0008;',
-            53: '&#x001B;',
-            64: '&#x0010;',
-            66: '&#x001D;',
+            51: '\u0008',
+            53: '\u001B',
+            64: '\u0010',
+            66: '\u001D',
             67: '*',
             69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
             75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
+            76: '\u0003',
+            77: '\u001E',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
+            79: '\u0010',
+            80: '\u0010',
             81: '=',
             82: '0',
             83: '1',
@@ -245,116 +245,116 @@ class IsoKeylayout(Keylayout):
             89: '7',
             91: '8',
             92: '9',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
         2: {
             0: '',
-            36: '&#x000D;',
-            48: '&#x0009;',
-            51: '&#x0008;',
-            53: '&#x001B;',
-            64: '&#x0010;',
-            66: '&#x001D;',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
-            76: '&#x0003;',
-            77: '&#x001E;',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            36: '\u000D',
+            48: '\u0009',
+            51: '\u0008',
+            53: '\u001B',
+            64: '\u0010',
+            66: '\u001D',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
+            76: '\u0003',
+            77: '\u001E',
+            79: '\u0010',
+            80: '\u0010',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
         3: {
             0: '',
-            36: '&#x000D;',
-            48: '&#x0009;',
-            51: '&#x0008;',
-            53: '&#x001B;',
-            64: '&#x0010;',
-            66: '&#x001D;',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
-            76: '&#x0003;',
-            77: '&#x001E;',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            36: '\u000D',
+            48: '\u0009',
+            51: '\u0008',
+            53: '\u001B',
+            64: '\u0010',
+            66: '\u001D',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
+            76: '\u0003',
+            77: '\u001E',
+            79: '\u0010',
+            80: '\u0010',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
         4: {
             0: 'a',
@@ -392,10 +392,10 @@ class IsoKeylayout(Keylayout):
             33: '[',
             34: 'i',
             35: 'p',
-            36: '&#x000D;',
+            36: '\u000D',
             37: 'l',
             38: 'j',
-            39: '&#x0027;',
+            39: '\u0027',
             40: 'k',
             41: ';',
             42: '\\',
@@ -404,24 +404,24 @@ class IsoKeylayout(Keylayout):
             45: 'n',
             46: 'm',
             47: '.',
-            48: '&#x0009;',
+            48: '\u0009',
             49: ' ',
             50: '`',
-            51: '&#x0008;',
-            53: '&#x001B;',
-            64: '&#x0010;',
-            66: '&#x001D;',
+            51: '\u0008',
+            53: '\u001B',
+            64: '\u0010',
+            66: '\u001D',
             67: '*',
             69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
             75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
+            76: '\u0003',
+            77: '\u001E',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
+            79: '\u0010',
+            80: '\u0010',
             81: '=',
             82: '0',
             83: '1',
@@ -433,32 +433,32 @@ class IsoKeylayout(Keylayout):
             89: '7',
             91: '8',
             92: '9',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
         5: {
             0: 'A',
@@ -496,10 +496,10 @@ class IsoKeylayout(Keylayout):
             33: '[',
             34: 'I',
             35: 'P',
-            36: '&#x000D;',
+            36: '\u000D',
             37: 'L',
             38: 'J',
-            39: '&#x0027;',
+            39: '\u0027',
             40: 'K',
             41: ';',
             42: '\\',
@@ -508,24 +508,24 @@ class IsoKeylayout(Keylayout):
             45: 'N',
             46: 'M',
             47: '.',
-            48: '&#x0009;',
+            48: '\u0009',
             49: ' ',
             50: '`',
-            51: '&#x0008;',
-            53: '&#x001B;',
-            64: '&#x0010;',
-            66: '&#x001D;',
+            51: '\u0008',
+            53: '\u001B',
+            64: '\u0010',
+            66: '\u001D',
             67: '*',
             69: '+',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
             75: '/',
-            76: '&#x0003;',
-            77: '&#x001E;',
+            76: '\u0003',
+            77: '\u001E',
             78: '-',
-            79: '&#x0010;',
-            80: '&#x0010;',
+            79: '\u0010',
+            80: '\u0010',
             81: '=',
             82: '0',
             83: '1',
@@ -537,73 +537,73 @@ class IsoKeylayout(Keylayout):
             89: '7',
             91: '8',
             92: '9',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
         6: {
             0: '',
-            36: '&#x000D;',
-            48: '&#x0009;',
-            51: '&#x0008;',
-            53: '&#x001B;',
-            64: '&#x0010;',
-            66: '&#x001D;',
-            70: '&#x001C;',
-            71: '&#x001B;',
-            72: '&#x001F;',
-            76: '&#x0003;',
-            77: '&#x001E;',
-            79: '&#x0010;',
-            80: '&#x0010;',
-            96: '&#x0010;',
-            97: '&#x0010;',
-            98: '&#x0010;',
-            99: '&#x0010;',
-            100: '&#x0010;',
-            101: '&#x0010;',
-            103: '&#x0010;',
-            105: '&#x0010;',
-            106: '&#x0010;',
-            107: '&#x0010;',
-            109: '&#x0010;',
-            111: '&#x0010;',
-            113: '&#x0010;',
-            114: '&#x0005;',
-            115: '&#x0001;',
-            116: '&#x000B;',
-            117: '&#x007F;',
-            118: '&#x0010;',
-            119: '&#x0004;',
-            120: '&#x0010;',
-            121: '&#x000C;',
-            122: '&#x0010;',
-            123: '&#x001C;',
-            124: '&#x001D;',
-            125: '&#x001F;',
-            126: '&#x001E;',
+            36: '\u000D',
+            48: '\u0009',
+            51: '\u0008',
+            53: '\u001B',
+            64: '\u0010',
+            66: '\u001D',
+            70: '\u001C',
+            71: '\u001B',
+            72: '\u001F',
+            76: '\u0003',
+            77: '\u001E',
+            79: '\u0010',
+            80: '\u0010',
+            96: '\u0010',
+            97: '\u0010',
+            98: '\u0010',
+            99: '\u0010',
+            100: '\u0010',
+            101: '\u0010',
+            103: '\u0010',
+            105: '\u0010',
+            106: '\u0010',
+            107: '\u0010',
+            109: '\u0010',
+            111: '\u0010',
+            113: '\u0010',
+            114: '\u0005',
+            115: '\u0001',
+            116: '\u000B',
+            117: '\u007F',
+            118: '\u0010',
+            119: '\u0004',
+            120: '\u0010',
+            121: '\u000C',
+            122: '\u0010',
+            123: '\u001C',
+            124: '\u001D',
+            125: '\u001F',
+            126: '\u001E',
         },
     }
@@ -0,0 +1,232 @@
+"""
+.. module:: key_maps
+   :synopsis: A compact, array backed key map, which can be read in the same way
+   as the nested dicts which keylayouts define their key maps with.
+
+.. moduleauthor:: Andrew J. Young
+
+"""
+
+
+# Imports from the standard library.
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Dict, Iterator, List, Tuple
+
+
+KEY_MAP_WIDTH: int = 128
+""" The number of key codes in each index of an ArrayKeyMap. Mac keylayouts use
+the key codes 0 to 126, so every code fits in a slot.
+"""
+
+
+class _IndexItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Tuple[int, object]]:
+        index = self._mapping
+        return zip(index._codes, index._outputs)
+
+
+class _IndexValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[object]:
+        return iter(self._mapping._outputs)
+
+
+class KeyMapIndex(Mapping):
+    """ A read only mapping of the key codes of a single index of a keylayout
+    to their outputs.
+
+    The outputs are held in a list of <KEY_MAP_WIDTH> slots, where each slot
+    holds the output of the key code equal to its position, or None if that
+    code has no output. Looking up a code is a single list access. The codes
+    which have an output, and those outputs, are also kept as tuples in
+    ascending order of code, so that iterating over the index never visits an
+    empty slot. Its items and values views are made once, and shared by every
+    call to «items» and «values». Iterating over them still takes up to 8%
+    longer than iterating over a dict (see scripts/benchmark_key_maps.py), as
+    each iteration starts with a call to a Python «__iter__».
+    """
+    __slots__ = ('_slots', '_codes', '_outputs', '_items', '_values')
+
+    def __init__(self, outputs: Mapping = None) -> None:
+        """
+        Args:
+            outputs (Mapping[int, object], optional): The output of each key
+                code.
+
+        Raises:
+            ValueError: If a key code is not in the range [0, KEY_MAP_WIDTH),
+                or an output is None.
+        """
+        outputs = outputs if outputs is not None else {}
+
+        self._slots: List[object] = [None] * KEY_MAP_WIDTH
+        for code, output in outputs.items():
+            if not isinstance(code, int) or not 0 <= code < KEY_MAP_WIDTH:
+                raise ValueError(
+                    f'Key code {code} is not in the range [0, '
+                    f'{KEY_MAP_WIDTH}).'
+                )
+            if output is None:
+                raise ValueError(f'Key code {code} has no output.')
+            self._slots[code] = output
+
+        self._codes: Tuple[int, ...] = tuple(sorted(outputs))
+        self._outputs: Tuple[object, ...] = tuple(
+            self._slots[code] for code in self._codes
+        )
+        self._items: ItemsView = _IndexItemsView(self)
+        self._values: ValuesView = _IndexValuesView(self)
+
+    def __getitem__(self, code: int) -> object:
+        try:
+            output = self._slots[code]
+        except (IndexError, TypeError):
+            raise KeyError(code)
+
+        if output is None or code < 0:
+            raise KeyError(code)
+        return output
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def items(self) -> ItemsView:
+        return self._items
+
+    def values(self) -> ValuesView:
+        return self._values
+
+    def __repr__(self) -> str:
+        return f'KeyMapIndex({dict(self.items())})'
+
+
+class ArrayKeyMap(Mapping):
+    """ A read only key map, which maps each index of a keylayout to a mapping
+    of key codes to outputs, just as a Dict[int, Dict[int, object]] would.
+
+    Rather than a dict per index, the outputs of each index are held in a
+    KeyMapIndex of <KEY_MAP_WIDTH> slots, so each index uses a small, fixed
+    amount of memory. Codes are always iterated in ascending order.
+
+    As it is read only, one ArrayKeyMap can be shared by every instance of a
+    keylayout.
+    """
+    __slots__ = ('_indices',)
+
+    def __init__(self, key_map: Mapping = None) -> None:
+        """
+        Args:
+            key_map (Mapping[int, Mapping[int, object]], optional): The output
+                of each key code, by index.
+
+        Raises:
+            ValueError: If a key code is not in the range [0, KEY_MAP_WIDTH),
+                or an output is None.
+        """
+        key_map = key_map if key_map is not None else {}
+
+        self._indices: Dict[int, KeyMapIndex] = {
+            index: KeyMapIndex(outputs) for index, outputs in key_map.items()
+        }
+
+    def __getitem__(self, index: int) -> KeyMapIndex:
+        return self._indices[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def items(self) -> ItemsView:
+        return self._indices.items()
+
+    def values(self) -> ValuesView:
+        return self._indices.values()
+
+    def __repr__(self) -> str:
+        return f'ArrayKeyMap({dict(self._indices)})'
+
+
+class OverlayKeyMapIndex(Mapping):
+    """ A read only view of a single index of an OverlayKeyMap. A key code is
+    looked up in the overrides first, and then in the base index.
+    """
+    __slots__ = ('_base', '_overrides')
+
+    def __init__(self, base: Mapping, overrides: Mapping) -> None:
+        self._base = base
+        self._overrides = overrides
+
+    def __getitem__(self, code: int) -> object:
+        if code in self._overrides:
+            output = self._overrides[code]
+            if output is None:
+                raise KeyError(code)
+            return output
+        return self._base[code]
+
+    def __iter__(self) -> Iterator[int]:
+        codes = set(self._base)
+        for code, output in self._overrides.items():
+            if output is None:
+                codes.discard(code)
+            else:
+                codes.add(code)
+        return iter(sorted(codes))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class OverlayKeyMap(Mapping):
+    """ A read only key map which is defined by the changes it makes to another
+    (parent) key map, such as that of the keylayout it is derived from.
+
+    Only the overrides are stored. Each index is looked up in layers, from the
+    overrides to the parent, so a derived key map costs little more than its
+    overrides until it is flattened. An override of None removes a key code
+    which the parent defines.
+
+    Attributes:
+        parent (Mapping[int, Mapping[int, object]]): The key map which is
+            overridden.
+        overrides (Mapping[int, Mapping[int, object]]): The outputs which
+            differ from <parent>, by index and then key code.
+    """
+    __slots__ = ('parent', 'overrides')
+
+    def __init__(self, parent: Mapping, overrides: Mapping) -> None:
+        self.parent = parent
+        self.overrides = overrides
+
+    def __getitem__(self, index: int) -> OverlayKeyMapIndex:
+        if index not in self.parent and index not in self.overrides:
+            raise KeyError(index)
+
+        return OverlayKeyMapIndex(
+            self.parent.get(index, {}), self.overrides.get(index, {})
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self.parent
+        for index in self.overrides:
+            if index not in self.parent:
+                yield index
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def flatten(self) -> ArrayKeyMap:
+        """
+        Returns:
+            ArrayKeyMap: A key map with the same outputs as this key map, which
+                no longer refers to <parent>.
+        """
+        return ArrayKeyMap(self)
@@ -9,11 +9,121 @@
 
 
 # Imports from third party packages.
-from typing import Dict, List, Union
+from hashlib import sha256
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple, Union
 from dataclasses import dataclass
 
 # Imports from the local package.
-from symboard.actions import Action
+from symboard.actions import Action, State
+from symboard.keylayouts.key_maps import ArrayKeyMap, OverlayKeyMap
+from symboard.keylayouts.modifiers import (
+    ModifierTable, minimize_key_map_select
+)
+from settings import MINIMIZE_KEY_MAP_SELECT, VERSION
+
+
+def _actions_in_key_map(key_map: Mapping) -> Tuple[Action, ...]:
+    # Equal actions are the same object, so duplicates are removed by a set.
+    return tuple(sorted(
+        {
+            output
+            for index in key_map.values()
+            for output in index.values()
+            if isinstance(output, Action)
+        },
+        key=attrgetter('sort_key'),
+    ))
+
+
+def _canonical(output: object) -> object:
+    if isinstance(output, Action):
+        return ('action', output.id_, output.next_)
+    return output
+
+
+class _Fingerprint:
+    """ A sha256 hash which is fed the canonical content of a keylayout, one
+    record at a time, as the keylayout is compiled.
+
+    Each record is a tuple of strings, ints and None, whose repr is the same
+    on every platform and run, so equal content always has an equal digest.
+    """
+    __slots__ = ('_hash',)
+
+    def __init__(self) -> None:
+        self._hash = sha256()
+
+    def update(self, *record: object) -> None:
+        self._hash.update(repr(record).encode('utf-8'))
+        self._hash.update(b'\n')
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _keyboard_attributes(keylayout) -> Dict[str, str]:
+    return {
+        'group':  str(keylayout.group),
+        'id':     str(keylayout.id_),
+        'name':   str(keylayout.name),
+        'maxout': str(keylayout.maxout),
+    }
+
+
+class CompiledKeylayout(NamedTuple):
+    """ A frozen snapshot of a keylayout, holding everything needed to render
+    it, as made by «Keylayout.compile».
+
+    A compiled keylayout cannot be changed, and shares nothing mutable with the
+    keylayout it was compiled from, so several threads can compile and render
+    keylayouts at the same time without locks. It can be rendered by a
+    KeylayoutXMLFileWriter just as a Keylayout can. The states it uses are
+    shared with the mapping they were taken from, and must not be changed.
+
+    Properties:
+        group (int): The group number for the keyboard.
+        id_ (int): The unique ID number for the keyboard.
+        name (str): The name of the keyboard.
+        maxout (int): The max number of unicode characters which can be output
+            at a time.
+        default_index (int): The default index for the keyboard.
+        layouts (Tuple[Mapping[str, str], ...]): The attributes of each layout
+            of the keyboard.
+        key_map_select (Mapping[int, Tuple[str, ...]]): The modifier keys which
+            select each index of the key map. These are minimized if the
+            keylayout was compiled with «minimize» set.
+        key_map (ArrayKeyMap): The output of each key, by index.
+        actions (Tuple[Action, ...]): The actions of the key map.
+        used_states (Tuple[State, ...]): The states used by the keyboard.
+        fingerprint (str): The hex digest of a sha256 hash of all of the
+            above (with <key_map_select> as minimized, if it was), and of the
+            version of Symboard which compiled it. Two compiled keylayouts with
+            the same fingerprint render the same contents (apart from the dates
+            they were created).
+    """
+    group: int
+    id_: int
+    name: str
+    maxout: int
+    default_index: int
+    layouts: Tuple[Mapping[str, str], ...]
+    key_map_select: Mapping[int, Tuple[str, ...]]
+    key_map: ArrayKeyMap
+    actions: Tuple[Action, ...]
+    used_states: Tuple[State, ...]
+    fingerprint: str
+
+    def keyboard_attributes(self) -> Dict[str, str]:
+        """
+        Returns:
+            (Dict[int, str]): The group, id, name and maxout of the keyboard.
+        """
+        return _keyboard_attributes(self)
+
+    def __repr__(self) -> str:
+        return 'CompiledKeylayout({}, (id: {}))'.format(self.name, self.id_)
 
 
 class Keylayout:
@@ -51,6 +161,16 @@ class Keylayout:
             be entered if they are pressed.
         key_map (Dict[int, Dict[int, str]]): A dictionary containing the
             mappings of all inputs and outputs of the keyboard, for all states.
+            When a class inheriting from Keylayout is defined, its key map is
+            compiled into a read only ArrayKeyMap, which every instance of the
+            class shares.
+        key_map_overrides (Dict[int, Dict[int, str]]): Set by a keylayout
+            which is derived from another, instead of <key_map>, to define only
+            the outputs which differ from the key map it inherits. An output of
+            None removes an inherited key. The inherited key map is overlaid
+            with these overrides, and flattened the first time the keylayout
+            is instantiated. The overrides are then cleared, as changing them
+            would no longer change the key map.
     """
 
     # Universal defaults
@@ -64,13 +184,62 @@ class Keylayout:
     default_index: int = 0
 
     # These settings are configured by the child classes of «Keylayout».
-    layouts: List[Dict[str, str]] = []
-    key_map_select: Dict[int, str] = {}
-    key_map: dict = {}
+    layouts: List[Dict[str, str]] = ()
+    key_map_select: Dict[int, str] = MappingProxyType({})
+    key_map: dict = ArrayKeyMap()
+    key_map_overrides: dict = None
+
+    # Immutable, so that nothing can be shared between instances by mistake.
+    # Each instance sets its own actions and used states.
+    actions: tuple = ()
+    used_states: tuple = ()
+    states_list: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Only compile key maps which the class defines itself, as inherited
+        # key maps have already been compiled.
+        if 'key_map' in cls.__dict__ \
+                and not isinstance(cls.key_map, (ArrayKeyMap, OverlayKeyMap)):
+            cls.key_map = ArrayKeyMap(cls.key_map)
+
+        if 'key_map_overrides' in cls.__dict__:
+            cls.key_map = OverlayKeyMap(cls.key_map, cls.key_map_overrides)
+
+    @classmethod
+    def compile_key_map(cls) -> ArrayKeyMap:
+        """ Flattens the key map of the class, if it is overlaid on the key map
+        of another keylayout, and clears the class's <key_map_overrides>, which
+        are part of the flattened key map. This is only done once per class.
 
-    actions: set = set()
-    used_states: list = list()
-    states_list: list = list()
+        Returns:
+            ArrayKeyMap: The key map of the class.
+        """
+        if isinstance(cls.key_map, OverlayKeyMap):
+            cls.key_map = cls.key_map.flatten()
+            cls.key_map_overrides = None
+        return cls.key_map
+
+    @classmethod
+    def modifier_table(cls) -> ModifierTable:
+        """ Compiles the key map select of the class into the modifier states
+        which select each index. This is only done once per class.
+
+        Returns:
+            ModifierTable: The compiled key map select of the class.
+
+        Raises:
+            ModifierExpressionException: If the key map select refers to an
+                unknown modifier key.
+        """
+        # Looked up in the class's own namespace, as a subclass may select its
+        # indices differently to its parent.
+        cached = cls.__dict__.get('_modifier_table')
+        if cached is None or cached[0] is not cls.key_map_select:
+            cached = (cls.key_map_select, ModifierTable(cls.key_map_select))
+            cls._modifier_table = cached
+        return cached[1]
 
     def keyboard_attributes(self):
         """
@@ -82,25 +251,151 @@ class Keylayout:
                     - name
                     - maxout
         """
-        return {
-            'group':  str(self.group),
-            'id':     str(self.id_),
-            'name':   str(self.name),
-            'maxout': str(self.maxout),
-        }
+        return _keyboard_attributes(self)
 
     def set_actions_from_key_map(self):
-        self.actions = [
-            output
-            for index in self.key_map.values()
-            for key, output in index.items()
-            if isinstance(output, Action)
-        ]
+        """ Sets <actions> to every distinct Action in <key_map>, in sorted
+        order.
+
+        As a compiled key map is read only, its actions are only found once
+        per class, and the same tuple is shared by every instance. The actions
+        of a key map which an instance has set itself are found every time.
+        """
+        key_map = self.key_map
+        if not isinstance(key_map, ArrayKeyMap):
+            self.actions = _actions_in_key_map(key_map)
+            return
+
+        # Looked up in the class's own namespace, as a subclass with a
+        # different key map must not use the actions of its parent.
+        cls = type(self)
+        cached = cls.__dict__.get('_key_map_actions')
+        if cached is None or cached[0] is not key_map:
+            cached = (key_map, _actions_in_key_map(key_map))
+            cls._key_map_actions = cached
+        self.actions = cached[1]
+
+    def _used_states(self, states: Mapping[str, State]) -> List[State]:
+        # The next states of the key map's actions are only named by them, and
+        # are resolved here, so that defining a keylayout never loads states.
+        state_names = list(self.states_list)
+        seen = set(state_names)
+        for action in self.actions:
+            if action.next_ is not None and action.next_ not in seen:
+                seen.add(action.next_)
+                state_names.append(action.next_)
+
+        used_states = [states[state_name] for state_name in state_names]
+
+        # used_states grows as it is walked, so that every chained state is
+        # visited once, however deep the chain.
+        for state in used_states:
+            for next_state in state.action_to_next_map.values():
+                if next_state not in seen:
+                    seen.add(next_state)
+                    used_states.append(states[next_state])
+
+        return used_states
 
     def create_used_states(self, states) -> bool:
-        self.used_states = [
-            states[state_name] for state_name in self.states_list
-        ]
+        """ Sets <used_states> to the states named in <states_list>, followed
+        by the next states of the key map's actions which are not listed, and
+        then every state which can only be reached from them through a chain of
+        dead keys, in the order they are first reached.
+
+        Args:
+            states (Mapping[str, State]): The states to choose from, by name.
+        """
+        self.used_states = self._used_states(states)
+
+    def compile(
+        self,
+        states: Mapping[str, State] = None,
+        minimize: bool = None,
+    ) -> CompiledKeylayout:
+        """ Compiles the keylayout into a frozen snapshot, which can be
+        rendered while other keylayouts are compiled or rendered in other
+        threads.
+
+        Args:
+            states (Mapping[str, State], optional): The states to choose the
+                keylayout's used states from, by name. For concurrent compiles,
+                this should be an immutable mapping such as a StateSnapshot. If
+                not given, the states set by «create_used_states» are used.
+            minimize (bool, optional): Whether to rewrite the modifier
+                expressions of each index of <key_map_select> as few
+                expressions as possible. Defaults to <MINIMIZE_KEY_MAP_SELECT>,
+                as it is when the keylayout is compiled.
+
+        Returns:
+            CompiledKeylayout: A snapshot of the keylayout as it is now, with a
+                fingerprint of its content.
+        """
+        used_states = self._used_states(states) if states is not None \
+            else self.used_states
+        key_map = self.key_map if isinstance(self.key_map, ArrayKeyMap) \
+            else ArrayKeyMap(self.key_map)
+
+        # Each part is added to the fingerprint as it is compiled, so that the
+        # content is only walked once.
+        fingerprint = _Fingerprint()
+        fingerprint.update('version', VERSION)
+        fingerprint.update(
+            'keyboard', self.group, self.id_, self.name, self.maxout,
+            self.default_index,
+        )
+
+        layouts = []
+        for layout in self.layouts:
+            layout = dict(layout)
+            fingerprint.update('layout', *sorted(layout.items()))
+            layouts.append(MappingProxyType(layout))
+
+        if minimize is None:
+            minimize = MINIMIZE_KEY_MAP_SELECT
+        key_map_select = minimize_key_map_select(self.key_map_select) \
+            if minimize else self.key_map_select
+
+        compiled_key_map_select = {}
+        for index, key_strokes in sorted(key_map_select.items()):
+            if not isinstance(key_strokes, str):
+                key_strokes = tuple(key_strokes)
+            fingerprint.update('key_map_select', index, key_strokes)
+            compiled_key_map_select[index] = key_strokes
+
+        for index, outputs in key_map.items():
+            fingerprint.update('key_map', index, *(
+                (code, _canonical(output)) for code, output in outputs.items()
+            ))
+
+        actions = tuple(self.actions)
+        for action in actions:
+            fingerprint.update(*_canonical(action))
+
+        used_states = tuple(used_states or ())
+        for state in used_states:
+            fingerprint.update(
+                'state', state.name, state.terminator,
+                *sorted(state.action_to_output_map.items()),
+            )
+            fingerprint.update(
+                'next', state.name,
+                *sorted(state.action_to_next_map.items()),
+            )
+
+        return CompiledKeylayout(
+            group=self.group,
+            id_=self.id_,
+            name=self.name,
+            maxout=self.maxout,
+            default_index=self.default_index,
+            layouts=tuple(layouts),
+            key_map_select=MappingProxyType(compiled_key_map_select),
+            key_map=key_map,
+            actions=actions,
+            used_states=used_states,
+            fingerprint=fingerprint.hexdigest(),
+        )
 
     def __str__(self):
         return 'Keylayout({}, (id: {}))'.format(self.name, self.id_)
@@ -118,5 +413,6 @@ class Keylayout:
         self.maxout = maxout
         self.name = name
         self.default_index = default_index
+        self.compile_key_map()
         self.set_actions_from_key_map()
 
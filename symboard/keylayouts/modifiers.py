@@ -0,0 +1,431 @@
+"""
+.. module:: modifiers
+   :synopsis: A compiler for the modifier expressions of a keylayout's key map
+   select, such as «anyShift? caps», into sets of modifier states held as
+   bitmasks.
+
+.. moduleauthor:: Andrew J. Young
+
+"""
+
+
+# Imports from the standard library.
+from functools import lru_cache
+from itertools import combinations, compress, product
+from typing import (
+    Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+)
+
+# Imports from the local package.
+from symboard.errors import ModifierExpressionException
+
+
+MODIFIER_KEYS: Tuple[str, ...] = (
+    'command',
+    'shift',
+    'caps',
+    'option',
+    'control',
+    'rightShift',
+    'rightOption',
+    'rightControl',
+)
+""" The modifier keys which make up a modifier state, in the order of their
+bits. This is the order of the modifier bits used by macOS (cmdKey to
+rightControlKey), so a modifier state is the high byte of a macOS modifier
+value.
+"""
+
+N_MODIFIER_STATES: int = 1 << len(MODIFIER_KEYS)
+""" The number of distinct modifier states, one for each combination of the
+modifier keys which are pressed.
+"""
+
+_BITS: Dict[str, int] = {key: 1 << i for i, key in enumerate(MODIFIER_KEYS)}
+
+_FAMILIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('anyShift', ('shift', 'rightShift')),
+    ('anyOption', ('option', 'rightOption')),
+    ('anyControl', ('control', 'rightControl')),
+    (None, ('command',)),
+    (None, ('caps',)),
+)
+""" The modifier keys grouped by the key they are a side of, along with the
+name which matches either side, if there is one.
+"""
+
+_ANY_NAMES: Tuple[str, ...] = tuple(
+    any_name for any_name, _ in _FAMILIES if any_name is not None
+)
+
+_ALL_STATES: int = (1 << N_MODIFIER_STATES) - 1
+
+
+def modifier_state(*keys: str) -> int:
+    """
+    Args:
+        *keys (str): The names of the modifier keys which are pressed, from
+            <MODIFIER_KEYS>.
+
+    Returns:
+        int: The modifier state in which exactly <keys> are pressed.
+
+    Raises:
+        ModifierExpressionException: If a key is not in <MODIFIER_KEYS>.
+    """
+    state = 0
+    for key in keys:
+        if key not in _BITS:
+            raise ModifierExpressionException(' '.join(keys), key)
+        state |= _BITS[key]
+    return state
+
+
+def states_in(states: int) -> Iterator[int]:
+    """
+    Args:
+        states (int): A set of modifier states, as a bitmask with the bit of
+            each state in the set set.
+
+    Returns:
+        Iterator[int]: The modifier states in <states>, in ascending order.
+    """
+    return compress(range(N_MODIFIER_STATES), map(
+        int, reversed(format(states, f'0{N_MODIFIER_STATES}b'))
+    ))
+
+
+def _family_patterns(
+    any_name: str, sides: Tuple[str, ...], required: Dict[str, bool],
+) -> List[int]:
+    # The keys of the family which may be pressed, and those which must be.
+    may = [side for side in sides if side in required]
+    must = [side for side in sides if required.get(side)]
+    any_required = required.get(any_name)
+
+    if any_name in required:
+        may = list(sides)
+
+    patterns = []
+    for pattern in range(1 << len(may)):
+        pressed = [side for i, side in enumerate(may) if pattern >> i & 1]
+        if not set(must) <= set(pressed):
+            continue
+        if any_required and not pressed:
+            continue
+        patterns.append(modifier_state(*pressed))
+    return patterns
+
+
+@lru_cache(maxsize=None)
+def compile_modifier_expression(expression: str) -> int:
+    """ Compiles a modifier expression, such as those in a key map select, into
+    the set of modifier states it matches.
+
+    An expression lists modifier keys separated by spaces. A key is either a
+    key in <MODIFIER_KEYS>, or anyShift, anyOption or anyControl, which are
+    pressed if either side is. A key must be pressed, unless it is followed by
+    «?», in which case it may or may not be. Keys which are not listed must not
+    be pressed. The empty expression only matches when no keys are pressed.
+
+    Args:
+        expression (str): The modifier expression, such as «anyShift? caps».
+
+    Returns:
+        int: The modifier states matched by <expression>, as a bitmask with
+            bit <state> set for each matching modifier state.
+
+    Raises:
+        ModifierExpressionException: If <expression> has an unknown key.
+    """
+    # Whether each key in the expression is required (rather than optional).
+    required: Dict[str, bool] = {}
+    for term in expression.split():
+        key = term[:-1] if term.endswith('?') else term
+        if key not in _BITS and key not in _ANY_NAMES:
+            raise ModifierExpressionException(expression, key)
+        required[key] = required.get(key, False) or not term.endswith('?')
+
+    states = [0]
+    for any_name, sides in _FAMILIES:
+        patterns = _family_patterns(any_name, sides, required)
+        states = [state | pattern for state in states for pattern in patterns]
+
+    return sum(1 << state for state in set(states))
+
+
+def compile_modifier_expressions(
+    expressions: Union[str, Iterable[str]]
+) -> int:
+    """
+    Args:
+        expressions (Union[str, Iterable[str]]): A modifier expression, or a
+            list of modifier expressions, as given for an index of a key map
+            select.
+
+    Returns:
+        int: The modifier states matched by any of <expressions>, as a
+            bitmask.
+    """
+    if isinstance(expressions, str):
+        expressions = [expressions]
+
+    states = 0
+    for expression in expressions:
+        states |= compile_modifier_expression(expression)
+    return states
+
+
+class ModifierTable:
+    """ A key map select, compiled into the set of modifier states which
+    select each index, and a table of the index selected by each of the
+    <N_MODIFIER_STATES> modifier states.
+
+    As in a keylayout, a modifier state selects the first index (in the order
+    of the key map select) with an expression matching it.
+
+    Attributes:
+        index_states (Dict[int, int]): The modifier states matched by the
+            expressions of each index, as bitmasks.
+        table (Tuple[Optional[int], ...]): The index selected by each modifier
+            state, or None if no index matches it.
+    """
+    __slots__ = ('index_states', 'table')
+
+    def __init__(self, key_map_select: Mapping) -> None:
+        """
+        Args:
+            key_map_select (Mapping[int, Union[str, Iterable[str]]]): The
+                modifier expressions of each index.
+
+        Raises:
+            ModifierExpressionException: If an expression has an unknown key.
+        """
+        self.index_states: Dict[int, int] = {
+            index: compile_modifier_expressions(expressions)
+            for index, expressions in key_map_select.items()
+        }
+
+        table: List[Optional[int]] = [None] * N_MODIFIER_STATES
+        selected = 0
+        for index, states in self.index_states.items():
+            for state in states_in(states & ~selected):
+                table[state] = index
+            selected |= states
+        self.table: Tuple[Optional[int], ...] = tuple(table)
+
+    def index_of(self, state: int, default_index: int = None) -> Optional[int]:
+        """
+        Args:
+            state (int): A modifier state, in [0, N_MODIFIER_STATES).
+            default_index (int, optional): The index to return if no index
+                matches <state>.
+
+        Returns:
+            Optional[int]: The index selected by <state>.
+        """
+        index = self.table[state]
+        return default_index if index is None else index
+
+    @property
+    def covered(self) -> int:
+        """
+        Returns:
+            int: The modifier states matched by any index, as a bitmask.
+        """
+        covered = 0
+        for states in self.index_states.values():
+            covered |= states
+        return covered
+
+    @property
+    def uncovered(self) -> int:
+        """
+        Returns:
+            int: The modifier states matched by no index, which select the
+                default index of the keylayout, as a bitmask.
+        """
+        return _ALL_STATES & ~self.covered
+
+    def overlaps(self) -> Dict[Tuple[int, int], int]:
+        """
+        Returns:
+            Dict[Tuple[int, int], int]: The modifier states matched by more
+                than one index, by each pair of indices which both match them.
+                A state in an overlap selects the first index of the pair.
+        """
+        indices = list(self.index_states.items())
+        overlaps = {}
+        for i, (index, states) in enumerate(indices):
+            for other_index, other_states in indices[i + 1:]:
+                if states & other_states:
+                    overlaps[(index, other_index)] = states & other_states
+        return overlaps
+
+
+_SIDED_TERMS: Tuple[Tuple[Tuple[int, ...], str], ...] = (
+    ((0,), ''),
+    ((1,), '{left}'),
+    ((2,), '{right}'),
+    ((3,), '{left} {right}'),
+    ((0, 1), '{left}?'),
+    ((0, 2), '{right}?'),
+    ((1, 3), '{left} {right}?'),
+    ((2, 3), '{left}? {right}'),
+    ((1, 2, 3), '{any}'),
+    ((0, 1, 2, 3), '{any}?'),
+)
+""" Each set of presses of the two sides of a modifier key which an expression
+can match, and the terms which match it. A press is 0 for neither side, 1 for
+the left, 2 for the right and 3 for both.
+"""
+
+_UNSIDED_TERMS: Tuple[Tuple[Tuple[int, ...], str], ...] = (
+    ((0,), ''),
+    ((1,), '{key}'),
+    ((0, 1), '{key}?'),
+)
+""" Each set of presses of a modifier key with a single side which an
+expression can match, and the term which matches it.
+"""
+
+_TERM_ORDER: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    _FAMILIES[0], _FAMILIES[4], _FAMILIES[1], _FAMILIES[3], _FAMILIES[2],
+)
+""" The order in which the terms of a minimized expression are written, which
+is the order the keylayouts in this package write them in.
+"""
+
+
+def _term_options(
+    any_name: str, sides: Tuple[str, ...]
+) -> List[Tuple[int, str]]:
+    # The modifier states matched by, and the term of, each option.
+    options = []
+    for presses, term in (_SIDED_TERMS if any_name else _UNSIDED_TERMS):
+        side_states = [
+            modifier_state(*(
+                side for i, side in enumerate(sides) if press >> i & 1
+            ))
+            for press in presses
+        ]
+        family = modifier_state(*sides)
+        states = sum(
+            1 << state for state in range(N_MODIFIER_STATES)
+            if state & family in side_states
+        )
+        options.append((states, term.format(
+            left=sides[0], right=sides[-1], any=any_name, key=sides[0],
+        )))
+    return options
+
+
+@lru_cache(maxsize=1)
+def _cubes() -> Dict[int, str]:
+    # Every expression which can be written with at most one term for each
+    # modifier key, by the modifier states it matches. These are the «cubes»
+    # which minimization chooses between.
+    cubes: Dict[int, str] = {}
+    for options in product(*(
+        _term_options(any_name, sides) for any_name, sides in _TERM_ORDER
+    )):
+        states = _ALL_STATES
+        for option_states, _ in options:
+            states &= option_states
+        expression = ' '.join(term for _, term in options if term)
+        # Several expressions can match the same states; keep the shortest.
+        if states not in cubes or len(expression) < len(cubes[states]):
+            cubes[states] = expression
+    return cubes
+
+
+def _minimal_cover(on: int, allowed: int) -> List[int]:
+    # The prime implicants: the cubes within <allowed> matching some of <on>,
+    # which are not within a larger such cube.
+    valid = [
+        cube for cube in _cubes() if cube & on and not cube & ~allowed
+    ]
+    valid.sort(key=lambda cube: -bin(cube).count('1'))
+    primes: List[int] = []
+    for cube in valid:
+        if not any(cube & ~prime == 0 for prime in primes):
+            primes.append(cube)
+
+    # Primes which are the only ones to match a state are always chosen.
+    chosen: List[int] = []
+    for state in states_in(on):
+        matching = [prime for prime in primes if prime >> state & 1]
+        if len(matching) == 1 and matching[0] not in chosen:
+            chosen.append(matching[0])
+
+    remaining = on
+    for cube in chosen:
+        remaining &= ~cube
+    candidates = [prime for prime in primes if prime & remaining]
+
+    # Search for the fewest of the other primes which match the rest of the
+    # states, while that is feasible, and choose greedily otherwise.
+    if len(candidates) <= 16:
+        for n_cubes in range(len(candidates) + 1):
+            for cubes in combinations(candidates, n_cubes):
+                covered = 0
+                for cube in cubes:
+                    covered |= cube
+                if not remaining & ~covered:
+                    return chosen + list(cubes)
+
+    while remaining:
+        cube = max(candidates, key=lambda cube: bin(cube & remaining).count(
+            '1'
+        ))
+        chosen.append(cube)
+        remaining &= ~cube
+    return chosen
+
+
+def minimize_key_map_select(key_map_select: Mapping) -> Dict[int, List[str]]:
+    """ Rewrites the modifier expressions of each index of a key map select as
+    few expressions as possible, such that every modifier state selects the
+    same index as before.
+
+    The states each index selects are found with a ModifierTable, and covered
+    with as few expressions as possible in the manner of the Quine–McCluskey
+    algorithm: every largest expression (prime implicant) which matches only
+    states the index selects, or states selected by an earlier index (which
+    take precedence, so may be matched freely), is found, and the fewest of
+    them covering the states are chosen. The expressions of an index are kept
+    as they are if they cannot be made fewer.
+
+    Args:
+        key_map_select (Mapping[int, Union[str, Iterable[str]]]): The
+            modifier expressions of each index.
+
+    Returns:
+        Dict[int, List[str]]: The minimized modifier expressions of each index,
+            in the same order.
+
+    Raises:
+        ModifierExpressionException: If an expression has an unknown key.
+    """
+    table = ModifierTable(key_map_select)
+
+    minimized: Dict[int, List[str]] = {}
+    earlier = 0
+    for index, expressions in key_map_select.items():
+        expressions = [expressions] if isinstance(expressions, str) \
+            else list(expressions)
+        selected = table.index_states[index] & ~earlier
+
+        if selected:
+            cubes = _minimal_cover(selected, selected | earlier)
+            if len(cubes) < len(expressions):
+                # Larger cubes first, as the keylayouts in this package do.
+                expressions = [
+                    _cubes()[cube] for cube in sorted(
+                        cubes, key=lambda cube: -bin(cube).count('1')
+                    )
+                ]
+
+        minimized[index] = expressions
+        earlier |= table.index_states[index]
+    return minimized
@@ -12,9 +12,9 @@ import logging
 
 # Imports from the local package.
 from symboard.file_writers import KeylayoutXMLFileWriter
-from symboard.parsers import YamlFileParser
+from symboard.parsers import file_parser_for
 from symboard.keylayouts.builders import keylayout_from_spec
-from symboard.states import load_yaml
+from symboard.states import StateRegistry
 
 
 class Orchestrator:
@@ -36,21 +36,26 @@ class Orchestrator:
         """
         logging.info(f'Parsing the contents from {input_path}.')
 
-        keylayout_spec = YamlFileParser.parse(
+        keylayout_spec = file_parser_for(input_path).parse(
             input_path, case_sensitive = True,
         )
 
-        logging.info(f'Importing states from the states directory.')
-
-        states = load_yaml()
-
         logging.info(f'Creating the keyboard object from the specification.')
 
         keylayout = keylayout_from_spec(keylayout_spec)
-        keylayout.create_used_states(states)
+
+        logging.info(f'Resolving the states used by the keyboard.')
+
+        # Only the files defining the states in keylayout.states_list are read.
+        compiled_keylayout = keylayout.compile(StateRegistry())
+
+        logging.info(
+            f'Compiled the keylayout, with fingerprint '
+            f'{compiled_keylayout.fingerprint}.'
+        )
 
         logging.info(f'Trying to write the keylayout to disk at {output_path}.')
 
         file_writer = KeylayoutXMLFileWriter()
-        file_writer.write(keylayout, output_path)
+        file_writer.write(compiled_keylayout, output_path)
 
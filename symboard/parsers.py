@@ -8,13 +8,34 @@
 """
 
 # Imports from third party packages.
-from yaml import safe_load
-from typing import Dict, Any
-from os.path import isfile
+from collections import OrderedDict
+from json import load as json_load
+from yaml import load as yaml_load, load_all as yaml_load_all
+from threading import Lock
+from types import MappingProxyType
+from typing import (
+    Dict, Any, Callable, IO, Iterator, List, NamedTuple, Tuple
+)
+from os import stat
+from os.path import isfile, splitext
 import logging
 
+# libyaml is an optional dependency of PyYAML, which parses yaml in C. It is
+# many times faster than the pure python loader, so is used when available.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# msgpack is an optional dependency, only needed to parse msgpack files.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Package internal imports
 from symboard.errors import ParserException, NotAFileException
+from settings import PARSE_CACHE_MAX_ENTRIES
 
 
 class Parser:
@@ -65,10 +86,194 @@ class FileParser(Parser):
         pass
 
 
-class YamlFileParser(FileParser):
-    """ A file parser which parses yaml files, using the method «parse» as the
-    exposed API function for parsing.
+def safe_load(stream: IO) -> Any:
+    """ Parses a yaml document using only standard yaml tags, like
+    «yaml.safe_load», but using libyaml when it is available.
+
+    Args:
+        stream (IO): The stream (or string) containing the yaml document.
+
+    Returns:
+        Any: The python object described by the yaml document.
+    """
+    return yaml_load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream: IO) -> Iterator[Any]:
+    """ Lazily parses every document in a stream of yaml documents (separated
+    by «---»), like «yaml.safe_load_all», but using libyaml when it is
+    available.
+
+    Args:
+        stream (IO): The stream (or string) containing the yaml documents.
+
+    Returns:
+        Iterator[Any]: The python objects described by each yaml document. Each
+            document is only parsed when it is asked for.
+    """
+    return yaml_load_all(stream, Loader=SafeLoader)
+
+
+def freeze(obj: Any) -> Any:
+    """ Returns an immutable copy of a parsed document, in which every dict is
+    replaced by a read only view (a MappingProxyType) and every list by a tuple.
+
+    Args:
+        obj (Any): The parsed document to freeze.
+
+    Returns:
+        Any: The frozen document.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+class ParseCacheStats(NamedTuple):
+    """ A snapshot of the counters kept by a ParseCache.
+
+    Properties:
+        hits (int): The number of parses answered from the cache.
+        misses (int): The number of parses which had to read their file.
+        evictions (int): The number of entries removed to make room for others.
+        size (int): The number of entries currently held.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ParseCache:
+    """ A size bounded, least recently used cache of parsed files, for use by
+    processes which parse the same files many times.
+
+    Entries are keyed by the path, inode, modification time (in nanoseconds)
+    and size of the file, so an edited or replaced file is read again. The
+    parsed documents are frozen (see «freeze»), as they are shared between
+    every caller which parses the same file. The cache is safe to share between
+    threads.
+
+    Attributes:
+        max_entries (int): The most entries the cache holds before it evicts
+            the least recently used one.
+    """
+    def __init__(self, max_entries: int = PARSE_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _key(file_path: str, read: Callable) -> Tuple:
+        file_stat = stat(file_path)
+        return (
+            file_path,
+            read,
+            file_stat.st_ino,
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+        )
+
+    def get_or_parse(self, file_path: str, read: Callable[[str], Any]) -> Any:
+        """
+        Args:
+            file_path (str): The path of the file to parse.
+            read (Callable[[str], Any]): The function which reads and parses
+                <file_path>, if it is not in the cache.
+
+        Returns:
+            Any: The frozen contents of <file_path>.
+        """
+        key = self._key(file_path, read)
+
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        parsed = freeze(read(file_path))
+
+        with self._lock:
+            self._misses += 1
+
+            # Any older entries for this file can never be hit again.
+            for old_key in [k for k in self._entries if k[:2] == key[:2]]:
+                del self._entries[old_key]
+
+            self._entries[key] = parsed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return parsed
+
+    def invalidate(self, file_path: str = None) -> None:
+        """ Removes the entries for <file_path> from the cache, or every entry
+        if no path is given.
+
+        Args:
+            file_path (str, optional): The path of the file to forget.
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == file_path]:
+                    del self._entries[key]
+
+    def stats(self) -> ParseCacheStats:
+        """
+        Returns:
+            ParseCacheStats: The current counters of the cache.
+        """
+        with self._lock:
+            return ParseCacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries)
+            )
+
+
+class StructuredFileParser(FileParser):
+    """ A generic implementation of a parser for files containing a structured
+    document (such as a yaml or json file), which describes a dict. Children of
+    this class only need to implement «_load», and set «_READ_MODE» if they read
+    binary files.
+
+    Attributes:
+        cache (ParseCache): The cache used by all structured file parsers, or
+            None if files are read every time they are parsed (the default).
+            See «enable_parse_cache».
     """
+    _READ_MODE: str = 'r'
+    _FORMAT: str = 'structured'
+
+    cache: ParseCache = None
+
+    @staticmethod
+    def _load(stream: IO) -> Dict:
+        """ A generic implementation of loading a document from a stream, which
+        should be overwritten by children of this class.
+
+        Args:
+            stream (IO): The opened file to load the document from.
+        """
+        pass
+
+    @classmethod
+    def _load_all(cls, stream: IO) -> Iterator[Dict]:
+        """ Lazily loads every document from a stream. Children of this class
+        should overwrite this if their format can hold more than one document;
+        by default, the stream is treated as a single document.
+
+        Args:
+            stream (IO): The opened file to load the documents from.
+        """
+        yield cls._load(stream)
 
     @staticmethod
     def _try_lower(obj: object) -> object:
@@ -79,20 +284,49 @@ class YamlFileParser(FileParser):
 
     @staticmethod
     def _lower_dict(dict_: Dict[str, Any]) -> Dict[str, Any]:
-        return {k.lower(): YamlFileParser._try_lower(v)
+        return {k.lower(): StructuredFileParser._try_lower(v)
             for k, v in dict_.items()
         }
 
-    @staticmethod
-    def parse(file_path: str, case_sensitive: bool = True) -> Dict:
-        """ An implementation of parsing yaml files.
+    @classmethod
+    def _read(cls, file_path: str) -> Dict:
+        logging.info(f'Reading {cls._FORMAT} file from disk at {file_path}.')
+
+        with open(file_path, cls._READ_MODE) as stream:
+            return cls._load(stream)
+
+    @classmethod
+    def _read_all(cls, file_path: str) -> List[Dict]:
+        logging.info(
+            f'Reading every {cls._FORMAT} document from disk at {file_path}.'
+        )
+
+        with open(file_path, cls._READ_MODE) as stream:
+            return [
+                document for document in cls._load_all(stream)
+                if document is not None
+            ]
+
+    @classmethod
+    def _stream_all(cls, file_path: str) -> Iterator[Dict]:
+        logging.info(f'Streaming {cls._FORMAT} documents from {file_path}.')
+
+        with open(file_path, cls._READ_MODE) as stream:
+            for document in cls._load_all(stream):
+                if document is not None:
+                    yield document
+
+    @classmethod
+    def parse(cls, file_path: str, case_sensitive: bool = True) -> Dict:
+        """ An implementation of parsing structured files.
 
         Args:
-            file_path (str): The path of the yaml file to parse.
+            file_path (str): The path of the file to parse.
 
         Returns:
             Dict: A dictionary containing the parsed data contained by the
-                specified yaml file.
+                specified file. If the parse cache is enabled, this dictionary
+                is read only.
 
         Raises:
             ParserException: If the path does not exist or is not a file; or if
@@ -103,17 +337,17 @@ class YamlFileParser(FileParser):
             if not isfile(file_path):
                 raise NotAFileException(file_path)
 
-            logging.info(f'Reading yaml file from disk at {file_path}.')
-
-            with open(file_path, 'r') as stream:
-                parsed_dict = safe_load(stream)
+            if cls.cache is None:
+                parsed_dict = cls._read(file_path)
+            else:
+                parsed_dict = cls.cache.get_or_parse(file_path, cls._read)
 
             logging.info(f'Case sensitive parsing is set to {case_sensitive}.')
 
             if not case_sensitive:
-                logging.info(f'Converting yaml contents to lower case.')
+                logging.info(f'Converting {cls._FORMAT} contents to lower case.')
 
-                parsed_dict = YamlFileParser._lower_dict(parsed_dict)
+                parsed_dict = cls._lower_dict(parsed_dict)
 
             return parsed_dict
 
@@ -122,3 +356,144 @@ class YamlFileParser(FileParser):
                 f'Could not read file contents from «{file_path}».'
             )
 
+    @classmethod
+    def parse_all(
+        cls, file_path: str, case_sensitive: bool = True
+    ) -> Iterator[Dict]:
+        """ Lazily parses a file which may contain several documents, such as a
+        yaml file whose documents are separated by «---». Empty documents are
+        skipped.
+
+        If the parse cache is disabled, only one document is held in memory at
+        a time, so large generated bundles can be read in constant memory. If
+        it is enabled, every document of the file is parsed at once, and the
+        frozen list of documents is cached like the result of «parse», so that
+        state files parsed repeatedly are only read once.
+
+        Args:
+            file_path (str): The path of the file to parse.
+
+        Returns:
+            Iterator[Dict]: The dictionary described by each document. If the
+                parse cache is enabled, these dictionaries are read only.
+
+        Raises:
+            ParserException: If the path does not exist or is not a file; or if
+            some other error occurs.
+        """
+        if not isfile(file_path):
+            raise NotAFileException(file_path)
+
+        try:
+            if cls.cache is None:
+                documents = cls._stream_all(file_path)
+            else:
+                documents = cls.cache.get_or_parse(file_path, cls._read_all)
+
+            for document in documents:
+                if not case_sensitive:
+                    document = cls._lower_dict(document)
+                yield document
+        except Exception:
+            raise ParserException(
+                f'Could not read file contents from «{file_path}».'
+            )
+
+
+class YamlFileParser(StructuredFileParser):
+    """ A file parser which parses yaml files, using the method «parse» as the
+    exposed API function for parsing.
+    """
+    _FORMAT: str = 'yaml'
+
+    @staticmethod
+    def _load(stream: IO) -> Dict:
+        return safe_load(stream)
+
+    @classmethod
+    def _load_all(cls, stream: IO) -> Iterator[Dict]:
+        return safe_load_all(stream)
+
+
+class JsonFileParser(StructuredFileParser):
+    """ A file parser which parses json files, using the method «parse» as the
+    exposed API function for parsing. Json files must describe the same
+    structure as their yaml equivalents.
+    """
+    _FORMAT: str = 'json'
+
+    @staticmethod
+    def _load(stream: IO) -> Dict:
+        return json_load(stream)
+
+
+class MsgpackFileParser(StructuredFileParser):
+    """ A file parser which parses msgpack files, using the method «parse» as
+    the exposed API function for parsing. Msgpack files must describe the same
+    structure as their yaml equivalents.
+
+    This parser requires the optional dependency «msgpack» to be installed.
+    """
+    _READ_MODE: str = 'rb'
+    _FORMAT: str = 'msgpack'
+
+    @staticmethod
+    def _load(stream: IO) -> Dict:
+        if msgpack is None:
+            raise ParserException('msgpack must be installed to parse msgpack.')
+
+        return msgpack.unpack(stream, raw=False)
+
+    @classmethod
+    def _load_all(cls, stream: IO) -> Iterator[Dict]:
+        if msgpack is None:
+            raise ParserException('msgpack must be installed to parse msgpack.')
+
+        return msgpack.Unpacker(stream, raw=False)
+
+
+def enable_parse_cache(
+    max_entries: int = PARSE_CACHE_MAX_ENTRIES
+) -> ParseCache:
+    """ Makes every structured file parser share a new ParseCache.
+
+    Args:
+        max_entries (int): The most files the cache should hold.
+
+    Returns:
+        ParseCache: The new cache, which can be used to read its counters or
+            invalidate entries.
+    """
+    StructuredFileParser.cache = ParseCache(max_entries)
+    return StructuredFileParser.cache
+
+
+def disable_parse_cache() -> None:
+    """ Stops structured file parsers from using a cache.
+    """
+    StructuredFileParser.cache = None
+
+
+EXTENSION_TO_FILE_PARSER_MAP: Dict[str, StructuredFileParser] = {
+    '.yaml': YamlFileParser,
+    '.yml': YamlFileParser,
+    '.json': JsonFileParser,
+    '.msgpack': MsgpackFileParser,
+    '.mpk': MsgpackFileParser,
+}
+""" A map between file extensions and the parser used to parse files with that
+extension. Files with any other extension are parsed as yaml.
+"""
+
+
+def file_parser_for(file_path: str) -> StructuredFileParser:
+    """
+    Args:
+        file_path (str): The path of the file to get a parser for.
+
+    Returns:
+        StructuredFileParser: The parser for files with the extension of
+            <file_path>, defaulting to YamlFileParser.
+    """
+    _, extension = splitext(file_path)
+    return EXTENSION_TO_FILE_PARSER_MAP.get(extension.lower(), YamlFileParser)
@@ -0,0 +1,129 @@
+"""
+.. module:: state_cache
+   :synopsis: A persistent cache of fully built states, so that unchanged state
+   files do not need to be parsed and built again on every run.
+
+.. moduleauthor:: Andrew J. Young
+
+"""
+
+
+# Imports from the standard library.
+from hashlib import sha256
+from functools import partial
+from os.path import isfile, join
+from pickle import HIGHEST_PROTOCOL, dump, load
+from typing import Callable, Dict
+import logging
+
+# Imports from this package.
+from symboard.actions import State
+from symboard.state_index import (
+    content_hash, file_fingerprint, write_atomically
+)
+from settings import STATE_CACHE_DIR, VERSION
+
+
+_ENTRY_FORMAT: int = 4
+""" The version of the layout of cache entries. Entries written with any other
+format are discarded and rebuilt.
+"""
+
+
+class StateCache:
+    """ A cache of the states built from each state file, stored on disk inside
+    <cache_dir>.
+
+    Each state file has its own cache entry, which records the modification
+    time, size and content hash of the file, and the version of Symboard which
+    built it. An entry is used if the version matches and either the
+    modification time and size, or the content hash, of the file still match.
+    Otherwise the file is built again, and the entry replaced.
+
+    As entries are pickled, <cache_dir> must not be writable by anyone other
+    than the user running Symboard. By default it is inside the user's own
+    cache directory, and it is created readable only by that user.
+
+    Attributes:
+        cache_dir (str): The directory which cache entries are stored in, or
+            None if states should always be built from their files.
+    """
+    def __init__(self, cache_dir: str = STATE_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, file_path: str) -> str:
+        file_name = sha256(file_path.encode('utf-8')).hexdigest()
+        return join(self.cache_dir, file_name + '.pickle')
+
+    def _read_entry(self, entry_path: str) -> dict:
+        if not isfile(entry_path):
+            return None
+
+        try:
+            with open(entry_path, 'rb') as file_:
+                return load(file_)
+        except Exception:
+            logging.warning(f'Discarding unreadable state cache {entry_path}.')
+            return None
+
+    def _write_entry(self, entry_path: str, entry: dict) -> None:
+        try:
+            write_atomically(
+                entry_path,
+                partial(dump, entry, protocol=HIGHEST_PROTOCOL),
+                binary=True,
+            )
+        except OSError:
+            logging.warning(f'Could not write state cache to {entry_path}.')
+
+    def get_or_build(
+        self,
+        file_path: str,
+        build: Callable[[str], Dict[str, State]],
+    ) -> Dict[str, State]:
+        """
+        Args:
+            file_path (str): The path of the state file to get states from.
+            build (Callable[[str], Dict[str, State]]): A function which builds
+                all of the states in a state file from its path. It is only
+                called if the cache has no valid entry for <file_path>.
+
+        Returns:
+            Dict[str, State]: All of the states defined in <file_path>, by name.
+        """
+        if self.cache_dir is None:
+            return build(file_path)
+
+        entry_path = self._entry_path(file_path)
+        entry = self._read_entry(entry_path)
+        fingerprint = file_fingerprint(file_path)
+
+        if entry is not None and entry.get('format') == _ENTRY_FORMAT \
+                and entry['version'] == VERSION \
+                and entry['file_path'] == file_path:
+            if entry['mtime_ns'] == fingerprint['mtime_ns'] \
+                    and entry['size'] == fingerprint['size']:
+                return entry['states']
+
+            # The file was touched, but may not have changed.
+            hash_ = content_hash(file_path)
+            if entry['hash'] == hash_:
+                entry.update(fingerprint)
+                self._write_entry(entry_path, entry)
+                return entry['states']
+        else:
+            hash_ = content_hash(file_path)
+
+        logging.info(f'Building states from file {file_path}.')
+
+        states = build(file_path)
+        self._write_entry(entry_path, dict(
+            fingerprint,
+            format=_ENTRY_FORMAT,
+            version=VERSION,
+            file_path=file_path,
+            hash=hash_,
+            states=states,
+        ))
+
+        return states
@@ -0,0 +1,301 @@
+"""
+.. module:: state_index
+   :synopsis: A persisted index of which file in the states directory defines
+   each state, so that a state can be loaded without reading every state file.
+
+.. moduleauthor:: Andrew J. Young
+
+"""
+
+
+# Imports from the standard library.
+from hashlib import sha256
+from contextlib import suppress
+from functools import partial
+from json import dump, load
+from os import makedirs, remove, replace, stat, walk
+from os.path import dirname, isfile, join
+from tempfile import mkstemp
+from typing import IO, Callable, Dict, List, NamedTuple
+import logging
+
+# Imports from this package.
+from symboard.parsers import file_parser_for
+from settings import STATES_DIR, STATE_INDEX_PATH
+
+
+_MANIFEST_FORMAT: int = 1
+""" The version of the manifest's layout on disk. Manifests with any other
+format are discarded and rebuilt.
+"""
+
+
+class StateIndexEntry(NamedTuple):
+    """ The location of a single state inside the states directory.
+
+    Properties:
+        file_path (str): The path of the file which defines the state.
+        content_hash (str): The sha256 hash of the contents of <file_path> at
+            the time it was indexed.
+        position (int): The position of the state inside <file_path>, starting
+            from 0.
+    """
+    file_path: str
+    content_hash: str
+    position: int
+
+
+def state_file_paths(states_dir: str = STATES_DIR) -> List[str]:
+    """
+    Args:
+        states_dir (str): The directory to search for state files. Defaults to
+            <STATES_DIR>.
+
+    Returns:
+        List[str]: The path of every file inside <states_dir>, in sorted order.
+    """
+    return sorted(
+        join(root, file_name)
+        for root, _, file_names in walk(states_dir)
+        for file_name in file_names
+    )
+
+
+def file_fingerprint(file_path: str) -> Dict[str, int]:
+    """
+    Args:
+        file_path (str): The path of the file to fingerprint.
+
+    Returns:
+        Dict[str, int]: The modification time (in nanoseconds) and size of
+            <file_path>. These are cheap to get, and change whenever the
+            contents of the file are likely to have changed.
+    """
+    file_stat = stat(file_path)
+    return {'mtime_ns': file_stat.st_mtime_ns, 'size': file_stat.st_size}
+
+
+def content_hash(file_path: str) -> str:
+    """
+    Args:
+        file_path (str): The path of the file to hash.
+
+    Returns:
+        str: The hex digest of the sha256 hash of the contents of <file_path>.
+    """
+    with open(file_path, 'rb') as file_:
+        return sha256(file_.read()).hexdigest()
+
+
+def write_atomically(
+    path: str,
+    write: Callable[[IO], None],
+    binary: bool = False,
+) -> None:
+    """ Writes the file at <path> by calling <write> with a new temporary file
+    in the same directory, which then replaces <path>. Concurrent readers
+    therefore never see a half written file, and concurrent writers each write
+    to their own temporary file. Missing directories are created, readable
+    only by the current user.
+
+    Args:
+        path (str): The path of the file to write.
+        write (Callable[[IO], None]): A function which writes the contents of
+            the file to the file object it is given.
+        binary (bool): Iff true, the file is opened in binary mode.
+
+    Raises:
+        OSError: If the file could not be written.
+    """
+    directory = dirname(path) or '.'
+    makedirs(directory, mode=0o700, exist_ok=True)
+
+    descriptor, temp_path = mkstemp(dir=directory, suffix='.tmp')
+    try:
+        if binary:
+            file_ = open(descriptor, 'wb')
+        else:
+            file_ = open(descriptor, 'w', encoding='utf-8')
+        with file_:
+            write(file_)
+        replace(temp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            remove(temp_path)
+        raise
+
+
+class StateIndex:
+    """ A manifest which maps the name of every state in a states directory to
+    the file which defines it, the hash of that file, and the state's position
+    inside it.
+
+    The manifest is stored as json at <index_path>. When it is refreshed, only
+    files whose modification time or size have changed are hashed, and only
+    files whose hash has changed are parsed. Files are visited in sorted order,
+    and if two files define a state with the same name, the first one wins.
+    Only the names of the states in a file are kept, and its documents are
+    streamed, so indexing holds at most one document in memory at a time.
+
+    Attributes:
+        states_dir (str): The directory containing the indexed state files.
+        index_path (str): The path the manifest is persisted to, or None if the
+            manifest should only be kept in memory.
+    """
+    def __init__(
+        self,
+        states_dir: str = STATES_DIR,
+        index_path: str = STATE_INDEX_PATH,
+    ) -> None:
+        self.states_dir = states_dir
+        self.index_path = index_path
+        self._files: Dict[str, dict] = {}
+        self._entries: Dict[str, StateIndexEntry] = None
+
+    def _read_manifest(self) -> None:
+        if self.index_path is None or not isfile(self.index_path):
+            return
+
+        try:
+            with open(self.index_path, 'r') as file_:
+                manifest = load(file_)
+
+            if manifest['format'] == _MANIFEST_FORMAT \
+                    and manifest['states_dir'] == self.states_dir:
+                self._files = manifest['files']
+        except Exception:
+            logging.warning(
+                f'Discarding unreadable state index at {self.index_path}.'
+            )
+
+    def _write_manifest(self) -> None:
+        if self.index_path is None:
+            return
+
+        manifest = {
+            'format': _MANIFEST_FORMAT,
+            'states_dir': self.states_dir,
+            'files': self._files,
+        }
+
+        try:
+            write_atomically(
+                self.index_path,
+                partial(dump, manifest, ensure_ascii=False, sort_keys=True),
+            )
+        except OSError:
+            logging.warning(
+                f'Could not write state index to {self.index_path}.'
+            )
+
+    def _index_file(self, file_path: str, fingerprint: Dict[str, int]) -> dict:
+        old_record = self._files.get(file_path)
+        if old_record is not None and old_record['mtime_ns'] == \
+                fingerprint['mtime_ns'] and old_record['size'] == \
+                fingerprint['size']:
+            return old_record
+
+        hash_ = content_hash(file_path)
+        if old_record is not None and old_record['hash'] == hash_:
+            return dict(old_record, **fingerprint)
+
+        logging.info(f'Indexing states in file {file_path}.')
+
+        names = [
+            name
+            for document in file_parser_for(file_path).parse_all(file_path)
+            for name in document
+        ]
+        return dict(fingerprint, hash=hash_, states=names)
+
+    def refresh(self) -> None:
+        """ Brings the index up to date with the contents of <states_dir>,
+        reading as few files as possible, and persists it if anything changed.
+        """
+        if self._entries is None:
+            self._read_manifest()
+
+        files: Dict[str, dict] = {
+            file_path: self._index_file(
+                file_path, file_fingerprint(file_path)
+            )
+            for file_path in state_file_paths(self.states_dir)
+        }
+
+        changed = files != self._files
+        self._files = files
+
+        entries: Dict[str, StateIndexEntry] = {}
+        for file_path, record in files.items():
+            for position, name in enumerate(record['states']):
+                entries.setdefault(
+                    name, StateIndexEntry(file_path, record['hash'], position)
+                )
+        self._entries = entries
+
+        if changed:
+            self._write_manifest()
+
+    def _ensure_fresh(self) -> None:
+        if self._entries is None:
+            self.refresh()
+
+    def get(self, name: str) -> StateIndexEntry:
+        """
+        Args:
+            name (str): The name of the state to look up.
+
+        Returns:
+            StateIndexEntry: The location of the state called <name>, or None if
+                no indexed file defines it.
+        """
+        self._ensure_fresh()
+        return self._entries.get(name)
+
+    def names(self) -> List[str]:
+        """
+        Returns:
+            List[str]: The names of all indexed states.
+        """
+        self._ensure_fresh()
+        return list(self._entries)
+
+    def names_in_file(self, file_path: str) -> List[str]:
+        """
+        Args:
+            file_path (str): The path of an indexed state file.
+
+        Returns:
+            List[str]: The names of the states which the index uses the
+                definitions in <file_path> for, in the order they are defined.
+        """
+        self._ensure_fresh()
+        record = self._files.get(file_path)
+        if record is None:
+            return []
+
+        return [
+            name for name in record['states']
+            if self._entries[name].file_path == file_path
+        ]
+
+    def file_hash(self, file_path: str) -> str:
+        """
+        Args:
+            file_path (str): The path of an indexed state file.
+
+        Returns:
+            str: The content hash of <file_path> at the time it was indexed, or
+                None if it is not indexed.
+        """
+        self._ensure_fresh()
+        record = self._files.get(file_path)
+        return record['hash'] if record is not None else None
+
+    def file_paths(self) -> List[str]:
+        """
+        Returns:
+            List[str]: The paths of all indexed state files, in sorted order.
+        """
+        self._ensure_fresh()
+        return list(self._files)
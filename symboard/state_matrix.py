@@ -0,0 +1,246 @@
+"""
+.. module:: state_matrix
+   :synopsis: A compact, columnar table of the transitions of every state used
+   by a keylayout, indexed by action.
+
+.. moduleauthor:: Andrew J. Young
+
+"""
+
+
+# Imports from the standard library.
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Imports from this package.
+from symboard.actions import State
+
+
+_OUTPUT: int = 0
+_NEXT: int = 1
+
+TRANSITION_KINDS: Tuple[str, ...] = ('output', 'next')
+""" The kinds of transition in a StateMatrix, by their id. Each is also the
+name of the attribute of a «when» element which holds the transition's value.
+"""
+
+
+class StringPool:
+    """ An interned pool of strings, where each distinct string is stored once
+    and referred to by its position in the pool.
+
+    Attributes:
+        strings (List[str]): The strings in the pool, in the order they were
+            first added.
+    """
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def add(self, string: str) -> int:
+        """
+        Args:
+            string (str): The string to add to the pool.
+
+        Returns:
+            int: The id of <string> in the pool. Adding a string which is
+                already in the pool returns the id it was first given.
+        """
+        id_ = self._ids.get(string)
+        if id_ is None:
+            id_ = len(self.strings)
+            self._ids[string] = id_
+            self.strings.append(string)
+        return id_
+
+    def id_of(self, string: str) -> int:
+        """
+        Returns:
+            int: The id of <string> in the pool, or None if it is not in it.
+        """
+        return self._ids.get(string)
+
+    def __getitem__(self, id_: int) -> str:
+        return self.strings[id_]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class StateMatrix:
+    """ A transition table of states × actions → (next state | output), holding
+    every binding of every state used by a keylayout.
+
+    Rather than keeping a dict per state, state names, action ids and outputs
+    are each interned into a StringPool, and the bindings are stored as
+    parallel arrays of pool ids, grouped by action (in compressed sparse row
+    form). A binding either outputs a string, or leads to the next state of a
+    chain of dead keys, in which case its value is the name of that state.
+    Within each action, bindings keep the order of the states they came from.
+    Memory is therefore proportional to the number of bindings, and all of the
+    transitions of an action can be read in one pass, however deep the chains
+    of dead keys are.
+
+    Attributes:
+        states (StringPool): The names of the states, in the order given,
+            without duplicates.
+        terminators (List[str]): The terminator of each state, by state id.
+        action_ids (StringPool): The ids of every bound action.
+        outputs (StringPool): Every distinct output.
+        action_offsets (array): For the action with id «i», its bindings are
+            at positions action_offsets[i] up to action_offsets[i + 1] of the
+            binding arrays.
+        binding_states (array): The state id of each binding.
+        binding_outputs (array): The output id of each binding, which is the
+            id of the name of the next state for «next» bindings.
+        binding_kinds (array): The id of the kind of each binding, as given by
+            <TRANSITION_KINDS>.
+    """
+    def __init__(self) -> None:
+        self.states = StringPool()
+        self.terminators: List[str] = []
+        self.action_ids = StringPool()
+        self.outputs = StringPool()
+        self.action_offsets = array('I', [0])
+        self.binding_states = array('I')
+        self.binding_outputs = array('I')
+        self.binding_kinds = array('B')
+
+    @classmethod
+    def from_states(cls, states: Iterable[State]) -> 'StateMatrix':
+        """
+        Args:
+            states (Iterable[State]): The states to put into the table. If
+                several states have the same name, only the first is used.
+
+        Returns:
+            StateMatrix: A table of all the bindings of <states>.
+        """
+        matrix = cls()
+        bindings: List[Tuple[int, int, int, int]] = []
+
+        for state in states or []:
+            if matrix.states.id_of(state.name) is not None:
+                continue
+
+            state_id = matrix.states.add(state.name)
+            matrix.terminators.append(state.terminator)
+            action_to_next_map = state.action_to_next_map
+
+            for action_id, output in state.action_to_output_map.items():
+                # Leading to another state overrides any output.
+                if action_id not in action_to_next_map:
+                    bindings.append((
+                        matrix.action_ids.add(action_id),
+                        state_id,
+                        matrix.outputs.add(output),
+                        _OUTPUT,
+                    ))
+
+            for action_id, next_state in action_to_next_map.items():
+                bindings.append((
+                    matrix.action_ids.add(action_id),
+                    state_id,
+                    matrix.outputs.add(next_state),
+                    _NEXT,
+                ))
+
+        # A counting sort by action, which keeps the order of the states.
+        counts = [0] * (len(matrix.action_ids) + 1)
+        for action, _, _, _ in bindings:
+            counts[action + 1] += 1
+        for i in range(len(matrix.action_ids)):
+            counts[i + 1] += counts[i]
+        matrix.action_offsets = array('I', counts)
+
+        positions = list(counts[:-1])
+        matrix.binding_states = array('I', [0]) * len(bindings)
+        matrix.binding_outputs = array('I', [0]) * len(bindings)
+        matrix.binding_kinds = array('B', [0]) * len(bindings)
+
+        for action, state_id, output, kind in bindings:
+            position = positions[action]
+            matrix.binding_states[position] = state_id
+            matrix.binding_outputs[position] = output
+            matrix.binding_kinds[position] = kind
+            positions[action] += 1
+
+        return matrix
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of bindings in the table.
+        """
+        return len(self.binding_states)
+
+    def transitions_for_action(
+        self, action_id: str
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Args:
+            action_id (str): The id of the action to get the transitions of.
+
+        Returns:
+            Iterator[Tuple[str, str, str]]: The (state name, kind, value) of
+                every state which binds <action_id>, in the order of the
+                states. The kind is one of <TRANSITION_KINDS>, and the value is
+                either the output, or the name of the next state.
+        """
+        action = self.action_ids.id_of(action_id)
+        if action is None:
+            return
+
+        for position in range(
+            self.action_offsets[action], self.action_offsets[action + 1]
+        ):
+            yield (
+                self.states[self.binding_states[position]],
+                TRANSITION_KINDS[self.binding_kinds[position]],
+                self.outputs[self.binding_outputs[position]],
+            )
+
+    def bindings_for_action(self, action_id: str) -> Iterator[Tuple[str, str]]:
+        """
+        Args:
+            action_id (str): The id of the action to get the bindings of.
+
+        Returns:
+            Iterator[Tuple[str, str]]: The (state name, output) pairs of every
+                state which outputs something for <action_id>, in the order of
+                the states.
+        """
+        for state_name, kind, value in self.transitions_for_action(action_id):
+            if kind == 'output':
+                yield state_name, value
+
+    def _transition(self, state_name: str, action_id: str, kind: str) -> str:
+        for name, kind_, value in self.transitions_for_action(action_id):
+            if name == state_name:
+                return value if kind_ == kind else None
+        return None
+
+    def output(self, state_name: str, action_id: str) -> str:
+        """
+        Args:
+            state_name (str): The name of the state.
+            action_id (str): The id of the action.
+
+        Returns:
+            str: The output of <action_id> while in the state <state_name>, or
+                None if the state does not output anything for the action.
+        """
+        return self._transition(state_name, action_id, 'output')
+
+    def next_state(self, state_name: str, action_id: str) -> str:
+        """
+        Args:
+            state_name (str): The name of the state.
+            action_id (str): The id of the action.
+
+        Returns:
+            str: The name of the state entered when <action_id> occurs while in
+                the state <state_name>, or None if the action does not lead to
+                another state.
+        """
+        return self._transition(state_name, action_id, 'next')
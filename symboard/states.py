@@ -10,56 +10,595 @@
 
 
 # Imports from the standard library.
-from os import walk
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import cpu_count
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
 import logging
 
 # Imports from this package.
-from symboard.parsers import YamlFileParser
+from symboard.parsers import file_parser_for
 from symboard.actions import State
-from settings import STATE_ATTRIBUTE_PRECEDENCE, STATES_DIR
+from symboard.state_cache import StateCache
+from symboard.errors import DuplicateStateException, StateCompositionException
+from symboard.state_index import StateIndex, state_file_paths
+from settings import (
+    STATE_CACHE_DIR,
+    STATE_LOADER_PROCESSES,
+    STATES_DIR,
+)
+
+
+def iter_states(file_path: str) -> Iterator[State]:
+    """ Lazily builds the states defined in a state file, one at a time.
+
+    A state file can be a bundle of several documents (in yaml, separated by
+    «---»), each of which defines some states. Unless the parse cache is
+    enabled, only one document is held in memory at a time, so generated
+    bundles of any size can be loaded without reading them into memory in
+    full.
+
+    Args:
+        file_path (str): The path of the file to load states from. Yaml, json
+            and msgpack files are supported.
+
+    Returns:
+        Iterator[State]: The states defined in <file_path>, in order.
+    """
+    logging.info(f'Importing states from file {file_path}.')
+
+    for document in file_parser_for(file_path).parse_all(file_path):
+        for name, attribs in document.items():
+            yield State.from_attributes(name, attribs)
+
+
+def _states_from_file(file_path: str) -> Dict[str, State]:
+    """
+    Args:
+        file_path (str): The path of the file to load states from.
+
+    Returns:
+        Dict[str, State]: All of the states defined in <file_path>, by name.
+    """
+    return {state.name: state for state in iter_states(file_path)}
+
+
+class StateComposer:
+    """ Composes states which extend or include other states, by name.
+
+    Composition is memoized, so each composed state is built once, and the same
+    State object is returned every time it is asked for. States which neither
+    extend nor include others are returned as they are.
+
+    Attributes:
+        lookup (Callable[[str], State]): A function which returns the state with
+            a given name, as defined in its state file. It raises a KeyError if
+            there is no such state.
+    """
+    def __init__(self, lookup: Callable[[str], State]) -> None:
+        self.lookup = lookup
+        self._composed: Dict[str, State] = {}
+        self._composing: List[str] = []
+
+    def _base(self, name: str, base_name: str) -> State:
+        try:
+            return self.compose(base_name)
+        except KeyError:
+            raise StateCompositionException(
+                f'State «{name}» is based on the unknown state «{base_name}».'
+            )
+
+    def compose(self, name: str) -> State:
+        """
+        Args:
+            name (str): The name of the state to compose.
+
+        Returns:
+            State: The state called <name>, composed with every state which it
+                extends or includes.
+
+        Raises:
+            KeyError: If there is no state called <name>.
+            StateCompositionException: If a state which <name> is based on does
+                not exist, or is based on <name> itself.
+        """
+        composed = self._composed.get(name)
+        if composed is not None:
+            return composed
+
+        if name in self._composing:
+            cycle = self._composing[self._composing.index(name):] + [name]
+            raise StateCompositionException(
+                'States are based on each other in a cycle: '
+                + ' → '.join(f'«{state_name}»' for state_name in cycle)
+            )
+
+        state = self.lookup(name)
+
+        if state.is_composed:
+            self._composing.append(name)
+            try:
+                included = [
+                    self._base(name, base_name) for base_name in state.includes
+                ]
+                extended = self._base(name, state.extends) \
+                    if state.extends is not None else None
+            finally:
+                self._composing.pop()
+
+            state = state.compose(included, extended)
+
+        self._composed[name] = state
+        return state
+
+
+def compose_states(states: Dict[str, State]) -> Dict[str, State]:
+    """
+    Args:
+        states (Dict[str, State]): States by name, as defined in their files.
+
+    Returns:
+        Dict[str, State]: <states>, where every state which extends or includes
+            others is composed with them.
+
+    Raises:
+        StateCompositionException: If a state is based on a state which is not
+            in <states>, or states are based on each other in a cycle.
+    """
+    composer = StateComposer(states.__getitem__)
+    return {name: composer.compose(name) for name in states}
 
 
 def load_yaml():
-    """ Loads all yaml files which can be found in the folder <STATES_DIR>, and
-    adds them to an object «states», which can then be imported and used
-    throughout the project.
+    """ Loads all yaml files which can be found in the folder <STATES_DIR>, in
+    this process and without a cache. Files are visited in the same order as
+    by «load_states_parallel» and «StateRegistry», so if several files define a
+    state with the same name, the first file wins.
+
+    Returns:
+        Dict[str, State]: All of the states defined in <STATES_DIR>, by name.
     """
     logging.info(
         f'Creating yaml states object using files from folder «{STATES_DIR}».'
     )
 
-    states: Dict[State] = {}
+    return load_states_parallel(STATES_DIR, processes=1, cache_dir=None)
+
 
-    for _, _, file_names in walk(STATES_DIR):
-        for file_name in file_names:
-            logging.info(f'Importing yaml states from file {file_name}.')
+def _cached_states_from_file(
+    cache_dir: str, file_path: str
+) -> Dict[str, State]:
+    # A module level function, so that it can be sent to worker processes.
+    return StateCache(cache_dir).get_or_build(file_path, _states_from_file)
 
-            file_path = STATES_DIR + '/' + file_name
 
-            contents = YamlFileParser.parse(file_path)
+def load_states_parallel(
+    states_dir: str = STATES_DIR,
+    processes: int = STATE_LOADER_PROCESSES,
+    cache_dir: str = STATE_CACHE_DIR,
+    strict: bool = False,
+) -> Dict[str, State]:
+    """ Loads every state file in <states_dir>, spreading the files across a
+    pool of worker processes.
 
-            for name, attribs in contents.items():
-                new_state = State(
-                    name=name,
-                    # Using .get allows us to pass in a None argument without
-                    # raising an error.
-                    terminator=attribs.get('terminator'),
+    The states from each file are merged in the sorted order of their file
+    paths (see «state_file_paths»), so the result does not depend on which
+    worker finishes first. If several files define a state with the same name,
+    the first file wins (as it does for the «StateIndex», and so the
+    «StateRegistry»), and every duplicate is reported in that same order.
+    States are composed once every file has been merged, so they can be based
+    on states in any file.
+
+    Args:
+        states_dir (str): The directory to load states from. Defaults to
+            <STATES_DIR>.
+        processes (int, optional): The number of worker processes to use.
+            Defaults to <STATE_LOADER_PROCESSES>, or one per CPU if that is
+            None. If 1, files are loaded in this process.
+        cache_dir (str, optional): The directory of the «StateCache» used by
+            the workers, or None to build every file.
+        strict (bool): Whether to raise an error for duplicate state names,
+            rather than logging a warning.
+
+    Returns:
+        Dict[str, State]: All of the states defined in <states_dir>, by name.
+
+    Raises:
+        DuplicateStateException: If <strict> is set and more than one file
+            defines a state with the same name.
+    """
+    file_paths = state_file_paths(states_dir)
+    processes = processes or cpu_count() or 1
+    load = partial(_cached_states_from_file, cache_dir)
+
+    logging.info(
+        f'Loading {len(file_paths)} state files from «{states_dir}» using '
+        f'{processes} processes.'
+    )
+
+    if processes == 1 or len(file_paths) <= 1:
+        loaded = map(load, file_paths)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunk_size = max(1, len(file_paths) // (processes * 4))
+            loaded = list(
+                executor.map(load, file_paths, chunksize=chunk_size)
+            )
+
+    return compose_states(_merge_files(zip(file_paths, loaded), strict))
+
+
+def _merge_files(
+    loaded: Iterable[Tuple[str, Dict[str, State]]], strict: bool = False
+) -> Dict[str, State]:
+    """
+    Args:
+        loaded (Iterable[Tuple[str, Dict[str, State]]]): The path of each state
+            file, and the states defined in it, in sorted order of path.
+        strict (bool): Whether to raise an error for duplicate state names,
+            rather than logging a warning.
+
+    Returns:
+        Dict[str, State]: The states of every file, by name. If several files
+            define a state with the same name, the first file wins.
+
+    Raises:
+        DuplicateStateException: If <strict> is set and more than one file
+            defines a state with the same name.
+    """
+    states: Dict[str, State] = {}
+    defined_in: Dict[str, str] = {}
+    duplicates: Dict[str, List[str]] = {}
+
+    for file_path, states_in_file in loaded:
+        for name, state in states_in_file.items():
+            if name in states:
+                duplicates.setdefault(name, [defined_in[name]]).append(
+                    file_path
                 )
+            else:
+                states[name] = state
+                defined_in[name] = file_path
 
-                for attrib in STATE_ATTRIBUTE_PRECEDENCE:
-                    if attribs.get(attrib):
-                        method = new_state.builder_method_from_attrib_name(
-                            attrib
-                        )
-                        new_state = method(attribs[attrib])
+    if duplicates:
+        if strict:
+            raise DuplicateStateException(duplicates)
 
-                states[name] = new_state
+        for name, paths in duplicates.items():
+            logging.warning(
+                f'State «{name}» is defined in {", ".join(paths)}. Using the '
+                f'definition from {paths[0]}.'
+            )
 
     return states
 
 
-states = load_yaml()
+class StateRegistry(Mapping):
+    """ A read only mapping from state names to states, which only reads state
+    files from disk when a state inside them is first asked for.
+
+    A «StateIndex» is used to find the file which defines a state, so looking
+    up a state only reads that file, and a keylayout which uses no states never
+    reads a state file at all. Each file is read at most once, and the states
+    built from it are taken from a «StateCache» if the file has not changed.
+
+    States which extend or include others are composed with them (reading the
+    files which define those states) when first asked for, and the composed
+    state is then returned every time it is asked for again.
+
+    Iterating over the registry (or asking for its length) requires every
+    state, and so loads every remaining file.
+
+    Attributes:
+        states_dir (str): The directory which states are loaded from.
+        index (StateIndex): The index used to find the file defining a state.
+        cache (StateCache): The cache of states built from each file.
+    """
+    def __init__(
+        self,
+        states_dir: str = STATES_DIR,
+        index: StateIndex = None,
+        cache: StateCache = None,
+    ) -> None:
+        """
+        Args:
+            states_dir (str): The directory to load states from. Defaults to
+                <STATES_DIR>.
+            index (StateIndex, optional): The index of <states_dir> to use.
+                Defaults to the persisted index of <states_dir>.
+            cache (StateCache, optional): The cache to take built states from.
+                Defaults to a cache in <STATE_CACHE_DIR>.
+        """
+        self.states_dir = states_dir
+        self.index = index if index is not None else StateIndex(states_dir)
+        self.cache = cache if cache is not None else StateCache()
+        self._states: Dict[str, State] = {}
+        self._read_paths: Set[str] = set()
+        self._composer = StateComposer(self._defined_state)
+
+    def _load_file(self, file_path: str) -> None:
+        self._read_paths.add(file_path)
+
+        file_states = self.cache.get_or_build(file_path, _states_from_file)
+
+        for name, state in file_states.items():
+            entry = self.index.get(name)
+            # When several files define the same name, only keep the state
+            # from the file that the index chose.
+            if entry is not None and entry.file_path == file_path:
+                self._states[name] = state
+
+    def _load_all(self) -> None:
+        for file_path in self.index.file_paths():
+            if file_path not in self._read_paths:
+                self._load_file(file_path)
+
+    def __getitem__(self, name: str) -> State:
+        """
+        Args:
+            name (str): The name of the state to get.
+
+        Returns:
+            State: The state called <name>, composed with any states it is
+                based on.
+
+        Raises:
+            KeyError: If no file in <states_dir> defines a state called <name>.
+            StateCompositionException: If the state is based on a state which
+                does not exist, or states are based on each other in a cycle.
+        """
+        return self._composer.compose(name)
+
+    def _defined_state(self, name: str) -> State:
+        # The state called <name> as defined in its file, before composition.
+        if name not in self._states:
+            entry = self.index.get(name)
+            if entry is None or entry.file_path in self._read_paths:
+                raise KeyError(name)
+
+            logging.info(
+                f'Resolving state «{name}» from file {entry.file_path}.'
+            )
+            self._load_file(entry.file_path)
+
+            if name not in self._states:  # The index was out of date.
+                raise KeyError(name)
+
+        return self._states[name]
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_all()
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        self._load_all()
+        return len(self._states)
+
+    def bases_of(self, name: str) -> List[str]:
+        """
+        Args:
+            name (str): The name of a state.
+
+        Returns:
+            List[str]: The names of every state which the state called <name>
+                extends or includes, directly or through other states, in the
+                order they are first reached.
+
+        Raises:
+            KeyError: If there is no state called <name>, or a state it is based
+                on.
+        """
+        bases: List[str] = []
+        pending: List[str] = [name]
+
+        while pending:
+            state = self._defined_state(pending.pop(0))
+            for base_name in (*state.includes, state.extends):
+                if base_name is not None and base_name != name \
+                        and base_name not in bases:
+                    bases.append(base_name)
+                    pending.append(base_name)
+
+        return bases
+
+    def resolve(self, names: Iterable[str]) -> List[State]:
+        """
+        Args:
+            names (Iterable[str]): The names of the states to get.
+
+        Returns:
+            List[State]: The states called <names>, in the same order.
+        """
+        return [self[name] for name in names]
+
+
+class StateSnapshot(Mapping):
+    """ An immutable, fully loaded and composed view of every state in a states
+    directory, as it was at one point in time.
+
+    A snapshot is never changed once it is made, so a compile which holds onto
+    one sees the same states however many times the library is reloaded while
+    it runs.
+
+    Attributes:
+        version (int): The version of the library which the snapshot was made
+            from. Versions start at 1, and increase by 1 on each reload which
+            finds a change.
+        file_hashes (Mapping[str, str]): The content hash of each state file
+            which the snapshot was made from, by path.
+    """
+    def __init__(
+        self,
+        version: int,
+        states: Dict[str, State],
+        file_hashes: Dict[str, str],
+        file_states: Dict[str, Dict[str, State]],
+    ) -> None:
+        """
+        Args:
+            version (int): The version of the snapshot.
+            states (Dict[str, State]): The composed states, by name.
+            file_hashes (Dict[str, str]): The content hash of each state file.
+            file_states (Dict[str, Dict[str, State]]): The states defined in
+                each state file, before composition, so that a later snapshot
+                can reuse those of files which have not changed.
+        """
+        self.version = version
+        self.file_hashes = MappingProxyType(file_hashes)
+        self._states = MappingProxyType(states)
+        self._file_states = MappingProxyType(file_states)
+
+    def __getitem__(self, name: str) -> State:
+        return self._states[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def defined_in_file(
+        self, file_path: str, content_hash: str
+    ) -> Dict[str, State]:
+        """
+        Args:
+            file_path (str): The path of a state file.
+            content_hash (str): The current content hash of <file_path>.
+
+        Returns:
+            Dict[str, State]: The states this snapshot built from <file_path>,
+                before composition, if the file's hash was <content_hash>.
+                Otherwise, None.
+        """
+        if self.file_hashes.get(file_path) != content_hash:
+            return None
+        return self._file_states[file_path]
+
+
+class StateLibrary(Mapping):
+    """ A reloadable library of every state in a states directory, for long
+    running processes which need to pick up edited state files without being
+    restarted.
+
+    The library always holds a complete «StateSnapshot». Reloading builds a new
+    snapshot beside the current one, copy on write: the states of files whose
+    content has not changed are taken from the current snapshot rather than
+    built again, and any composed state which is unchanged keeps the State
+    object it had before. The new snapshot then replaces the current one in a
+    single assignment, so readers see either the old snapshot or the new one,
+    and never a mix of the two.
+
+    Looking up a state through the library uses whichever snapshot is current
+    at the time. Anything which looks up several states (such as a compile)
+    should take one snapshot and use it throughout, for a consistent view.
+
+    Attributes:
+        states_dir (str): The directory which states are loaded from.
+        index (StateIndex): The index used to find the state files, and which
+            of them have changed.
+        cache (StateCache): The cache of states built from each file.
+    """
+    def __init__(
+        self,
+        states_dir: str = STATES_DIR,
+        index: StateIndex = None,
+        cache: StateCache = None,
+    ) -> None:
+        """
+        Args:
+            states_dir (str): The directory to load states from. Defaults to
+                <STATES_DIR>.
+            index (StateIndex, optional): The index of <states_dir> to use.
+                Defaults to the persisted index of <states_dir>.
+            cache (StateCache, optional): The cache to take built states from.
+                Defaults to a cache in <STATE_CACHE_DIR>.
+        """
+        self.states_dir = states_dir
+        self.index = index if index is not None else StateIndex(states_dir)
+        self.cache = cache if cache is not None else StateCache()
+        self._snapshot: StateSnapshot = None
+        self._reload_lock = Lock()
+
+    def snapshot(self) -> StateSnapshot:
+        """
+        Returns:
+            StateSnapshot: The current snapshot of the library. The library is
+                loaded if it has not been yet.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.reload()
+        return snapshot
+
+    def reload(self) -> StateSnapshot:
+        """ Brings the library up to date with the files in <states_dir>. Only
+        files which have changed since the last reload are read.
+
+        Returns:
+            StateSnapshot: The new current snapshot. If no file has changed
+                since the last reload, this is the current snapshot.
+
+        Raises:
+            StateCompositionException: If a state is based on a state which
+                does not exist, or states are based on each other in a cycle.
+                The current snapshot is kept.
+        """
+        with self._reload_lock:
+            previous = self._snapshot
+            self.index.refresh()
+
+            file_hashes: Dict[str, str] = {
+                file_path: self.index.file_hash(file_path)
+                for file_path in self.index.file_paths()
+            }
+            if previous is not None and file_hashes == previous.file_hashes:
+                return previous
+
+            file_states: Dict[str, Dict[str, State]] = {}
+            for file_path, hash_ in file_hashes.items():
+                states_in_file = previous.defined_in_file(file_path, hash_) \
+                    if previous is not None else None
+                if states_in_file is None:
+                    states_in_file = self.cache.get_or_build(
+                        file_path, _states_from_file
+                    )
+                file_states[file_path] = states_in_file
+
+            states = compose_states(_merge_files(file_states.items()))
+
+            if previous is not None:
+                # Keep the objects of unchanged states, so that anything
+                # holding them (or comparing them by identity) is unaffected.
+                for name, state in states.items():
+                    old_state = previous.get(name)
+                    if old_state is not None and old_state == state:
+                        states[name] = old_state
+
+            version = previous.version + 1 if previous is not None else 1
+            logging.info(
+                f'Loaded version {version} of the states in '
+                f'«{self.states_dir}».'
+            )
+
+            self._snapshot = StateSnapshot(
+                version, states, file_hashes, file_states
+            )
+            return self._snapshot
+
+    def __getitem__(self, name: str) -> State:
+        return self.snapshot()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+
+states = StateRegistry()
 """ An object containing all states found inside <STATES_DIR>, which can be
-imported and used throughout the project.
+imported and used throughout the project. States are loaded on demand.
 """
-
@@ -0,0 +1,270 @@
+"""
+.. module:: symbol_index
+   :synopsis: A persisted, inverted index from each output of the state library
+   to the states, and the actions within them, which produce it.
+
+.. moduleauthor:: Andrew J. Young
+
+"""
+
+
+# Imports from the standard library.
+from functools import partial
+from json import dump, load
+from os.path import isfile
+from typing import Dict, List, NamedTuple
+from unicodedata import category, normalize
+import logging
+
+# Imports from this package.
+from symboard.state_cache import StateCache
+from symboard.state_index import StateIndex, write_atomically
+from symboard.states import StateRegistry
+from settings import STATES_DIR, SYMBOL_INDEX_PATH
+
+
+_SYMBOL_INDEX_FORMAT: int = 3
+""" The version of the symbol index's layout on disk. Indexes with any other
+format are discarded and rebuilt.
+"""
+
+
+class SymbolIndexEntry(NamedTuple):
+    """ A single way of producing an output from the state library.
+
+    Properties:
+        state (str): The name of the state which produces the output.
+        action (str): The id of the action which produces the output while in
+            <state>.
+        terminator (str): The terminator of <state>.
+    """
+    state: str
+    action: str
+    terminator: str
+
+
+def search_key(output: str) -> str:
+    """
+    Args:
+        output (str): An output, such as a character or grapheme.
+
+    Returns:
+        str: The key which <output> is indexed under. Outputs are normalized to
+            NFC, so a precomposed character (such as «ǘ») and the same
+            character written with combining marks are found by the same
+            search.
+    """
+    return normalize('NFC', output)
+
+
+_ZERO_WIDTH_JOINER: str = '\u200d'
+
+
+def graphemes(output: str) -> List[str]:
+    """
+    Args:
+        output (str): An output, such as «ǘ» or «ae».
+
+    Returns:
+        List[str]: The graphemes of <output>, in order. Each is a character
+            followed by any combining marks or emoji modifiers, and characters
+            joined by a zero width joiner are kept together. This approximates
+            Unicode's extended grapheme clusters, which is enough to split the
+            outputs of states.
+    """
+    clusters: List[str] = []
+
+    for character in output:
+        if clusters and (
+            category(character) in ('Mn', 'Mc', 'Me')
+            or '\U0001F3FB' <= character <= '\U0001F3FF'
+            or character == _ZERO_WIDTH_JOINER
+            or clusters[-1].endswith(_ZERO_WIDTH_JOINER)
+        ):
+            clusters[-1] += character
+        else:
+            clusters.append(character)
+
+    return clusters
+
+
+def _search_keys(output: str) -> List[str]:
+    # An output is found by searching for it whole, or for any of its graphemes
+    # on their own.
+    key = search_key(output)
+    return list(dict.fromkeys([key, *graphemes(key)]))
+
+
+class SymbolIndex:
+    """ An inverted index from each output of the states in a states directory
+    to every (state, action, terminator) which produces it, such as every
+    state which produces «ǘ». States are indexed as composed, so an output
+    inherited from another state is found in both.
+
+    Each output is indexed whole, and under each of its graphemes, so a state
+    which produces «ae» is found by searching for «ae», «a» or «e».
+
+    The index is persisted as json at <index_path>, as a record for each state
+    file. When it is refreshed, a file is only indexed again if it, or the file
+    now defining one of the states its states are based on, has changed.
+    Searching is a single dict lookup.
+
+    Attributes:
+        states_dir (str): The directory containing the indexed state files.
+        index_path (str): The path the index is persisted to, or None if it
+            should only be kept in memory.
+        state_index (StateIndex): The index used to find the state files, and
+            which of them have changed.
+        cache (StateCache): The cache of states built from each file.
+    """
+    def __init__(
+        self,
+        states_dir: str = STATES_DIR,
+        index_path: str = SYMBOL_INDEX_PATH,
+        state_index: StateIndex = None,
+        cache: StateCache = None,
+    ) -> None:
+        self.states_dir = states_dir
+        self.index_path = index_path
+        self.state_index = state_index if state_index is not None \
+            else StateIndex(states_dir)
+        self.cache = cache if cache is not None else StateCache()
+        self._files: Dict[str, dict] = None
+        self._postings: Dict[str, List[SymbolIndexEntry]] = None
+
+    def _read_index(self) -> Dict[str, dict]:
+        if self.index_path is None or not isfile(self.index_path):
+            return {}
+
+        try:
+            with open(self.index_path, 'r') as file_:
+                index = load(file_)
+
+            if index['format'] == _SYMBOL_INDEX_FORMAT \
+                    and index['states_dir'] == self.states_dir:
+                return index['files']
+        except Exception:
+            logging.warning(
+                f'Discarding unreadable symbol index at {self.index_path}.'
+            )
+        return {}
+
+    def _write_index(self) -> None:
+        if self.index_path is None:
+            return
+
+        index = {
+            'format': _SYMBOL_INDEX_FORMAT,
+            'states_dir': self.states_dir,
+            'files': self._files,
+        }
+
+        try:
+            write_atomically(
+                self.index_path,
+                partial(dump, index, ensure_ascii=False, sort_keys=True),
+            )
+        except OSError:
+            logging.warning(
+                f'Could not write symbol index to {self.index_path}.'
+            )
+
+    def _is_current(
+        self, record: dict, file_path: str, file_hashes: Dict[str, str]
+    ) -> bool:
+        return record is not None \
+            and record['hash'] == file_hashes[file_path] \
+            and record['states'] == self.state_index.names_in_file(file_path) \
+            and all(
+                self._file_hash_of(base_name) == hash_
+                for base_name, hash_ in record['depends'].items()
+            )
+
+    def _file_hash_of(self, name: str) -> str:
+        # The hash of the file which now defines the state called <name>.
+        entry = self.state_index.get(name)
+        return entry.content_hash if entry is not None else None
+
+    def _index_file(
+        self,
+        registry: StateRegistry,
+        file_path: str,
+        file_hashes: Dict[str, str],
+    ) -> dict:
+        logging.info(f'Indexing the outputs of states in file {file_path}.')
+
+        names = self.state_index.names_in_file(file_path)
+        postings: List[list] = []
+        depends: Dict[str, str] = {}
+
+        for name in names:
+            state = registry[name]
+
+            for action, output in state.action_to_output_map.items():
+                if output:
+                    postings.extend(
+                        [key, name, action, state.terminator]
+                        for key in _search_keys(output)
+                    )
+
+            for base_name in registry.bases_of(name):
+                if base_name not in names:
+                    depends[base_name] = self._file_hash_of(base_name)
+
+        return {
+            'hash': file_hashes[file_path],
+            'states': names,
+            'depends': depends,
+            'postings': postings,
+        }
+
+    def refresh(self) -> None:
+        """ Brings the index up to date with the contents of <states_dir>,
+        indexing as few files as possible, and persists it if anything changed.
+        """
+        old_files = self._files if self._files is not None \
+            else self._read_index()
+
+        self.state_index.refresh()
+        file_hashes: Dict[str, str] = {
+            file_path: self.state_index.file_hash(file_path)
+            for file_path in self.state_index.file_paths()
+        }
+
+        # Only read (and compose) the states of files which are indexed again.
+        registry = StateRegistry(
+            self.states_dir, index=self.state_index, cache=self.cache
+        )
+
+        files: Dict[str, dict] = {}
+        for file_path in file_hashes:
+            record = old_files.get(file_path)
+            if not self._is_current(record, file_path, file_hashes):
+                record = self._index_file(registry, file_path, file_hashes)
+            files[file_path] = record
+
+        postings: Dict[str, List[SymbolIndexEntry]] = {}
+        for record in files.values():
+            for key, *entry in record['postings']:
+                postings.setdefault(key, []).append(SymbolIndexEntry(*entry))
+
+        changed = files != old_files
+        self._files = files
+        self._postings = postings
+
+        if changed:
+            self._write_index()
+
+    def search(self, output: str) -> List[SymbolIndexEntry]:
+        """
+        Args:
+            output (str): The output to search for, such as «ǘ».
+
+        Returns:
+            List[SymbolIndexEntry]: Every state and action which produces
+                <output>, whole or as one of its graphemes, in the sorted order
+                of the files defining the states.
+        """
+        if self._postings is None:
+            self.refresh()
+        return list(self._postings.get(search_key(output), ()))
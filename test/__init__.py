@@ -0,0 +1,17 @@
+'''
+@author: Andrew J. Young
+@description: Points Symboard's cache directory at a temporary directory for
+    as long as the tests run, so that running them never writes to the user's
+    cache directory. This must happen before «settings» is first imported.
+'''
+
+# Imports from third party packages.
+from atexit import register
+from os import environ
+from shutil import rmtree
+from tempfile import mkdtemp
+
+
+_CACHE_HOME: str = mkdtemp(prefix='symboard-test-cache-')
+environ['XDG_CACHE_HOME'] = _CACHE_HOME
+register(rmtree, _CACHE_HOME, ignore_errors=True)
@@ -0,0 +1,115 @@
+'''
+@author Andrew J. Young
+@description Unit tests for the file key_maps.py
+'''
+
+# Imports from third party packages.
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from symboard.actions import Action
+from symboard.keylayouts.iso_keylayout import IsoKeylayout
+from symboard.keylayouts.key_maps import (
+    ArrayKeyMap, KeyMapIndex, OverlayKeyMap
+)
+
+
+class TestArrayKeyMap(TestCase):
+    def setUp(self):
+        self.action = Action('alt+a')
+        self.dicts = {
+            0: {0: 'a', 10: '', 126: self.action},
+            4: {1: 's'},
+        }
+        self.key_map = ArrayKeyMap(self.dicts)
+
+    def test_reads_like_nested_dicts(self):
+        self.assertEqual(self.dicts, self.key_map)
+        self.assertEqual([0, 4], list(self.key_map))
+        self.assertEqual(
+            [(0, 'a'), (10, ''), (126, self.action)],
+            list(self.key_map[0].items()),
+        )
+        self.assertEqual(['s'], list(self.key_map[4].values()))
+        self.assertEqual(3, len(self.key_map[0]))
+        self.assertEqual(
+            [(0, self.key_map[0]), (4, self.key_map[4])],
+            list(self.key_map.items()),
+        )
+        self.assertEqual(
+            [{1: 's'}], [dict(index) for index in self.key_map.values()][1:]
+        )
+
+    def test_views_of_an_index_are_shared(self):
+        index = self.key_map[0]
+
+        self.assertIs(index.items(), index.items())
+        self.assertIs(index.values(), index.values())
+        self.assertIn((10, ''), index.items())
+
+    def test_missing_codes_raise_key_errors(self):
+        for code in [1, -1, 127, 'a']:
+            with self.assertRaises(KeyError):
+                self.key_map[0][code]
+
+        self.assertNotIn(1, self.key_map[0])
+        self.assertIsNone(self.key_map[0].get(1))
+
+    def test_invalid_codes_and_outputs_raise_exceptions(self):
+        for outputs in [{128: 'a'}, {-1: 'a'}, {0: None}]:
+            with self.assertRaises(ValueError):
+                KeyMapIndex(outputs)
+
+    def test_keylayout_classes_share_an_array_key_map(self):
+        self.assertIsInstance(IsoKeylayout.key_map, ArrayKeyMap)
+        self.assertIs(
+            IsoKeylayout(1, 2).key_map, IsoKeylayout(3, 4).key_map
+        )
+
+
+class TestOverlayKeyMap(TestCase):
+    def setUp(self):
+        self.parent = ArrayKeyMap({0: {0: 'a', 1: 's', 2: 'd'}, 1: {0: 'A'}})
+        self.key_map = OverlayKeyMap(self.parent, {
+            0: {1: 'o', 2: None, 3: 'e'},
+            2: {0: 'á'},
+        })
+
+    def test_overrides_are_layered_over_the_parent(self):
+        self.assertEqual({
+            0: {0: 'a', 1: 'o', 3: 'e'},
+            1: {0: 'A'},
+            2: {0: 'á'},
+        }, self.key_map)
+
+        with self.assertRaises(KeyError):
+            self.key_map[0][2]
+        with self.assertRaises(KeyError):
+            self.key_map[3]
+
+    def test_flatten_is_an_equal_array_key_map(self):
+        flattened = self.key_map.flatten()
+
+        self.assertIsInstance(flattened, ArrayKeyMap)
+        self.assertEqual(self.key_map, flattened)
+
+    def test_derived_keylayouts_flatten_their_key_map_once(self):
+        class DerivedKeylayout(IsoKeylayout):
+            key_map_overrides = {0: {0: 'ä'}}
+
+        self.assertIsInstance(DerivedKeylayout.key_map, OverlayKeyMap)
+
+        DerivedKeylayout(1, 2)
+        key_map = DerivedKeylayout.key_map
+        DerivedKeylayout(3, 4)
+
+        self.assertIsInstance(key_map, ArrayKeyMap)
+        self.assertIs(key_map, DerivedKeylayout.key_map)
+        self.assertEqual('ä', key_map[0][0])
+        self.assertEqual(IsoKeylayout.key_map[0][1], key_map[0][1])
+        self.assertIsNone(DerivedKeylayout.key_map_overrides)
+
+
+if __name__ == '__main__':
+    unittest_main()
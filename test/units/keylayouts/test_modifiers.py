@@ -0,0 +1,145 @@
+'''
+@author Andrew J. Young
+@description Unit tests for the file modifiers.py
+'''
+
+# Imports from third party packages.
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from symboard.errors import ModifierExpressionException
+from symboard.keylayouts.iso_jdvorak_keylayout import IsoJDvorakKeylayout
+from symboard.keylayouts.iso_keylayout import IsoKeylayout
+from symboard.keylayouts.modifiers import (
+    ModifierTable,
+    compile_modifier_expression,
+    minimize_key_map_select,
+    modifier_state,
+    states_in,
+)
+
+
+def _states(*states):
+    return sum(1 << state for state in states)
+
+
+class TestCompileModifierExpression(TestCase):
+    def test_the_empty_expression_matches_no_keys_pressed(self):
+        self.assertEqual(_states(0), compile_modifier_expression(''))
+
+    def test_any_matches_either_side(self):
+        self.assertEqual(
+            _states(
+                modifier_state('shift'),
+                modifier_state('rightShift'),
+                modifier_state('shift', 'rightShift'),
+            ),
+            compile_modifier_expression('anyShift'),
+        )
+
+    def test_optional_keys_may_be_pressed(self):
+        self.assertEqual(
+            _states(
+                modifier_state('caps'),
+                modifier_state('command', 'caps'),
+            ),
+            compile_modifier_expression('caps command?'),
+        )
+
+    def test_a_side_excludes_the_other_side(self):
+        self.assertEqual(
+            _states(modifier_state('option')),
+            compile_modifier_expression('option'),
+        )
+
+    def test_unknown_keys_raise(self):
+        with self.assertRaises(ModifierExpressionException):
+            compile_modifier_expression('anyShift hyper')
+
+    def test_states_in(self):
+        self.assertEqual([0, 3, 255], list(states_in(_states(255, 0, 3))))
+
+
+class TestModifierTable(TestCase):
+    def test_the_first_matching_index_is_selected(self):
+        table = ModifierTable({
+            0: ['caps?'],
+            1: ['anyShift caps?', 'caps'],
+        })
+
+        self.assertEqual(0, table.index_of(modifier_state('caps')))
+        self.assertEqual(1, table.index_of(modifier_state('rightShift')))
+        self.assertIsNone(table.index_of(modifier_state('command')))
+        self.assertEqual(7, table.index_of(modifier_state('command'), 7))
+        self.assertEqual(
+            {(0, 1): _states(modifier_state('caps'))}, table.overlaps()
+        )
+
+    def test_iso_keylayout_indices_do_not_overlap(self):
+        table = IsoKeylayout.modifier_table()
+
+        self.assertEqual({}, table.overlaps())
+        self.assertIn(0, table.table)
+        self.assertIsNone(table.index_of(modifier_state('control', 'shift')))
+
+    def test_iso_jdvorak_keylayout_covers_every_state(self):
+        table = IsoJDvorakKeylayout.modifier_table()
+
+        self.assertEqual(0, table.uncovered)
+        self.assertNotIn(None, table.table)
+        self.assertIs(table, IsoJDvorakKeylayout.modifier_table())
+
+
+class TestMinimizeKeyMapSelect(TestCase):
+    def _assert_minimized(self, key_map_select):
+        minimized = minimize_key_map_select(key_map_select)
+
+        self.assertEqual(
+            ModifierTable(key_map_select).table, ModifierTable(minimized).table
+        )
+        for index, expressions in minimized.items():
+            self.assertLessEqual(
+                len(expressions), len(key_map_select[index])
+            )
+        return minimized
+
+    def test_overlapping_expressions_are_merged(self):
+        minimized = self._assert_minimized({
+            0: ['anyShift caps?', 'anyShift? caps'],
+            1: [
+                'anyOption',
+                'caps anyOption command?',
+                'caps? anyOption command',
+            ],
+        })
+
+        self.assertEqual(['caps? anyOption command?'], minimized[1])
+
+    def test_states_of_earlier_indices_can_be_matched(self):
+        minimized = self._assert_minimized({
+            0: ['command'],
+            1: ['', 'command?'],
+        })
+
+        self.assertEqual(['command?'], minimized[1])
+
+    def test_expressions_which_cannot_be_fewer_are_kept(self):
+        key_map_select = IsoKeylayout.key_map_select
+
+        self.assertEqual(
+            {index: list(expressions)
+             for index, expressions in key_map_select.items()},
+            self._assert_minimized(key_map_select),
+        )
+
+    def test_iso_jdvorak_keylayout(self):
+        minimized = self._assert_minimized(IsoJDvorakKeylayout.key_map_select)
+
+        self.assertEqual(
+            ['anyShift? caps? anyOption? command? anyControl?'], minimized[6]
+        )
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -1,10 +1,16 @@
 # Imports from third party packages.
+from gc import collect
+from pickle import dumps, loads
 from unittest import TestCase
 from unittest import main as unittest_main
+from unittest.mock import patch
+from weakref import ref
 
 # Imports from the local package.
-from symboard.actions import State
-from symboard.errors import AlphabetLengthException
+from symboard.actions import (
+    State, Action, Script, SCRIPTS, get_script, latin_28, register_script
+)
+from symboard.errors import AlphabetLengthException, ScriptNotFoundException
 
 
 class TestLetterCase(TestCase):
@@ -52,7 +58,167 @@ class TestLowerCase(TestLetterCase):
         self.args = []
 
 
-# TODO: Test _get_actions
+class TestCompactRepresentations(TestCase):
+    def test_instances_have_no_dict(self):
+        for object_ in [State(name='a'), Action('a'), Script(lower='a')]:
+            with self.assertRaises(AttributeError):
+                object_.__dict__
+
+    def test_outputs_are_interned(self):
+        # Build the outputs at runtime, so they are not interned as constants.
+        output = ''.join(['á', 'b'])
+        other_output = ''.join(['á', 'b'])
+
+        first = State(name='first').with_map({'a': output})
+        second = State(name='second').with_map({'a': other_output})
+
+        self.assertIs(
+            first.action_to_output_map['a'], second.action_to_output_map['a']
+        )
+
+    def test_action_next_defaults_to_none(self):
+        self.assertIsNone(Action('a').next_)
+
+
+class TestAction(TestCase):
+    def test_equal_actions_are_the_same_object(self):
+        state = State(name='acute')
+
+        self.assertIs(Action(''.join(['a', 'b'])), Action('ab'))
+        self.assertIs(Action('a', state), Action('a', state))
+        self.assertIsNot(Action('a', state), Action('a'))
+        self.assertEqual(1, len({Action('a'), Action('a')}))
+
+    def test_actions_with_equal_next_states_are_the_same_object(self):
+        self.assertIs(
+            Action('a', State(name='acute')), Action('a', State(name='acute'))
+        )
+        self.assertIs(Action('a', State(name='acute')), Action('a', 'acute'))
+
+    def test_unused_actions_are_freed(self):
+        action = ref(Action('unused'))
+        collect()
+
+        self.assertIsNone(action())
+        self.assertNotIn(('unused', None), Action._instances)
+
+    def test_actions_are_ordered_by_id_then_next_state(self):
+        state = State(name='acute')
+        actions = [Action('b'), Action('a', state), Action('a')]
+
+        self.assertEqual(
+            [Action('a'), Action('a', state), Action('b')], sorted(actions)
+        )
+        self.assertEqual(('a', 'acute'), Action('a', state).sort_key)
+
+    def test_actions_cannot_be_changed(self):
+        with self.assertRaises(AttributeError):
+            Action('a').id_ = 'b'
+
+    def test_unpickled_actions_are_interned(self):
+        self.assertIs(Action('a'), loads(dumps(Action('a'))))
+
+
+class TestFromAttributes(TestCase):
+    def test_from_attributes_is_the_same_as_chaining_builders(self):
+        attributes = {
+            'terminator': '´',
+            'lower': 'á,b́,ć,d́,é,f́,ǵ,h́,í,ȷ́,ḱ,ĺ,ḿ,ń,ó,ṕ,q́,ŕ,ś,t́,ú,v́,ẃ,x́,ý,ź',
+            'upper': 'Á,B́,Ć,D́,É,F́,Ǵ,H́,Í,J́,Ḱ,Ĺ,Ḿ,Ń,Ó,Ṕ,Q́,Ŕ,Ś,T́,Ú,V́,Ẃ,X́,Ý,Ź',
+            'map': {'a': 'à', "'": '´'},
+        }
+
+        expected = State(name='acute', terminator='´') \
+            .with_upper(attributes['upper']) \
+            .with_lower(attributes['lower']) \
+            .with_map(attributes['map'])
+
+        self.assertEqual(expected, State.from_attributes('acute', attributes))
+
+    def test_map_takes_precedence_over_cases(self):
+        state = State.from_attributes('acute', {
+            'lower': 'a,b,c,d,e,f,g,h,i,j,k,l,m,n,o,p,q,r,s,t,u,v,w,x,y,z',
+            'map': {'a': 'à'},
+        })
+
+        self.assertEqual('à', state.action_to_output_map['a'])
+        self.assertEqual('b', state.action_to_output_map['b'])
+
+    def test_missing_attributes_are_skipped(self):
+        state = State.from_attributes('empty', {})
+
+        self.assertEqual(State(name='empty'), state)
+
+    def test_from_attributes_reads_composition(self):
+        state = State.from_attributes('below', {
+            'extends': 'above', 'include': 'bar',
+        })
+
+        self.assertEqual('above', state.extends)
+        self.assertEqual(('bar',), state.includes)
+        self.assertIsNone(state.terminator)
+        self.assertTrue(state.is_composed)
+
+    def test_from_attributes_reads_next_states(self):
+        state = State.from_attributes('acute', {'next': {'alt+.': 'dot'}})
+
+        self.assertEqual({'alt+.': 'dot'}, state.action_to_next_map)
+
+    def test_compose_keeps_outputs_over_empty_outputs(self):
+        base = State(name='base', action_to_output_map={'a': 'x', 'b': 'y'})
+        state = State(
+            name='derived', extends='base',
+            action_to_output_map={'a': '', 'c': ''},
+        )
+
+        self.assertEqual(
+            {'a': 'x', 'b': 'y', 'c': ''},
+            state.compose(extended=base).action_to_output_map,
+        )
+
+    def test_builder_method_from_attrib_name(self):
+        state = State(name='acute')
+
+        self.assertEqual(state.with_map, state.builder_method_from_attrib_name(
+            'map'
+        ))
+        with self.assertRaises(KeyError):
+            state.builder_method_from_attrib_name('unknown')
+
+
+class TestScripts(TestCase):
+    def test_script_actions_are_translated_to_unicode(self):
+        self.assertEqual('\u0027', latin_28.lower_actions[26])
+        self.assertEqual('\u0022', latin_28.lower_actions[27])
+        self.assertEqual(tuple('ABCDEFGHIJKLMNOPQRSTUVWXYZ'), latin_28.actions(
+            'upper'
+        ))
+
+    def test_get_script_raises_exception_for_unknown_name(self):
+        with self.assertRaises(ScriptNotFoundException):
+            get_script('unknown')
+
+    @patch.dict(SCRIPTS)
+    def test_states_can_name_scripts_of_the_same_length(self):
+        register_script(Script(name='reversed', lower='cba'))
+        register_script(Script(name='shifted', lower='bcd'))
+
+        reversed_ = State(name='r').with_lower('1,2,3', script='reversed')
+        shifted = State(name='s').with_lower('1,2,3', script='shifted')
+
+        self.assertEqual(
+            {'c': '1', 'b': '2', 'a': '3'}, reversed_.action_to_output_map
+        )
+        self.assertEqual(
+            {'b': '1', 'c': '2', 'd': '3'}, shifted.action_to_output_map
+        )
+
+    def test_states_without_a_script_use_the_default_for_their_length(self):
+        state = State(name='s').with_lower(
+            ','.join('abcdefghijklmnopqrstuvwxyz')
+        )
+
+        self.assertEqual('z', state.action_to_output_map['z'])
 
 
 if __name__ == '__main__':
@@ -13,12 +13,15 @@ import os.path
 
 # Package internal imports.
 from symboard.keylayouts.keylayouts import Keylayout
+from symboard.keylayouts.iso_keylayout import IsoKeylayout
 from settings import VERSION
 from symboard.file_writers import (
     FileWriter,
     KeylayoutFileWriter,
     KeylayoutXMLFileWriter,
     DEFAULT_OUTPUT_PATH,
+    _REFERENCE_START,
+    escape,
 )
 from symboard.errors import (
     WriteException, KeylayoutNoneException, FileExistsException
@@ -416,6 +419,27 @@ class TestKeylayoutXMLFileWriter(TestKeylayoutFileWriter):
             expected_n_sub_elems = 2,
         )
 
+    def test_action_creates_next_sub_sub_elem_for_chained_states(self):
+        self.states_mocker.used_states[0].action_to_next_map = {
+            self.action.id_: 'chained',
+        }
+
+        self._assert_about_properties_of_sub_sub_elems(
+            self.file_writer._action,
+            keylayout = self.states_mocker,
+            path_to_sub_elems = '.action/when',
+            args = [self.action],
+            expected_tag = 'when',
+            expected_attributes = [{
+                'state': 'none',
+                'output': self.action.id_,
+            }, {
+                'state': self.state_id,
+                'next': 'chained',
+            }],
+            expected_n_sub_elems = 2,
+        )
+
     def test_terminators_creates_well_formed_sub_sub_elem(self):
         self._assert_about_properties_of_sub_sub_elems(
             self.file_writer._terminators,
@@ -429,6 +453,52 @@ class TestKeylayoutXMLFileWriter(TestKeylayoutFileWriter):
         )
 
 
+class TestEscaping(TestCase):
+    def setUp(self):
+        self.file_writer = KeylayoutXMLFileWriter()
+
+    def _references(self, escaped):
+        return escaped.replace(_REFERENCE_START, '&')
+
+    def test_control_and_markup_characters_are_escaped(self):
+        self.assertEqual(
+            '&#x001C;a&#x0022;&#x0026;&#x0027;&#x003C;&#x003E;&#x007F;é',
+            self._references(escape('\u001Ca"&\'<>\u007Fé')),
+        )
+
+    def test_the_reference_start_is_escaped(self):
+        self.assertEqual(
+            '&#xE000;', self._references(escape(_REFERENCE_START))
+        )
+
+    def test_outputs_are_escaped_only_when_written(self):
+        mock_keylayout = MagicMock(
+            key_map = {0: {0: '\u001C', 1: 'a&b'}},
+        )
+        keyboard = Element('keyboard')
+
+        self.file_writer._key_map_set(mock_keylayout, keyboard)
+
+        self.assertEqual(
+            ['&#x001C;', 'a&#x0026;b'],
+            [
+                self._references(key.get('output'))
+                for key in keyboard.iterfind('.//key')
+            ],
+        )
+
+    def test_references_in_other_text_are_escaped(self):
+        keylayout = IsoKeylayout(1, 2, name='a&#x41;<b>')
+        keylayout.key_map = {0: {0: '\u001C', 1: '&#x41;'}}
+        keylayout.actions = ()
+
+        contents = self.file_writer.contents(keylayout.compile({}))
+
+        self.assertIn('name="a&amp;#x41;&lt;b&gt;"', contents)
+        self.assertIn('<key code="0" output="&#x001C;"/>', contents)
+        self.assertIn('<key code="1" output="&#x0026;#x41;"/>', contents)
+
+
 if __name__ == '__main__':
     unittest_main()
 
@@ -1,11 +1,21 @@
 # Imports from third party packages.
+from concurrent.futures import ThreadPoolExecutor
+from os import environ, listdir, pathsep
+from os.path import abspath, dirname
+from subprocess import PIPE, run
+from sys import executable
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest import main as unittest_main
+from unittest.mock import patch
 
 # Imports from the local package.
-from symboard.keylayouts.keylayouts import Keylayout
+from symboard.actions import Action, State
+from symboard.file_writers import KeylayoutXMLFileWriter
+from symboard.keylayouts.keylayouts import CompiledKeylayout, Keylayout
 from symboard.keylayouts.iso_keylayout import IsoKeylayout
 from symboard.keylayouts.iso_dvorak_keylayout import IsoDvorakKeylayout
+from symboard.keylayouts.iso_jdvorak_keylayout import IsoJDvorakKeylayout
 
 
 class TestKeylayout(TestCase):
@@ -83,6 +93,174 @@ class TestKeylayout(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_create_used_states_follows_chains_of_dead_keys(self):
+        states = {
+            'acute': State('acute', action_to_next_map={'alt+.': 'dot'}),
+            'dot': State('dot', action_to_next_map={
+                'alt+.': 'dot', 'alt+,': 'comma',
+            }),
+            'comma': State('comma', action_to_next_map={'alt+/': 'acute'}),
+            'unused': State('unused'),
+        }
+        self.keylayout.states_list = ['acute']
+        # Only the chains from <states_list> are followed here.
+        self.keylayout.actions = ()
+
+        self.keylayout.create_used_states(states)
+
+        self.assertEqual(
+            ['acute', 'dot', 'comma'],
+            [state.name for state in self.keylayout.used_states],
+        )
+
+    def test_next_states_of_actions_are_resolved_when_compiled(self):
+        states = {
+            'acute': State('acute', terminator='´'),
+            'grave': State('grave', terminator='`'),
+        }
+        self.keylayout.key_map = {
+            0: {0: Action('alt+e', next_='acute'), 1: Action('alt+\\')},
+        }
+        self.keylayout.set_actions_from_key_map()
+        self.keylayout.states_list = ['grave']
+
+        compiled = self.keylayout.compile(states)
+
+        self.assertEqual(
+            ['grave', 'acute'],
+            [state.name for state in compiled.used_states],
+        )
+        with self.assertRaises(KeyError):
+            self.keylayout.compile({'grave': states['grave']})
+
+    def test_actions_are_shared_by_every_instance(self):
+        other = self.class_(self.GROUP, self.ID)
+
+        self.assertIsInstance(self.keylayout.actions, tuple)
+        self.assertIs(self.keylayout.actions, other.actions)
+
+    def test_actions_are_distinct_and_sorted(self):
+        self.keylayout.key_map = {
+            0: {0: Action('b'), 1: Action('a'), 2: 'x'},
+            1: {0: Action('b')},
+        }
+
+        self.keylayout.set_actions_from_key_map()
+
+        self.assertEqual(
+            (Action('a'), Action('b')), self.keylayout.actions,
+        )
+
+    def test_compile_is_a_frozen_snapshot(self):
+        states = {'acute': State('acute', terminator='´')}
+        self.keylayout.states_list = ['acute']
+        self.keylayout.actions = ()
+
+        compiled = self.keylayout.compile(states)
+        self.keylayout.states_list = []
+
+        self.assertIsInstance(compiled, CompiledKeylayout)
+        self.assertEqual((states['acute'],), compiled.used_states)
+        self.assertEqual(
+            self.keylayout.keyboard_attributes(),
+            compiled.keyboard_attributes(),
+        )
+        self.assertIsInstance(compiled.actions, tuple)
+        for layout in compiled.layouts:
+            with self.assertRaises(TypeError):
+                layout['first'] = '1'
+        with self.assertRaises(TypeError):
+            compiled.key_map_select[0] = ''
+        with self.assertRaises(AttributeError):
+            compiled.name = 'other'
+
+    def test_fingerprint_is_the_same_for_the_same_content(self):
+        states = {'acute': State('acute', terminator='´')}
+        same_states = {'acute': State('acute', terminator='´')}
+        self.keylayout.states_list = ['acute']
+        other = self.class_(
+            self.GROUP, self.ID,
+            maxout = self.MAXOUT,
+            name = self.NAME,
+            default_index = self.DEFAULT_INDEX,
+        )
+        other.states_list = ['acute']
+        self.keylayout.actions = other.actions = ()
+
+        fingerprint = self.keylayout.compile(states).fingerprint
+
+        self.assertEqual(64, len(fingerprint))
+        self.assertEqual(fingerprint, other.compile(same_states).fingerprint)
+
+    def test_fingerprint_changes_with_the_content(self):
+        states = {'acute': State('acute', terminator='´')}
+        self.keylayout.states_list = ['acute']
+        self.keylayout.actions = ()
+        fingerprint = self.keylayout.compile(states).fingerprint
+
+        states['acute'].action_to_output_map['a'] = 'á'
+        changed_state = self.keylayout.compile(states).fingerprint
+        self.keylayout.name = 'other'
+        changed_name = self.keylayout.compile(states).fingerprint
+
+        with patch('symboard.keylayouts.keylayouts.VERSION', 'other'):
+            changed_version = self.keylayout.compile(states).fingerprint
+
+        self.assertEqual(4, len({
+            fingerprint, changed_state, changed_name, changed_version
+        }))
+
+    def test_compile_can_minimize_the_key_map_select(self):
+        self.keylayout.states_list = []
+        self.keylayout.actions = ()
+        self.keylayout.key_map_select = {0: ['caps', 'caps command'], 1: ['']}
+
+        compiled = self.keylayout.compile({})
+        minimized = self.keylayout.compile({}, minimize=True)
+
+        self.assertEqual(
+            {0: ('caps', 'caps command'), 1: ('',)},
+            dict(compiled.key_map_select),
+        )
+        self.assertEqual(
+            {0: ('caps command?',), 1: ('',)}, dict(minimized.key_map_select)
+        )
+        self.assertNotEqual(compiled.fingerprint, minimized.fingerprint)
+
+    def test_compile_reads_the_minimize_setting_when_called(self):
+        self.keylayout.states_list = []
+        self.keylayout.actions = ()
+        self.keylayout.key_map_select = {0: ['caps', 'caps command']}
+
+        with patch(
+            'symboard.keylayouts.keylayouts.MINIMIZE_KEY_MAP_SELECT', True
+        ):
+            compiled = self.keylayout.compile({})
+
+        self.assertEqual(('caps command?',), compiled.key_map_select[0])
+
+    def test_compiled_keylayouts_can_be_rendered_concurrently(self):
+        states = {
+            'acute': State('acute', terminator='´', action_to_output_map={
+                'a': 'á', 'e': 'é',
+            }),
+        }
+        # The base Keylayout has no layouts, so it cannot be rendered.
+        keylayout = IsoKeylayout(self.GROUP, self.ID, self.MAXOUT)
+        keylayout.states_list = ['acute']
+        compiled = keylayout.compile(states)
+        writer = KeylayoutXMLFileWriter()
+
+        def render(_):
+            # The dates in the header are not compared.
+            return writer.contents(compiled).split('\n', 4)[4]
+
+        expected = render(None)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(executor.map(render, range(8)))
+
+        self.assertEqual([expected] * 8, actual)
+
     def _test_keylayout_str(self, class_name):
         expected = '{}({}, (id: {}))'.format(class_name, self.NAME, self.ID)
         actual = str(self.keylayout)
@@ -106,6 +284,42 @@ class TestIsoDvorakKeylayout(TestKeylayout):
         self._test_keylayout_str('IsoDvorakKeylayout')
 
 
+class TestIsoJDvorakKeylayout(TestKeylayout):
+    def setUp(self):
+        self._setUp(IsoJDvorakKeylayout)
+
+    def test_keylayout_str(self):
+        self._test_keylayout_str('IsoJDvorakKeylayout')
+
+    def test_importing_the_module_reads_and_writes_nothing(self):
+        root = dirname(dirname(dirname(abspath(__file__))))
+        script = (
+            'from symboard.parsers import YamlFileParser\n'
+            'calls = []\n'
+            'parse_all = YamlFileParser.parse_all\n'
+            'YamlFileParser.parse_all = lambda *args: calls.append(args) '
+            'or parse_all(*args)\n'
+            'import symboard.keylayouts.iso_jdvorak_keylayout\n'
+            'print(len(calls))\n'
+        )
+
+        with TemporaryDirectory() as cwd:
+            result = run(
+                [executable, '-c', script], cwd=cwd, stdout=PIPE, stderr=PIPE,
+                env=dict(environ, PYTHONPATH=root + pathsep + environ.get(
+                    'PYTHONPATH', ''
+                )),
+            )
+
+            self.assertEqual(0, result.returncode, result.stderr)
+            self.assertEqual(b'0', result.stdout.strip())
+            self.assertEqual([], listdir(cwd))
+
+    def test_actions_are_not_shared_with_the_parent_class(self):
+        self.assertEqual(144, len(self.keylayout.actions))
+        self.assertEqual((), Keylayout(self.GROUP, self.ID).actions)
+
+
 if __name__ == '__main__':
     unittest_main()
 
@@ -4,14 +4,22 @@
 '''
 
 # Package internal imports
-from symboard.parsers import YamlFileParser
+from symboard.parsers import (
+    YamlFileParser,
+    JsonFileParser,
+    MsgpackFileParser,
+    ParseCacheStats,
+    disable_parse_cache,
+    enable_parse_cache,
+    file_parser_for,
+)
 from symboard.errors import ParserException
 
 # Third party packages
-from test.utils import PARSERS_PATH
+from test.utils import PARSERS_PATH, TemporaryDirectoryTestCase
 from unittest import TestCase
 from unittest import main as unittest_main
-from unittest.mock import patch, mock_open
+from unittest.mock import MagicMock, patch, mock_open
 
 
 class TestYamlFileParser(TestCase):
@@ -97,6 +105,171 @@ class TestYamlFileParser(TestCase):
 
         self.assertEqual(expected, actual)
 
+    @patch(PARSERS_PATH + '.isfile')
+    def test_parse_all_yields_each_document(self, mock_isfile):
+        mock_isfile.return_value = True
+        read_data = 'A: B\n---\n---\nC: D\n'
+
+        with patch('builtins.open', mock_open(read_data=read_data)):
+            actual = list(YamlFileParser.parse_all(
+                self.input_file_path, case_sensitive = False
+            ))
+
+        self.assertEqual([{'a': 'b'}, {'c': 'd'}], actual)
+
+    @patch(PARSERS_PATH + '.isfile')
+    def test_parse_all_raises_error_if_not_isfile(self, mock_isfile):
+        mock_isfile.return_value = False
+
+        with self.assertRaises(ParserException):
+            list(YamlFileParser.parse_all(self.input_file_path))
+
+
+class TestJsonFileParser(TestCase):
+    @patch(PARSERS_PATH + '.isfile')
+    def test_parse_reads_json(self, mock_isfile):
+        mock_isfile.return_value = True
+
+        with patch('builtins.open', mock_open(read_data='{"Id": "A"}')):
+            actual = JsonFileParser.parse('test.json', case_sensitive = False)
+
+        self.assertEqual({'id': 'a'}, actual)
+
+
+class TestMsgpackFileParser(TestCase):
+    def setUp(self):
+        self.msgpack = MagicMock()
+
+    @patch(PARSERS_PATH + '.isfile')
+    def test_parse_reads_msgpack(self, mock_isfile):
+        mock_isfile.return_value = True
+        self.msgpack.unpack.return_value = {'acute': {'terminator': '´'}}
+
+        with patch(PARSERS_PATH + '.msgpack', self.msgpack), \
+                patch('builtins.open', mock_open(read_data=b'')) as open_:
+            actual = MsgpackFileParser.parse('test.msgpack')
+
+        self.assertEqual({'acute': {'terminator': '´'}}, actual)
+        open_.assert_called_once_with('test.msgpack', 'rb')
+        self.msgpack.unpack.assert_called_once_with(
+            open_.return_value, raw=False
+        )
+
+    @patch(PARSERS_PATH + '.isfile')
+    def test_parse_all_reads_every_msgpack_document(self, mock_isfile):
+        mock_isfile.return_value = True
+        self.msgpack.Unpacker.return_value = iter(
+            [{'acute': {}}, None, {'grave': {'map': {'a': 'à'}}}]
+        )
+
+        with patch(PARSERS_PATH + '.msgpack', self.msgpack), \
+                patch('builtins.open', mock_open(read_data=b'')) as open_:
+            actual = list(MsgpackFileParser.parse_all('test.msgpack'))
+
+        self.assertEqual(
+            [{'acute': {}}, {'grave': {'map': {'a': 'à'}}}], actual
+        )
+        self.msgpack.Unpacker.assert_called_once_with(
+            open_.return_value, raw=False
+        )
+
+    @patch(PARSERS_PATH + '.msgpack', None)
+    @patch(PARSERS_PATH + '.isfile')
+    def test_parse_raises_error_without_msgpack(self, mock_isfile):
+        mock_isfile.return_value = True
+
+        with patch('builtins.open', mock_open(read_data=b'')):
+            with self.assertRaises(ParserException):
+                MsgpackFileParser.parse('test.msgpack')
+
+
+class TestFileParserFor(TestCase):
+    def test_parser_is_chosen_by_extension(self):
+        expected = {
+            'states.yaml': YamlFileParser,
+            'states.YML': YamlFileParser,
+            'states.json': JsonFileParser,
+            'states.msgpack': MsgpackFileParser,
+            'states': YamlFileParser,
+        }
+
+        for file_path, parser in expected.items():
+            self.assertIs(parser, file_parser_for(file_path))
+
+
+class TestParseCache(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_paths = [
+            self._write(f'{i}.yaml', f'state_{i}:\n  lower: [a, b]\n')
+            for i in range(3)
+        ]
+
+        self.cache = enable_parse_cache(max_entries=2)
+
+    def tearDown(self):
+        disable_parse_cache()
+
+    def test_repeated_parses_are_hits(self):
+        first = YamlFileParser.parse(self.file_paths[0])
+        second = YamlFileParser.parse(self.file_paths[0])
+
+        self.assertIs(first, second)
+        self.assertEqual(ParseCacheStats(1, 1, 0, 1), self.cache.stats())
+
+    def test_parsed_trees_are_immutable(self):
+        parsed = YamlFileParser.parse(self.file_paths[0])
+
+        self.assertEqual(('a', 'b'), parsed['state_0']['lower'])
+        with self.assertRaises(TypeError):
+            parsed['state_0']['upper'] = 'A,B'
+
+    def test_least_recently_used_entry_is_evicted(self):
+        YamlFileParser.parse(self.file_paths[0])
+        YamlFileParser.parse(self.file_paths[1])
+        YamlFileParser.parse(self.file_paths[0])
+        YamlFileParser.parse(self.file_paths[2])
+        YamlFileParser.parse(self.file_paths[0])
+
+        self.assertEqual(ParseCacheStats(2, 3, 1, 2), self.cache.stats())
+
+    def test_edited_file_is_read_again(self):
+        YamlFileParser.parse(self.file_paths[0])
+        self._write(self.file_paths[0], 'edited: {}\n')
+
+        self.assertEqual(['edited'], list(YamlFileParser.parse(
+            self.file_paths[0]
+        )))
+        self.assertEqual(ParseCacheStats(0, 2, 0, 1), self.cache.stats())
+
+    def test_documents_of_repeated_parse_alls_are_hits(self):
+        self._write(self.file_paths[0], 'a: {}\n---\n---\nb: [c]\n')
+
+        first = list(YamlFileParser.parse_all(self.file_paths[0]))
+        second = list(YamlFileParser.parse_all(self.file_paths[0]))
+
+        self.assertEqual([{'a': {}}, {'b': ('c',)}], first)
+        self.assertIs(first[1], second[1])
+        self.assertEqual(ParseCacheStats(1, 1, 0, 1), self.cache.stats())
+
+    def test_edited_file_is_parsed_all_again(self):
+        list(YamlFileParser.parse_all(self.file_paths[0]))
+        self._write(self.file_paths[0], 'edited: {}\n')
+
+        self.assertEqual([{'edited': {}}], list(YamlFileParser.parse_all(
+            self.file_paths[0]
+        )))
+        self.assertEqual(ParseCacheStats(0, 2, 0, 1), self.cache.stats())
+
+    def test_invalidate(self):
+        YamlFileParser.parse(self.file_paths[0])
+        YamlFileParser.parse(self.file_paths[1])
+
+        self.cache.invalidate(self.file_paths[0])
+        self.assertEqual(1, self.cache.stats().size)
+
+        self.cache.invalidate()
+        self.assertEqual(0, self.cache.stats().size)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,105 @@
+'''
+@author Andrew J. Young
+@description Unit tests for the file state_cache.py
+'''
+
+# Imports from third party packages.
+from os import listdir, stat, utime
+from os.path import abspath, expanduser, isabs
+from stat import S_IMODE
+from unittest import main as unittest_main
+from unittest.mock import MagicMock, patch
+
+# Imports from the local package.
+from symboard.actions import State
+from symboard.state_cache import StateCache
+from settings import STATE_CACHE_DIR
+from test.utils import TemporaryDirectoryTestCase
+
+
+class TestStateCache(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_path = self._write('states.yaml', 'acute: {}\n')
+
+        self.cache = StateCache(self._path('cache'))
+        self.states = {'acute': State(name='acute', terminator='´')}
+        self.build = MagicMock(return_value=self.states)
+
+    def test_first_load_builds_the_file(self):
+        actual = self.cache.get_or_build(self.file_path, self.build)
+
+        self.build.assert_called_once_with(self.file_path)
+        self.assertEqual(self.states, actual)
+
+    def test_unchanged_file_is_loaded_from_the_cache(self):
+        self.cache.get_or_build(self.file_path, self.build)
+        self.build.reset_mock()
+
+        actual = StateCache(self.cache.cache_dir).get_or_build(
+            self.file_path, self.build
+        )
+
+        self.build.assert_not_called()
+        self.assertEqual(self.states, actual)
+
+    def test_touched_but_unchanged_file_is_loaded_from_the_cache(self):
+        self.cache.get_or_build(self.file_path, self.build)
+        self.build.reset_mock()
+
+        utime(self.file_path, ns=(0, 0))
+        self.cache.get_or_build(self.file_path, self.build)
+
+        self.build.assert_not_called()
+
+    def test_edited_file_is_rebuilt(self):
+        self.cache.get_or_build(self.file_path, self.build)
+        self.build.reset_mock()
+
+        self._write(self.file_path, 'grave: {}\nacute: {}\n')
+        self.cache.get_or_build(self.file_path, self.build)
+
+        self.build.assert_called_once_with(self.file_path)
+
+    def test_entries_from_other_versions_are_rebuilt(self):
+        self.cache.get_or_build(self.file_path, self.build)
+        self.build.reset_mock()
+
+        with patch('symboard.state_cache.VERSION', 'other'):
+            self.cache.get_or_build(self.file_path, self.build)
+
+        self.build.assert_called_once_with(self.file_path)
+
+    def test_entries_of_other_formats_are_rebuilt(self):
+        self.cache.get_or_build(self.file_path, self.build)
+        self.build.reset_mock()
+
+        with patch('symboard.state_cache._ENTRY_FORMAT', 1):
+            self.cache.get_or_build(self.file_path, self.build)
+
+        self.build.assert_called_once_with(self.file_path)
+
+    def test_cache_dir_is_private(self):
+        self.cache.get_or_build(self.file_path, self.build)
+
+        self.assertEqual(0o700, S_IMODE(stat(self.cache.cache_dir).st_mode))
+        self.assertEqual(1, len(listdir(self.cache.cache_dir)))
+
+    def test_default_cache_dir_is_per_user(self):
+        self.assertTrue(isabs(STATE_CACHE_DIR))
+        self.assertFalse(STATE_CACHE_DIR.startswith(abspath('.')))
+
+    def test_tests_do_not_cache_in_the_home_directory(self):
+        self.assertFalse(STATE_CACHE_DIR.startswith(expanduser('~')))
+
+    def test_no_cache_dir_always_builds(self):
+        cache = StateCache(cache_dir=None)
+
+        cache.get_or_build(self.file_path, self.build)
+        cache.get_or_build(self.file_path, self.build)
+
+        self.assertEqual(2, self.build.call_count)
+
+
+if __name__ == '__main__':
+    unittest_main()
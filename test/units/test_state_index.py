@@ -0,0 +1,159 @@
+'''
+@author Andrew J. Young
+@description Unit tests for the file state_index.py
+'''
+
+# Imports from third party packages.
+from gc import collect
+from json import load
+from os import listdir
+from os.path import dirname, isfile, join
+from unittest import main as unittest_main
+from unittest.mock import patch
+from weakref import WeakSet
+
+# Imports from the local package.
+from symboard.parsers import YamlFileParser
+from symboard.state_index import (
+    StateIndex, StateIndexEntry, content_hash, write_atomically
+)
+from test.utils import TemporaryDirectoryTestCase
+
+
+class TestStateIndex(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.states_dir = self._path('states')
+        self.index_path = self._path('cache', 'index.json')
+
+        self._write(
+            join('states', 'a.yaml'),
+            'acute:\n  terminator: x\ngrave:\n  map: {}\n',
+        )
+        self._write(
+            join('states', 'b.yaml'), 'breve:\n  terminator: y\nacute: {}\n'
+        )
+
+    def _index(self):
+        return StateIndex(self.states_dir, self.index_path)
+
+    def test_get_returns_file_hash_and_position(self):
+        a_path = join(self.states_dir, 'a.yaml')
+        b_path = join(self.states_dir, 'b.yaml')
+        index = self._index()
+
+        self.assertEqual(
+            StateIndexEntry(a_path, content_hash(a_path), 1),
+            index.get('grave'),
+        )
+        self.assertEqual(
+            StateIndexEntry(b_path, content_hash(b_path), 0),
+            index.get('breve'),
+        )
+        self.assertIsNone(index.get('unknown'))
+
+    def test_first_file_wins_for_duplicate_names(self):
+        self.assertEqual(
+            join(self.states_dir, 'a.yaml'), self._index().get('acute').file_path
+        )
+
+    def test_manifest_is_persisted_and_reused(self):
+        self._index().refresh()
+        self.assertTrue(isfile(self.index_path))
+
+        with patch(
+            'symboard.parsers.YamlFileParser.parse_all',
+            wraps=YamlFileParser.parse_all,
+        ) as parse:
+            self.assertEqual(0, self._index().get('breve').position)
+
+        parse.assert_not_called()
+
+    def test_refresh_only_parses_changed_files(self):
+        index = self._index()
+        index.refresh()
+
+        self._write(join('states', 'b.yaml'), 'cedilla: {}\nbreve: {}\n')
+
+        with patch(
+            'symboard.parsers.YamlFileParser.parse_all',
+            wraps=YamlFileParser.parse_all,
+        ) as parse:
+            index.refresh()
+
+        parse.assert_called_once_with(join(self.states_dir, 'b.yaml'))
+        self.assertEqual(1, index.get('breve').position)
+        self.assertEqual(0, index.get('cedilla').position)
+
+    def test_unreadable_manifest_is_rebuilt(self):
+        self._write(self.index_path, 'not json')
+
+        self.assertEqual(
+            ['acute', 'grave', 'breve'], self._index().names()
+        )
+
+    def test_manifest_only_records_files(self):
+        self._index().refresh()
+
+        with open(self.index_path) as file_:
+            self.assertEqual(
+                ['files', 'format', 'states_dir'], sorted(load(file_))
+            )
+
+    def test_refresh_holds_one_document_at_a_time(self):
+        class Document(dict):
+            __hash__ = object.__hash__
+
+        alive = WeakSet()
+        most_alive = []
+
+        def parse_all(file_path):
+            for name in ['acute', 'grave', 'breve']:
+                collect()
+                most_alive.append(len(alive))
+                document = Document({name: {}})
+                alive.add(document)
+                yield document
+
+        index = self._index()
+        with patch(
+            'symboard.parsers.YamlFileParser.parse_all', side_effect=parse_all
+        ):
+            index.refresh()
+        collect()
+
+        self.assertEqual(['acute', 'grave', 'breve'], index.names())
+        self.assertLessEqual(max(most_alive), 1)
+        self.assertEqual(0, len(alive))
+
+
+class TestWriteAtomically(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = self._path('cache', 'file.txt')
+
+    def test_file_is_replaced(self):
+        write_atomically(self.path, lambda file_: file_.write('a'))
+        write_atomically(self.path, lambda file_: file_.write('b'))
+
+        with open(self.path) as file_:
+            self.assertEqual('b', file_.read())
+        self.assertEqual(['file.txt'], listdir(dirname(self.path)))
+
+    def test_failed_writes_leave_the_file_unchanged(self):
+        write_atomically(self.path, lambda file_: file_.write('a'))
+
+        def fail(file_):
+            file_.write('b')
+            raise OSError
+
+        with self.assertRaises(OSError):
+            write_atomically(self.path, fail)
+
+        with open(self.path) as file_:
+            self.assertEqual('a', file_.read())
+        self.assertEqual(['file.txt'], listdir(dirname(self.path)))
+
+
+if __name__ == '__main__':
+    unittest_main()
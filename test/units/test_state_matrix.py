@@ -0,0 +1,104 @@
+'''
+@author Andrew J. Young
+@description Unit tests for the file state_matrix.py
+'''
+
+# Imports from third party packages.
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from symboard.actions import State
+from symboard.state_matrix import StateMatrix, StringPool
+
+
+class TestStringPool(TestCase):
+    def test_strings_are_stored_once(self):
+        pool = StringPool()
+
+        self.assertEqual(0, pool.add('a'))
+        self.assertEqual(1, pool.add('b'))
+        self.assertEqual(0, pool.add('a'))
+        self.assertEqual(['a', 'b'], pool.strings)
+        self.assertEqual('b', pool[1])
+        self.assertIsNone(pool.id_of('c'))
+
+
+class TestStateMatrix(TestCase):
+    def setUp(self):
+        self.matrix = StateMatrix.from_states([
+            State(
+                name='first', terminator='1',
+                action_to_output_map={'a': 'x', 'b': ''},
+            ),
+            State(name='empty', terminator='2'),
+            State(
+                name='second', terminator='3',
+                action_to_output_map={'b': 'y', 'a': ''},
+            ),
+        ])
+
+    def test_bindings_are_grouped_by_action_in_state_order(self):
+        self.assertEqual(
+            [('first', 'x'), ('second', '')],
+            list(self.matrix.bindings_for_action('a')),
+        )
+        self.assertEqual(
+            [('first', ''), ('second', 'y')],
+            list(self.matrix.bindings_for_action('b')),
+        )
+        self.assertEqual([], list(self.matrix.bindings_for_action('c')))
+
+    def test_outputs_are_interned(self):
+        self.assertEqual(4, len(self.matrix))
+        self.assertEqual(['x', '', 'y'], self.matrix.outputs.strings)
+
+    def test_output(self):
+        self.assertEqual('y', self.matrix.output('second', 'b'))
+        self.assertIsNone(self.matrix.output('empty', 'b'))
+
+    def test_terminators_are_kept_by_state(self):
+        self.assertEqual(['1', '2', '3'], self.matrix.terminators)
+
+    def test_next_states_override_outputs(self):
+        matrix = StateMatrix.from_states([
+            State(
+                name='acute', action_to_output_map={'a': 'á', '.': '´'},
+                action_to_next_map={'.': 'acute_dot'},
+            ),
+            State(name='acute_dot', action_to_output_map={'.': '.'}),
+        ])
+
+        self.assertEqual(
+            [('acute', 'next', 'acute_dot'), ('acute_dot', 'output', '.')],
+            list(matrix.transitions_for_action('.')),
+        )
+        self.assertEqual('acute_dot', matrix.next_state('acute', '.'))
+        self.assertIsNone(matrix.output('acute', '.'))
+        self.assertEqual([('acute_dot', '.')], list(
+            matrix.bindings_for_action('.')
+        ))
+
+    def test_repeated_states_are_only_used_once(self):
+        matrix = StateMatrix.from_states([
+            State(name='first', terminator='1').with_map({'a': 'x'}),
+            State(name='first', terminator='2').with_map({'a': 'z'}),
+            State(name='second', terminator='3').with_map({'a': 'y'}),
+        ])
+
+        self.assertEqual(['first', 'second'], matrix.states.strings)
+        self.assertEqual(['1', '3'], matrix.terminators)
+        self.assertEqual(
+            [('first', 'x'), ('second', 'y')],
+            list(matrix.bindings_for_action('a')),
+        )
+
+    def test_no_states(self):
+        matrix = StateMatrix.from_states(None)
+
+        self.assertEqual(0, len(matrix))
+        self.assertEqual([], list(matrix.bindings_for_action('a')))
+
+
+if __name__ == '__main__':
+    unittest_main()
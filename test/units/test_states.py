@@ -7,10 +7,21 @@
 from unittest import main as unittest_main
 from unittest import TestCase
 from unittest.mock import mock_open, patch
+from os import walk
 
 # Imports from this package.
-from symboard.states import load_yaml
+from symboard.states import (
+    compose_states, iter_states, load_yaml, load_states_parallel,
+    StateLibrary, StateRegistry,
+)
+from symboard.errors import (
+    DuplicateStateException, ParserException, StateCompositionException
+)
 from symboard.actions import State
+from symboard.parsers import YamlFileParser
+from symboard.state_cache import StateCache
+from symboard.state_index import StateIndex
+from test.utils import TemporaryDirectoryTestCase
 
 
 class TestStates(TestCase):
@@ -80,7 +91,7 @@ class TestStates(TestCase):
                 name=self.state_name,
                 terminator=self.terminator
             ).with_map(
-                {"&#x0027;": apostrophe_output}
+                {"\u0027": apostrophe_output}
             )
         }
 
@@ -91,6 +102,274 @@ class TestStates(TestCase):
         pass
 
 
+class TestIterStates(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_path = self._path('bundle.yaml')
+
+    def test_states_are_read_from_every_document(self):
+        self._write(
+            self.file_path, 'acute:\n  terminator: x\n---\n---\ngrave: {}\n'
+        )
+
+        self.assertEqual(
+            [State(name='acute', terminator='x'), State(name='grave')],
+            list(iter_states(self.file_path)),
+        )
+
+    def test_states_are_yielded_before_later_documents_are_parsed(self):
+        self._write(self.file_path, 'acute: {}\n---\n[not: a, mapping\n')
+
+        states = iter_states(self.file_path)
+
+        self.assertEqual('acute', next(states).name)
+        with self.assertRaises(ParserException):
+            next(states)
+
+
+class TestStateRegistry(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.files = {
+            'first.yaml': 'first:\n  terminator: "1"\n  map:\n    a: b\n',
+            'second.yaml': 'second:\n  terminator: "2"\n',
+        }
+        for file_name, contents in self.files.items():
+            self._write(file_name, contents)
+
+        self.registry = StateRegistry(
+            self.temp_dir.name,
+            index=StateIndex(self.temp_dir.name, index_path=None),
+            cache=StateCache(cache_dir=None),
+        )
+
+    def test_nothing_is_loaded_on_init(self):
+        with patch('symboard.parsers.YamlFileParser.parse_all') as parse:
+            StateRegistry(self.temp_dir.name)
+
+        parse.assert_not_called()
+
+    def test_getitem_returns_built_state(self):
+        expected = State(name='first', terminator='1').with_map({'a': 'b'})
+
+        self.assertEqual(expected, self.registry['first'])
+
+    def test_getitem_only_loads_the_file_defining_the_state(self):
+        # Build the index before counting the files read.
+        self.registry.index.refresh()
+
+        with patch(
+            'symboard.parsers.YamlFileParser.parse_all',
+            wraps=YamlFileParser.parse_all,
+        ) as parse:
+            self.registry['second']
+            self.registry['second']
+
+        parse.assert_called_once_with(self._path('second.yaml'))
+
+    def test_files_changed_after_indexing_are_parsed_again(self):
+        self.registry.index.refresh()
+        self._write('second.yaml', 'second:\n  terminator: "3"\n')
+
+        self.assertEqual('3', self.registry['second'].terminator)
+
+    def test_getitem_raises_key_error_for_unknown_state(self):
+        with self.assertRaises(KeyError):
+            self.registry['unknown']
+
+    def test_iteration_loads_all_states(self):
+        self.assertEqual({'first', 'second'}, set(self.registry))
+        self.assertEqual(2, len(self.registry))
+
+    def test_getitem_composes_states_from_other_files(self):
+        self._write(
+            'third.yaml', 'third:\n  extends: first\n  include: second\n'
+        )
+
+        third = self.registry['third']
+
+        self.assertEqual(
+            State(name='third', terminator='1').with_map({'a': 'b'}), third
+        )
+        self.assertIs(third, self.registry['third'])
+
+    def test_resolve_keeps_order(self):
+        actual = [state.name for state in self.registry.resolve(
+            ['second', 'first']
+        )]
+
+        self.assertEqual(['second', 'first'], actual)
+
+
+class TestComposeStates(TestCase):
+    def setUp(self):
+        self.states = {
+            'above': State.from_attributes('above', {
+                'terminator': '^', 'map': {'a': 'â', 'e': 'ê'},
+            }),
+            'below': State.from_attributes('below', {
+                'extends': 'above', 'map': {'a': 'ḁ'},
+            }),
+            'bar': State.from_attributes('bar', {'map': {'b': 'ƀ'}}),
+            'union': State.from_attributes('union', {
+                'terminator': '+', 'include': ['above', 'bar'],
+            }),
+        }
+
+    def test_extended_states_are_overridden(self):
+        below = compose_states(self.states)['below']
+
+        self.assertEqual('^', below.terminator)
+        self.assertEqual({'a': 'ḁ', 'e': 'ê'}, below.action_to_output_map)
+        self.assertIsNone(below.extends)
+
+    def test_included_states_are_combined(self):
+        union = compose_states(self.states)['union']
+
+        self.assertEqual('+', union.terminator)
+        self.assertEqual(
+            {'a': 'â', 'e': 'ê', 'b': 'ƀ'}, union.action_to_output_map
+        )
+
+    def test_states_which_are_not_composed_are_unchanged(self):
+        self.assertIs(self.states['bar'], compose_states(self.states)['bar'])
+
+    def test_unknown_base_raises_exception(self):
+        self.states['broken'] = State(name='broken', extends='unknown')
+
+        with self.assertRaises(StateCompositionException):
+            compose_states(self.states)
+
+    def test_cycle_raises_exception(self):
+        self.states['above'] = State(name='above', includes=['below'])
+
+        with self.assertRaises(StateCompositionException):
+            compose_states(self.states)
+
+
+class TestStateLibrary(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self._write('a.yaml', 'acute:\n  terminator: "1"\n')
+        self._write('b.yaml', 'breve: {}\nbreve_below:\n  extends: acute\n')
+
+        self.library = StateLibrary(
+            self.temp_dir.name,
+            index=StateIndex(self.temp_dir.name, index_path=None),
+            cache=StateCache(cache_dir=None),
+        )
+
+    def test_first_snapshot_loads_every_state(self):
+        snapshot = self.library.snapshot()
+
+        self.assertEqual(1, snapshot.version)
+        self.assertEqual({'acute', 'breve', 'breve_below'}, set(snapshot))
+        self.assertEqual('1', self.library['breve_below'].terminator)
+
+    def test_reload_without_changes_keeps_the_snapshot(self):
+        snapshot = self.library.snapshot()
+
+        self.assertIs(snapshot, self.library.reload())
+
+    def test_reload_swaps_in_a_new_snapshot(self):
+        old_snapshot = self.library.snapshot()
+
+        self._write('a.yaml', 'acute:\n  terminator: "22"\n')
+        with patch(
+            'symboard.parsers.YamlFileParser.parse_all',
+            wraps=YamlFileParser.parse_all,
+        ) as parse:
+            new_snapshot = self.library.reload()
+
+        self.assertEqual(2, new_snapshot.version)
+        self.assertEqual('22', new_snapshot['breve_below'].terminator)
+        # The old snapshot is unchanged, for compiles which still hold it.
+        self.assertEqual('1', old_snapshot['breve_below'].terminator)
+        # Unchanged files are not read, and their states are reused.
+        self.assertNotIn(
+            self._path('b.yaml'),
+            [call.args[0] for call in parse.call_args_list],
+        )
+        self.assertIs(old_snapshot['breve'], new_snapshot['breve'])
+
+    def test_unchanged_composed_states_are_reused(self):
+        old_snapshot = self.library.snapshot()
+
+        self._write('a.yaml', 'acute:\n  terminator: "1"\ngrave: {}\n')
+        new_snapshot = self.library.reload()
+
+        self.assertIs(
+            old_snapshot['breve_below'], new_snapshot['breve_below']
+        )
+        self.assertIn('grave', new_snapshot)
+
+
+class TestLoadStatesParallel(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.files = {
+            'a.yaml': 'acute:\n  terminator: "1"\n  map:\n    a: b\n',
+            'b.yaml': 'acute:\n  terminator: "2"\nbreve: {}\n',
+            'c.yaml': 'cedilla:\n  map:\n    c: ç\n',
+        }
+        for file_name, contents in self.files.items():
+            self._write(file_name, contents)
+
+    def _load(self, **kwargs):
+        return load_states_parallel(
+            self.temp_dir.name, cache_dir=None, **kwargs
+        )
+
+    def test_parallel_and_serial_loads_are_equal(self):
+        self.assertEqual(self._load(processes=1), self._load(processes=2))
+
+    def test_states_are_built_with_attribute_precedence(self):
+        expected = State(name='cedilla').with_map({'c': 'ç'})
+
+        self.assertEqual(expected, self._load(processes=2)['cedilla'])
+
+    def test_first_file_wins_for_duplicates(self):
+        with self.assertLogs(level='WARNING') as logs:
+            states = self._load(processes=2)
+
+        self.assertEqual('1', states['acute'].terminator)
+        self.assertEqual(1, len(logs.output))
+        self.assertIn('acute', logs.output[0])
+
+    def test_every_loader_takes_duplicates_from_the_first_file(self):
+        registry = StateRegistry(
+            self.temp_dir.name,
+            index=StateIndex(self.temp_dir.name, index_path=None),
+            cache=StateCache(cache_dir=None),
+        )
+        # Whatever order the file system lists the files in.
+        def reversed_walk(top):
+            for root, dir_names, file_names in walk(top):
+                yield root, dir_names, sorted(file_names, reverse=True)
+
+        with patch('symboard.states.STATES_DIR', self.temp_dir.name), \
+                patch('symboard.state_index.walk', reversed_walk), \
+                self.assertLogs(level='WARNING'):
+            loaded = [load_yaml(), self._load(processes=2)]
+
+        for states in [*loaded, registry]:
+            self.assertEqual('1', states['acute'].terminator)
+        self.assertEqual(loaded[0], loaded[1])
+        self.assertEqual(loaded[0], dict(registry))
+
+    def test_strict_raises_for_duplicates(self):
+        with self.assertRaises(DuplicateStateException) as context:
+            self._load(processes=2, strict=True)
+
+        self.assertEqual(
+            {'acute': [
+                self._path('a.yaml'),
+                self._path('b.yaml'),
+            ]},
+            context.exception.duplicates,
+        )
+
+
 if __name__ == '__main__':
     unittest_main
 
@@ -0,0 +1,124 @@
+'''
+@author Andrew J. Young
+@description Unit tests for the file symbol_index.py
+'''
+
+# Imports from third party packages.
+from os.path import isfile, join
+from unittest import TestCase
+from unittest import main as unittest_main
+from unittest.mock import patch
+
+# Imports from the local package.
+from symboard.parsers import YamlFileParser
+from symboard.state_cache import StateCache
+from symboard.state_index import StateIndex
+from symboard.symbol_index import SymbolIndex, SymbolIndexEntry, graphemes
+from test.utils import TemporaryDirectoryTestCase
+
+
+class TestSymbolIndex(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.index_path = self._path('symbol_index.json')
+        self.states_dir = self._path('states')
+
+        self._write(
+            join('states', 'a.yaml'),
+            'umlaut:\n  terminator: ¨\n  map:\n    u: ǘ\n',
+        )
+        self._write(join('states', 'b.yaml'), 'breve:\n  map:\n    b: x\n')
+        self._write(
+            join('states', 'c.yaml'),
+            'umlaut_too:\n  extends: umlaut\n',
+        )
+
+    def _index(self):
+        return SymbolIndex(
+            self.states_dir,
+            index_path=self.index_path,
+            state_index=StateIndex(self.states_dir, index_path=None),
+            cache=StateCache(cache_dir=None),
+        )
+
+    def test_search_finds_every_state_producing_an_output(self):
+        self.assertEqual([
+            SymbolIndexEntry('umlaut', 'u', '¨'),
+            SymbolIndexEntry('umlaut_too', 'u', '¨'),
+        ], self._index().search('ǘ'))
+        self.assertEqual([], self._index().search('y'))
+
+    def test_search_is_normalized(self):
+        decomposed = 'u\u0308\u0301'
+
+        self.assertEqual(2, len(self._index().search(decomposed)))
+
+    def test_unchanged_files_are_not_indexed_again(self):
+        self._index().refresh()
+        self.assertTrue(isfile(self.index_path))
+
+        with patch(
+            'symboard.parsers.YamlFileParser.parse_all',
+            wraps=YamlFileParser.parse_all,
+        ) as parse:
+            self.assertEqual(2, len(self._index().search('ǘ')))
+
+        # Only the state index reads the files, to find their states.
+        self.assertEqual(3, parse.call_count)
+
+    def test_changing_a_base_indexes_its_dependents_again(self):
+        index = self._index()
+        index.refresh()
+
+        self._write(
+            join('states', 'a.yaml'),
+            'umlaut:\n  terminator: ¨\n  map:\n    v: ǘ\n',
+        )
+        index.refresh()
+
+        self.assertEqual(
+            ['v', 'v'], [entry.action for entry in index.search('ǘ')]
+        )
+
+    def test_a_base_moving_to_another_file_indexes_its_dependents_again(self):
+        index = self._index()
+        index.refresh()
+
+        # The first file now defines umlaut, instead of a.yaml.
+        self._write(join('states', '0.yaml'), 'umlaut:\n  map:\n    w: ǘ\n')
+        index.refresh()
+
+        self.assertEqual(
+            ['w', 'w'], [entry.action for entry in index.search('ǘ')]
+        )
+
+    def test_each_grapheme_of_an_output_is_searchable(self):
+        self._write(
+            join('states', 'd.yaml'),
+            'ligature:\n  map:\n    a: a\u0301e\n',
+        )
+
+        self.assertEqual(
+            [SymbolIndexEntry('ligature', 'a', ' ')],
+            self._index().search('e'),
+        )
+        self.assertEqual(1, len(self._index().search('\u00e1e')))
+        self.assertEqual(1, len(self._index().search('a\u0301')))
+        self.assertEqual([], self._index().search('a'))
+
+
+class TestGraphemes(TestCase):
+    def test_combining_marks_stay_with_their_character(self):
+        self.assertEqual(['u\u0308\u0301', 'e'], graphemes('u\u0308\u0301e'))
+
+    def test_joined_emoji_are_one_grapheme(self):
+        family = '\U0001F468\u200d\U0001F469\u200d\U0001F467'
+
+        self.assertEqual([family, 'a'], graphemes(family + 'a'))
+        self.assertEqual(
+            ['\U0001F44D\U0001F3FD'], graphemes('\U0001F44D\U0001F3FD')
+        )
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -3,7 +3,52 @@
 @description: Objects which are useful for running tests.
 '''
 
+# Imports from third party packages.
+from os import makedirs
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
 
 FILE_WRITERS_PATH = 'symboard.file_writers'
 PARSERS_PATH = 'symboard.parsers'
 RES_DIR = 'test/integration/res/'
+
+
+class TemporaryDirectoryTestCase(TestCase):
+    """
+    A test case which gives every test its own empty directory, <temp_dir>,
+    which is removed once the test has finished.
+    """
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _path(self, *parts: str) -> str:
+        """
+        Args:
+            parts (str): The parts of the path, relative to <temp_dir>.
+
+        Returns:
+            str: The joined path.
+        """
+        return join(self.temp_dir.name, *parts)
+
+    def _write(self, file_path: str, contents: str) -> str:
+        """
+        Writes a file, creating any directories it is in.
+
+        Args:
+            file_path (str): The path of the file, either absolute or
+                relative to <temp_dir>.
+            contents (str): What to write to the file.
+
+        Returns:
+            str: The absolute path of the written file.
+        """
+        path = self._path(file_path)
+        makedirs(dirname(path), exist_ok=True)
+        with open(path, 'w') as file_:
+            file_.write(contents)
+        return path